@@ -1722,6 +1722,8 @@ class bribe_judge_button(button):
             0
         )  # costs as much as 1st piece of fabricated evidence
 
+    showing_dependencies = ["game_mode", "interface", "flags"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
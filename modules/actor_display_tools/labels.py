@@ -906,6 +906,7 @@ class actor_display_label(label):
             None
         """
         self.actor = new_actor
+        status.visibility_tracker.invalidate("displayed")
         if new_actor != "none":
             if self.actor_label_type == "name":
                 self.set_label(self.message_start + utility.capitalize(new_actor.name))
@@ -1294,6 +1295,8 @@ class actor_display_label(label):
         else:
             self.set_label(self.message_start + "n/a")
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -1432,6 +1435,8 @@ class list_item_label(actor_display_label):
         self.attached_list = []
         super().calibrate(new_actor)
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -1551,6 +1556,8 @@ class building_work_crews_label(actor_display_label):
                 )
                 self.show_label = True
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -1614,6 +1621,8 @@ class building_efficiency_label(actor_display_label):
                 self.set_label("Efficiency: " + str(self.attached_building.efficiency))
                 self.show_label = True
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -1636,6 +1645,8 @@ class native_info_label(
     Label that shows the population, aggressiveness, or number of available workers in a displayed tile's village
     """
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -1680,6 +1691,8 @@ class terrain_feature_label(actor_display_label):
         input_dict["actor_label_type"] = "terrain feature"
         super().__init__(input_dict)
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
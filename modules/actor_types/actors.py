@@ -2,7 +2,14 @@
 
 import pygame
 import random
-from ..util import text_utility, utility, actor_utility, scaling, market_utility
+from ..util import (
+    text_utility,
+    utility,
+    actor_utility,
+    scaling,
+    market_utility,
+    drawing_utility,
+)
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -234,6 +241,7 @@ class actor:
         self.inventory[commodity] = new_value
         if new_value <= 0:
             del self.inventory[commodity]
+        status.visibility_tracker.invalidate("displayed")
 
     def get_held_commodities(self, ignore_consumer_goods=False):
         """
@@ -567,25 +575,22 @@ class actor:
         tooltip_image.tooltip_outline.y = (
             tooltip_image.tooltip_box.y - tooltip_image.tooltip_outline_width
         )
-        pygame.draw.rect(
-            constants.game_display,
+        drawing_utility.draw_rect(
             constants.color_dict["black"],
             tooltip_image.tooltip_outline,
         )
-        pygame.draw.rect(
-            constants.game_display,
+        drawing_utility.draw_rect(
             constants.color_dict["white"],
             tooltip_image.tooltip_box,
         )
         for text_line_index in range(len(tooltip_image.tooltip_text)):
             text_line = tooltip_image.tooltip_text[text_line_index]
-            constants.game_display.blit(
-                text_utility.text(text_line, constants.myfont),
-                (
-                    tooltip_image.tooltip_box.x + scaling.scale_width(10),
-                    tooltip_image.tooltip_box.y
-                    + (text_line_index * constants.fonts["default"].size),
-                ),
+            drawing_utility.display_text(
+                text_line,
+                constants.myfont,
+                tooltip_image.tooltip_box.x + scaling.scale_width(10),
+                tooltip_image.tooltip_box.y
+                + text_line_index * constants.fonts["default"].size,
             )
 
     def get_image_id_list(self, override_values={}):
@@ -41,6 +41,7 @@ class building(actor):
         self.image_dict = {"default": input_dict["image"]}
         self.cell = self.grids[0].find_cell(self.x, self.y)
         status.building_list.append(self)
+        status.target_distance_field.invalidate()
         self.set_name(input_dict["name"])
         self.contained_work_crews = []
         if from_save:
@@ -54,6 +55,7 @@ class building(actor):
         if (not from_save) and self.can_damage():
             self.set_damaged(False, True)
         self.cell.contained_buildings[self.building_type] = self
+        status.movement_cost_table.invalidate_cell(self.cell)
         self.cell.tile.update_image_bundle()
 
         if (
@@ -121,8 +123,10 @@ class building(actor):
             None
         """
         self.cell.contained_buildings[self.building_type] = "none"
+        status.movement_cost_table.invalidate_cell(self.cell)
         super().remove()
         status.building_list = utility.remove_from_list(status.building_list, self)
+        status.target_distance_field.remove_target(self)
 
     def update_tooltip(self):  # should be shown below mob tooltips
         """
@@ -279,6 +283,7 @@ class building(actor):
         ]:
             self.cell.get_building("warehouses").set_damaged(new_value)
         self.cell.tile.update_image_bundle()
+        status.target_distance_field.update_target(self)
 
     def set_default_inventory_capacity(self, new_value):
         """
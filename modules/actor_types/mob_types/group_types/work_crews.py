@@ -55,6 +55,7 @@ class work_crew(group):
         """
         self.in_building = True
         self.building = building
+        status.target_distance_field.update_target(self)
         self.hide_images()
         self.remove_from_turn_queue()
         building.contained_work_crews.append(self)
@@ -77,6 +78,7 @@ class work_crew(group):
         """
         self.in_building = False
         self.building = "none"
+        status.target_distance_field.update_target(self)
         self.show_images()
         self.add_to_turn_queue()
         building.contained_work_crews = utility.remove_from_list(
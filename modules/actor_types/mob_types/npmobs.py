@@ -93,48 +93,16 @@ class npmob(mob):
     def find_closest_target(self):
         """
         Description:
-            Find and returns one of the closest reachable pmobs or buildings
+            Find and returns one of the closest reachable pmobs or buildings, using the target distance field to only check the cells at the distance of the
+                closest targets
         Input:
             None
         Output:
             string/actor: Returns one of the closest reachable pmobs or buildings, or returns 'none' if none are reachable
         """
-        target_list = []
-        for current_building in status.building_list:
-            if current_building.can_damage() and not current_building.damaged:
-                target_list.append(current_building)
-        target_list += status.pmob_list
-        min_distance = -1
-        closest_targets = ["none"]
-        for possible_target in target_list:
-            if (
-                not possible_target.y == 0
-            ):  # ignore units in the ocean if can't swim in ocean
-                if possible_target.actor_type == "building" or not (
-                    possible_target.in_vehicle
-                    or possible_target.in_group
-                    or possible_target.in_building
-                ):
-                    distance = utility.find_grid_distance(self, possible_target)
-                    if (
-                        distance <= self.aggro_distance
-                    ):  # will ignore player's units more than 6 tiles away
-                        if min_distance == -1 and (
-                            not distance == -1
-                        ):  # automatically choose first one to replace initial value
-                            min_distance = distance
-                            closest_targets = [possible_target]
-                        else:
-                            if not distance == -1:  # if on same grid
-                                if (
-                                    distance < min_distance
-                                ):  # if closer than any previous, replace all previous
-                                    min_distance = distance
-                                    closest_targets = [possible_target]
-                                elif (
-                                    distance == min_distance
-                                ):  # if as close as previous, add as alternative to previous
-                                    closest_targets.append(possible_target)
+        closest_targets = status.target_distance_field.get_closest_targets(self)
+        if not closest_targets:
+            closest_targets = ["none"]
         return random.choice(
             closest_targets
         )  # return one of the closest ones, or 'none' if none were found
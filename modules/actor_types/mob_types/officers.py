@@ -143,6 +143,7 @@ class officer(pmob):
             None
         """
         self.in_group = True
+        status.target_distance_field.update_target(self)
         self.hide_images()
         self.remove_from_turn_queue()
 
@@ -160,6 +161,7 @@ class officer(pmob):
         self.y = group.y
         self.show_images()
         self.go_to_grid(self.images[0].current_cell.grid, (self.x, self.y))
+        status.target_distance_field.update_target(self)
         self.select()
         if self.movement_points > 0:
             self.add_to_turn_queue()
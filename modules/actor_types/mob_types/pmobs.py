@@ -4,6 +4,7 @@ import pygame
 import random
 from ..mobs import mob
 from ...util import (
+    drawing_utility,
     text_utility,
     utility,
     actor_utility,
@@ -52,6 +53,7 @@ class pmob(mob):
         super().__init__(from_save, input_dict)
         self.selection_outline_color = "bright green"
         status.pmob_list.append(self)
+        status.target_distance_field.invalidate()
         self.is_pmob = True
         self.set_controlling_minister_type("none")
         self.equipment = {}
@@ -631,6 +633,7 @@ class pmob(mob):
         self.remove_from_turn_queue()
         super().remove()
         status.pmob_list = utility.remove_from_list(status.pmob_list, self)
+        status.target_distance_field.remove_target(self)
 
     def draw_outline(self):
         """
@@ -648,8 +651,7 @@ class pmob(mob):
                     and self == current_image.current_cell.contained_mobs[0]
                     and current_image.current_cell.grid.showing
                 ):  # only draw outline if on top of stack
-                    pygame.draw.rect(
-                        constants.game_display,
+                    drawing_utility.draw_rect(
                         constants.color_dict[self.selection_outline_color],
                         (current_image.outline),
                         current_image.outline_width,
@@ -990,6 +992,7 @@ class pmob(mob):
         """
         self.in_vehicle = True
         self.vehicle = vehicle
+        status.target_distance_field.update_target(self)
         for current_commodity in self.get_held_commodities():  # gives inventory to ship
             num_held = self.get_inventory(current_commodity)
             for current_commodity_unit in range(num_held):
@@ -1031,6 +1034,7 @@ class pmob(mob):
         self.in_vehicle = False
         self.x = vehicle.x
         self.y = vehicle.y
+        status.target_distance_field.update_target(self)
         for current_image in self.images:
             current_image.add_to_cell()
         if (
@@ -425,6 +425,7 @@ class vehicle(pmob):
         ]:  # make list of all mobs in vehicle
             current_mob.go_to_grid(new_grid, new_coordinates)
             current_mob.in_vehicle = True
+            status.target_distance_field.update_target(current_mob)
             current_mob.hide_images()
         if new_grid == status.europe_grid or self.images[
             0
@@ -216,6 +216,7 @@ class worker(pmob):
             None
         """
         self.in_vehicle = True
+        status.target_distance_field.update_target(self)
         self.hide_images()
         vehicle.set_crew(self)
         moved_mob = vehicle
@@ -248,6 +249,7 @@ class worker(pmob):
         self.in_vehicle = False
         self.x = vehicle.x
         self.y = vehicle.y
+        status.target_distance_field.update_target(self)
         self.show_images()
         if self.images[0].current_cell.get_intact_building("port") == "none":
             self.set_disorganized(True)
@@ -273,6 +275,7 @@ class worker(pmob):
             None
         """
         self.in_group = True
+        status.target_distance_field.update_target(self)
         self.hide_images()
         self.remove_from_turn_queue()
 
@@ -291,6 +294,7 @@ class worker(pmob):
         self.show_images()
         self.disorganized = group.disorganized
         self.go_to_grid(self.images[0].current_cell.grid, (self.x, self.y))
+        status.target_distance_field.update_target(self)
         if self.movement_points > 0:
             self.add_to_turn_queue()
         self.update_image_bundle()
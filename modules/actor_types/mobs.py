@@ -2,7 +2,13 @@
 
 import pygame, random
 from ..constructs import images
-from ..util import utility, actor_utility, main_loop_utility, text_utility
+from ..util import (
+    utility,
+    actor_utility,
+    main_loop_utility,
+    text_utility,
+    drawing_utility,
+)
 from .actors import actor
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -337,14 +343,14 @@ class mob(actor):
     def get_movement_cost(self, x_change, y_change):
         """
         Description:
-            Returns the cost in movement points of moving by the inputted amounts. Only works when one inputted amount is 0 and the other is 1 or -1, with 0 and -1 representing moving 1 cell downward
+            Returns the cost in movement points of moving by the inputted amounts. Only works when one inputted amount is 0 and the other is 1 or -1, with 0 and -1 representing moving 1 cell downward.
+                The cost is recorded by the cell moved from for this mob's movement profile, and is found by the movement cost table if not yet recorded
         Input:
             int x_change: How many cells would be moved to the right in the hypothetical movement
             int y_change: How many cells would be moved upward in the hypothetical movement
         Output:
             double: How many movement points would be spent by moving by the inputted amount
         """
-        cost = self.movement_cost
         if not (self.is_npmob and not self.visible()):
             local_cell = self.images[0].current_cell
         else:
@@ -360,47 +366,23 @@ class mob(actor):
         elif y_change < 0:
             direction = "down"
 
-        if direction == "none":
-            adjacent_cell = local_cell
-        else:
-            adjacent_cell = local_cell.adjacent_cells[direction]
-
-        if adjacent_cell:
-            cost = cost * constants.terrain_movement_cost_dict[adjacent_cell.terrain]
-            if self.is_pmob:
-                local_infrastructure = local_cell.get_intact_building("infrastructure")
-                adjacent_infrastructure = adjacent_cell.get_intact_building(
-                    "infrastructure"
-                )
-                if local_cell.has_walking_connection(adjacent_cell):
-                    if not (
-                        local_infrastructure == "none"
-                        or adjacent_infrastructure == "none"
-                    ):  # if both have infrastructure and connected by land or bridge, use discount
-                        # don't count adjacent ferry as road, but allow ferry in tile to count as road for moving to adjacent tiles
-                        if not (
-                            adjacent_infrastructure != "none"
-                            and adjacent_infrastructure.infrastructure_type == "ferry"
-                        ):
-                            cost = cost / 2
-                    # otherwise, use default cost but not full cost (no canoe penantly)
-                    if (  # if entering a ferry without canoes - if using canoes, ignore ferry
-                        adjacent_infrastructure != "none"
-                        and adjacent_infrastructure.infrastructure_type == "ferry"
-                        and not self.can_swim_river
-                    ):
-                        cost = 2
-                elif (
-                    adjacent_cell.terrain == "water"
-                    and adjacent_cell.y > 0
-                    and (self.can_walk and not self.can_swim_river)
-                    or adjacent_cell.terrain_features.get("cataract", False)
-                ):  # elif river w/o canoes
-                    cost = self.max_movement_points
-                if (not adjacent_cell.visible) and self.can_explore:
-                    cost = self.movement_cost
-            if local_cell.y == 0 and not self.can_swim_ocean:
-                cost = self.max_movement_points
+        cost = local_cell.movement_costs.get(
+            (
+                direction,
+                self.is_pmob,
+                self.can_swim_river,
+                self.can_walk,
+                self.can_explore,
+                self.can_swim_ocean,
+                self.movement_cost,
+                self.max_movement_points,
+            ),
+            None,
+        )  # same key as movement_cost_table.get_key, built here to avoid an extra call on each lookup
+        if cost == None:
+            cost = status.movement_cost_table.find_movement_cost(
+                self, local_cell, direction
+            )
         return cost
 
     def can_leave(self):
@@ -660,8 +642,7 @@ class mob(actor):
                     and self == current_image.current_cell.contained_mobs[0]
                     and current_image.current_cell.grid.showing
                 ):  # only draw outline if on top of stack
-                    pygame.draw.rect(
-                        constants.game_display,
+                    drawing_utility.draw_rect(
                         constants.color_dict[self.selection_outline_color],
                         (current_image.outline),
                         current_image.outline_width,
@@ -1065,6 +1046,8 @@ class mob(actor):
                         self.embark_vehicle(vehicle)
                         self.set_movement_points(0)
                     vehicle.select()
+        if self.is_pmob:
+            status.target_distance_field.update_target(self)
         if (
             self.can_construct
             or self.can_trade
@@ -3,7 +3,13 @@
 import pygame
 import random
 from ..constructs import images, villages
-from ..util import utility, actor_utility, main_loop_utility, text_utility
+from ..util import (
+    utility,
+    actor_utility,
+    main_loop_utility,
+    text_utility,
+    drawing_utility,
+)
 from .actors import actor
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -159,9 +165,7 @@ class tile(actor):  # to do: make terrain tiles a subclass
                 color = constants.color_dict[
                     color
                 ]  # converts input string to RGB tuple
-            pygame.draw.rect(
-                constants.game_display, color, (outline), current_image.outline_width
-            )
+            drawing_utility.draw_rect(color, (outline), current_image.outline_width)
 
     def draw_actor_match_outline(self, called_by_equivalent):
         """
@@ -176,8 +180,7 @@ class tile(actor):  # to do: make terrain tiles a subclass
         if self.images[0].can_show():
             for current_image in self.images:
                 outline = self.cell.Rect
-                pygame.draw.rect(
-                    constants.game_display,
+                drawing_utility.draw_rect(
                     constants.color_dict[self.actor_match_outline_color],
                     (outline),
                     current_image.outline_width,
@@ -355,6 +358,8 @@ class tile(actor):  # to do: make terrain tiles a subclass
             self.set_image(override_image)
         else:
             self.set_image(self.get_image_id_list())
+        if self.cell.tile == self:
+            self.grid.invalidate_cell(self.cell)
         if self.grid == status.strategic_map_grid:
             equivalent_tile = self.get_equivalent_tile()
             if equivalent_tile != "none":
@@ -16,6 +16,15 @@ from modules.tools.data_managers.achievement_manager_template import (
     achievement_manager_template,
 )
 from modules.tools.data_managers.effect_manager_template import effect_manager_template
+from modules.tools.data_managers.asset_pack_manager_template import (
+    asset_pack_manager_template,
+)
+from modules.tools.data_managers.scaled_image_cache_template import (
+    scaled_image_cache_template,
+)
+from modules.tools.data_managers.frame_profiler_template import (
+    frame_profiler_template,
+)
 from modules.tools.data_managers.notification_manager_template import (
     notification_manager_template,
 )
@@ -175,6 +184,12 @@ else:
         (display_width, display_height)
     )
 
+asset_pack_manager: asset_pack_manager_template = asset_pack_manager_template(
+    "cache/asset_pack.dat", "graphics"
+)
+scaled_image_cache: scaled_image_cache_template = scaled_image_cache_template(
+    "cache/scaled_images", (display_width, display_height)
+)
 sound_manager: sound_manager_template = sound_manager_template()
 save_load_manager: save_load_manager_template = save_load_manager_template()
 flavor_text_manager: flavor_text_manager_template = flavor_text_manager_template()
@@ -204,8 +219,20 @@ fear: int = 0
 fear_tracker: value_tracker_template = None
 fps: int = 0
 fps_tracker: value_tracker_template = None
+frame_profiler: frame_profiler_template = None
+frame_profile_window: int = 600
 frames_this_second: int = 0
 last_fps_update: float = 0.0
+target_fps: int = 60
+idle_fps: int = 10
+idle_delay: float = 0.3
+last_activity_time: float = 0.0
+frame_clock: pygame.time.Clock = pygame.time.Clock()
+max_dirty_rects: int = 100
+button_index_square_size: int = 64
+rendered_image_cache_bytes: int = 256 * 1048576
+combined_surface_cache_size: int = 2000
+scaled_image_cache_bytes: int = 128 * 1048576
 
 current_game_mode: str = None
 
@@ -34,6 +34,23 @@ from modules.constructs.lore_missions import lore_mission
 from modules.util.market_utility import loan
 from modules.action_types.action import action
 from modules.tools.effects import effect
+from modules.tools.data_managers.surface_cache_template import surface_cache_template
+from modules.tools.data_managers.button_index_template import button_index_template
+from modules.tools.data_managers.keybind_registry_template import (
+    keybind_registry_template,
+)
+from modules.tools.data_managers.hover_index_template import hover_index_template
+from modules.tools.data_managers.visibility_tracker_template import (
+    visibility_tracker_template,
+)
+from modules.tools.data_managers.mode_partition_template import mode_partition_template
+from modules.tools.data_managers.layout_tracker_template import layout_tracker_template
+from modules.tools.data_managers.target_distance_field_template import (
+    target_distance_field_template,
+)
+from modules.tools.data_managers.movement_cost_table_template import (
+    movement_cost_table_template,
+)
 
 strategic_map_grid: grid = None
 minimap_grid: mini_grid = None
@@ -59,8 +76,26 @@ displayed_prosecution: minister = None
 displayed_country: country = None
 displayed_notification: notification = None
 
-rendered_images: Dict[str, pygame.Surface] = {}
+rendered_images: surface_cache_template = surface_cache_template(
+    "Rendered images", max_bytes_key="rendered_image_cache_bytes"
+)
+combined_surfaces: surface_cache_template = surface_cache_template(
+    "Combined surfaces", max_entries_key="combined_surface_cache_size"
+)
+scaled_images: surface_cache_template = surface_cache_template(
+    "Scaled images", max_bytes_key="scaled_image_cache_bytes"
+)
+frame_draw_records: List[Any] = []
+previous_frame_draw_records: List[Any] = []
 button_list: List[button] = []
+button_index: button_index_template = button_index_template()
+keybind_registry: keybind_registry_template = keybind_registry_template()
+hover_index: hover_index_template = hover_index_template()
+visibility_tracker: visibility_tracker_template = visibility_tracker_template()
+mode_partition: mode_partition_template = mode_partition_template()
+layout_tracker: layout_tracker_template = layout_tracker_template()
+target_distance_field: target_distance_field_template = target_distance_field_template()
+movement_cost_table: movement_cost_table_template = movement_cost_table_template()
 recruitment_button_list: List[button] = []
 instructions_list: List[str] = []
 minister_list: List[minister] = []
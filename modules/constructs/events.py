@@ -1,6 +1,5 @@
 # Contains functionality for timed function call events
 
-from ..util import utility
 import modules.constants.constants as constants
 
 
@@ -56,10 +55,7 @@ class event:
         Output:
             None
         """
-        if self in self.event_manager.event_list:
-            self.event_manager.event_list = utility.remove_from_list(
-                self.event_manager.event_list, self
-            )
+        self.event_manager.remove_event(self)
 
 
 class repeating_event(event):
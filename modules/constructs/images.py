@@ -226,28 +226,36 @@ class image_bundle(image):
         Output:
             pygame.Surface: Returns a Pygame Surface that is a combination of each of this bundle's images
         """
-        # this is running whenever image is set, even if being set to same image as another bundle
-        combined_surface = pygame.Surface(
-            (self.width, self.height)
-        )  # has strange interaction with smoke effects
-        combined_surface.fill(constants.color_dict["transparent"])
-        combined_surface.set_colorkey(
-            constants.color_dict["transparent"], pygame.RLEACCEL
-        )
         blit_sequence = []
+        cache_key = [(self.width, self.height)]
         for member in self.members:
             if member.image_id != "misc/empty.png":
                 if member.is_offset:
-                    blit_sequence.append(
-                        (
-                            member.image,
-                            ((member.get_blit_x_offset(), member.get_blit_y_offset())),
-                        )
+                    blit_position = (
+                        member.get_blit_x_offset(),
+                        member.get_blit_y_offset(),
                     )
                 else:
-                    blit_sequence.append((member.image, (0, 0)))
-        if blit_sequence:
-            combined_surface.blits(blit_sequence)
+                    blit_position = (0, 0)
+                blit_sequence.append((member.image, blit_position))
+                cache_key.append(
+                    (member.cache_key, member.width, member.height, blit_position)
+                )
+        cache_key = tuple(
+            cache_key
+        )  # bundles with identical members and sizes share the same combined surface, rather than each re-creating it
+        combined_surface = status.combined_surfaces.get(cache_key)
+        if combined_surface == None:
+            combined_surface = pygame.Surface(
+                (self.width, self.height)
+            )  # has strange interaction with smoke effects
+            combined_surface.fill(constants.color_dict["transparent"])
+            combined_surface.set_colorkey(
+                constants.color_dict["transparent"], pygame.RLEACCEL
+            )
+            if blit_sequence:
+                combined_surface.blits(blit_sequence)
+            status.combined_surfaces.set(cache_key, combined_surface)
         return combined_surface
 
     def complete_draw(self):
@@ -397,6 +405,8 @@ class bundle_image:
             type(self.image_id) == pygame.Surface
         ):  # if given pygame Surface, avoid having to render it again
             self.image = self.image_id
+            self.unscaled_image = self.image_id
+            self.cache_key = self.image_id
         else:
             self.load()
         self.scale()
@@ -459,7 +469,18 @@ class bundle_image:
             self.width = self.bundle.width
             self.height = self.bundle.height
         if self.image != "none":
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
+            smooth = constants.effect_manager.effect_active("smooth_image_scaling")
+            scaled_key = (self.cache_key, self.width, self.height, smooth)
+            scaled_image = status.scaled_images.get(scaled_key)
+            if scaled_image == None:
+                scaled_image = constants.scaled_image_cache.load(scaled_key)
+                if scaled_image == None:
+                    scaled_image = drawing_utility.scale_image(
+                        self.unscaled_image, self.width, self.height, smooth=smooth
+                    )
+                    constants.scaled_image_cache.save(scaled_key, scaled_image)
+                status.scaled_images.set(scaled_key, scaled_image)
+            self.image = scaled_image
 
     def load(self):
         """
@@ -478,55 +499,42 @@ class bundle_image:
         if self.is_offset and self.has_green_screen:
             for current_green_screen_color in self.green_screen_colors:
                 key += str(current_green_screen_color)
-        if key in status.rendered_images:  # if image already loaded, use it
-            self.image = status.rendered_images[key]
-        else:  # if image not loaded, load it and add it to the loaded images
+        self.cache_key = key
+        self.image = status.rendered_images.get(key)  # use image if already loaded
+        if self.image == None:  # if image not loaded, load and add it
             if full_image_id.endswith(".png"):
                 self.text = False
                 try:  # use if there are any image path issues to help with file troubleshooting, shows the file location in which an image was expected
-                    self.image = pygame.image.load(full_image_id)
+                    self.image = constants.asset_pack_manager.load_image(full_image_id)
                 except:
                     print(full_image_id)
-                    self.image = pygame.image.load(full_image_id)
+                    self.image = constants.asset_pack_manager.load_image(full_image_id)
                 self.image.convert()
                 if self.is_offset and self.has_green_screen:
-                    width, height = self.image.get_size()
+                    color_replacements = []
                     index = 0
                     for current_green_screen_color in constants.green_screen_colors:
                         if index < len(self.green_screen_colors):
                             if (
                                 type(self.green_screen_colors[index]) == str
                             ):  # like 'red'
-                                replace_with = self.bundle.constants.color_dict[
+                                replace_with = constants.color_dict[
                                     self.green_screen_colors[index]
                                 ]
                             else:  # like (255, 0, 0)
                                 replace_with = self.green_screen_colors[index]
-                            for x in range(width):
-                                for y in range(height):
-                                    current_color = self.image.get_at((x, y))
-                                    if (
-                                        current_color[0]
-                                        == current_green_screen_color[0]
-                                        and current_color[1]
-                                        == current_green_screen_color[1]
-                                        and current_color[2]
-                                        == current_green_screen_color[2]
-                                    ):
-                                        self.image.set_at(
-                                            (x, y),
-                                            (
-                                                replace_with[0],
-                                                replace_with[1],
-                                                replace_with[2],
-                                                current_color[3],
-                                            ),
-                                        )  # preserves alpha value
+                            color_replacements.append(
+                                (current_green_screen_color, replace_with)
+                            )
                         index += 1
+                    drawing_utility.replace_colors(self.image, color_replacements)
             else:
                 self.text = True
                 self.image = text_utility.text(self.image_id, self.font)
-            status.rendered_images[key] = self.image
+            status.rendered_images.set(
+                key, self.image, pinned=not flags.startup_complete
+            )
+        self.unscaled_image = self.image
 
 
 class free_image(image):
@@ -578,6 +586,7 @@ class free_image(image):
 
         self.to_front = input_dict.get("to_front", False)
         status.free_image_list.append(self)
+        status.mode_partition.invalidate()
 
     def calibrate(self, new_actor):
         return
@@ -600,6 +609,20 @@ class free_image(image):
         if self.has_parent_collection:
             self.x_offset = new_x - self.parent_collection.x
             self.y_offset = new_y - self.parent_collection.y
+        self.invalidate_layout()
+
+    def invalidate_layout(self):
+        """
+        Description:
+            Records that this image was moved, shown, or hidden, causing its parent collection, if any, to update its layout when next traversed. Along with
+                set_origin, allows a free image to behave as an interface element and join interface collections
+        Input:
+            None
+        Output:
+            None
+        """
+        if self.has_parent_collection:
+            self.parent_collection.layout_outdated = True
 
     def set_modes(self, new_modes):
         """
@@ -611,6 +634,7 @@ class free_image(image):
             None
         """
         self.modes = new_modes
+        status.mode_partition.invalidate()
 
     def can_draw(self):
         """
@@ -653,6 +677,7 @@ class free_image(image):
             status.independent_interface_elements, self
         )
         status.free_image_list = utility.remove_from_list(status.free_image_list, self)
+        status.mode_partition.invalidate()
 
     def remove_recursive(self, complete=False):
         """
@@ -691,20 +716,25 @@ class free_image(image):
                     else:
                         self.text = True
                         full_image_id = self.image_id
-                    if full_image_id in status.rendered_images:
-                        self.image = status.rendered_images[full_image_id]
-                    else:
+                    self.image = status.rendered_images.get(full_image_id)
+                    if self.image == None:
                         if not self.text:
                             try:  # use if there are any image path issues to help with file troubleshooting, shows the file location in which an image was expected
-                                self.image = pygame.image.load(full_image_id)
+                                self.image = constants.asset_pack_manager.load_image(
+                                    full_image_id
+                                )
                             except:
                                 print(full_image_id)
-                                self.image = pygame.image.load(full_image_id)
+                                self.image = constants.asset_pack_manager.load_image(
+                                    full_image_id
+                                )
                         else:
                             self.image = text_utility.text(
                                 full_image_id, constants.myfont
                             )
-                        status.rendered_images[full_image_id] = self.image
+                        status.rendered_images.set(
+                            full_image_id, self.image, pinned=not flags.startup_complete
+                        )
                     self.image = pygame.transform.scale(
                         self.image, (self.width, self.height)
                     )
@@ -899,22 +929,18 @@ class tooltip_free_image(free_image):
             self.tooltip_box.y = mouse_y
             self.tooltip_outline.x = self.tooltip_box.x - self.tooltip_outline_width
             self.tooltip_outline.y = self.tooltip_box.y - self.tooltip_outline_width
-            pygame.draw.rect(
-                constants.game_display,
+            drawing_utility.draw_rect(
                 constants.color_dict["black"],
                 self.tooltip_outline,
             )
-            pygame.draw.rect(
-                constants.game_display, constants.color_dict["white"], self.tooltip_box
-            )
+            drawing_utility.draw_rect(constants.color_dict["white"], self.tooltip_box)
             for text_line_index in range(len(self.tooltip_text)):
                 text_line = self.tooltip_text[text_line_index]
-                constants.game_display.blit(
-                    text_utility.text(text_line, constants.myfont),
-                    (
-                        self.tooltip_box.x + scaling.scale_width(10),
-                        self.tooltip_box.y + (text_line_index * constants.font_size),
-                    ),
+                drawing_utility.display_text(
+                    text_line,
+                    constants.myfont,
+                    self.tooltip_box.x + scaling.scale_width(10),
+                    self.tooltip_box.y + text_line_index * constants.font_size,
                 )
 
 
@@ -1267,6 +1293,7 @@ class loading_image_template(free_image):
         status.independent_interface_elements = utility.remove_from_list(
             status.independent_interface_elements, self
         )
+        status.mode_partition.invalidate()
 
     def can_show(self, skip_parent_collection=False):
         """
@@ -1381,18 +1408,23 @@ class actor_image(image):
                 else:
                     self.text = True
                     full_image_id = self.image_id
-                if full_image_id in status.rendered_images:
-                    self.image = status.rendered_images[full_image_id]
-                else:
+                self.image = status.rendered_images.get(full_image_id)
+                if self.image == None:
                     if not self.text:
                         try:  # use if there are any image path issues to help with file troubleshooting, shows the file location in which an image was expected
-                            self.image = pygame.image.load(full_image_id)
+                            self.image = constants.asset_pack_manager.load_image(
+                                full_image_id
+                            )
                         except:
                             print(full_image_id)
-                            self.image = pygame.image.load(full_image_id)
+                            self.image = constants.asset_pack_manager.load_image(
+                                full_image_id
+                            )
                     else:
                         self.image = text_utility.text(self.image_id, constants.myfont)
-                    status.rendered_images[full_image_id] = self.image
+                    status.rendered_images.set(
+                        full_image_id, self.image, pinned=not flags.startup_complete
+                    )
                 self.image = pygame.transform.scale(
                     self.image, (self.width, self.height)
                 )
@@ -1647,15 +1679,16 @@ class button_image(actor_image):
         if isinstance(self.image_id, str):  # if set to string image path
             self.contains_bundle = False
             full_image_id = "graphics/" + self.image_id
-            if full_image_id in status.rendered_images:
-                self.image = status.rendered_images[full_image_id]
-            else:
+            self.image = status.rendered_images.get(full_image_id)
+            if self.image == None:
                 try:  # use if there are any image path issues to help with file troubleshooting, shows the file location in which an image was expected
-                    self.image = pygame.image.load(full_image_id)
+                    self.image = constants.asset_pack_manager.load_image(full_image_id)
                 except:
                     print(full_image_id)
-                    self.image = pygame.image.load(full_image_id)
-                status.rendered_images[full_image_id] = self.image
+                    self.image = constants.asset_pack_manager.load_image(full_image_id)
+                status.rendered_images.set(
+                    full_image_id, self.image, pinned=not flags.startup_complete
+                )
             self.image = pygame.transform.scale(self.image, (self.width, self.height))
         else:  # if set to image path list
             self.contains_bundle = True
@@ -1760,3 +1793,26 @@ class tile_image(actor_image):
             return ()  # do not show if resource icon in undiscovered tile
         self.go_to_cell((self.actor.x, self.actor.y))
         self.complete_draw()
+
+    def draw_to_surface(self, surface, origin):
+        """
+        Description:
+            Draws this image onto the inputted surface rather than the screen, like when a grid bakes its terrain layer
+        Input:
+            pygame.Surface surface: Surface to draw onto
+            int tuple origin: Two values representing x and y pixel coordinates of the surface's top left corner on the screen
+        Output:
+            None
+        """
+        if self.actor.name == "resource icon" and not self.actor.cell.visible:
+            return ()  # do not show if resource icon in undiscovered tile
+        self.go_to_cell((self.actor.x, self.actor.y))
+        if self.contains_bundle:
+            surface.blit(
+                self.image.combined_surface,
+                (self.x - origin[0], self.y - self.image.height - origin[1]),
+            )
+        elif self.image_id != "misc/empty.png":
+            surface.blit(
+                self.image, (self.x - origin[0], self.y - self.height - origin[1])
+            )
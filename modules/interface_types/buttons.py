@@ -3,6 +3,7 @@
 import pygame
 from typing import List
 from ..util import (
+    drawing_utility,
     text_utility,
     scaling,
     main_loop_utility,
@@ -62,10 +63,13 @@ class button(interface_elements.interface_element):
         self.has_released = True
         self.button_type = input_dict["button_type"]
         status.button_list.append(self)
+        status.button_index.invalidate()
+        status.mode_partition.invalidate()
         self.keybind_id = input_dict.get("keybind_id", "none")
         self.has_keybind = self.keybind_id != "none"
         if self.has_keybind:
             self.set_keybind(self.keybind_id)
+            status.keybind_registry.register(self)
         if "color" in input_dict:
             self.color = constants.color_dict[input_dict["color"]]
         self.has_button_press_override = False
@@ -1080,14 +1084,13 @@ class button(interface_elements.interface_element):
         """
         if self.showing:
             if self.showing_outline and allow_show_outline:
-                pygame.draw.rect(
-                    constants.game_display,
+                drawing_utility.draw_rect(
                     constants.color_dict["white"],
                     self.outline,
                     width=2,
                 )
             if self.showing_background and hasattr(self, "color"):
-                pygame.draw.rect(constants.game_display, self.color, self.Rect)
+                drawing_utility.draw_rect(self.color, self.Rect)
             self.image.draw()
             if (
                 self.has_keybind
@@ -1097,15 +1100,12 @@ class button(interface_elements.interface_element):
                 textsurface = constants.myfont.pygame_font.render(
                     message, False, constants.color_dict[color]
                 )
-                constants.game_display.blit(
+                drawing_utility.display_image(
                     textsurface,
-                    (
-                        self.x + scaling.scale_width(10),
-                        (
-                            constants.display_height
-                            - (self.y + self.height - scaling.scale_height(5))
-                        ),
-                    ),
+                    self.x + scaling.scale_width(10),
+                    constants.display_height
+                    - (self.y + self.height - scaling.scale_height(5)),
+                    signature=("text", message, color),
                 )
 
     def draw_tooltip(self, below_screen, beyond_screen, height, width, y_displacement):
@@ -1133,22 +1133,18 @@ class button(interface_elements.interface_element):
             self.tooltip_box.y = mouse_y
             self.tooltip_outline.x = self.tooltip_box.x - self.tooltip_outline_width
             self.tooltip_outline.y = self.tooltip_box.y - self.tooltip_outline_width
-            pygame.draw.rect(
-                constants.game_display,
+            drawing_utility.draw_rect(
                 constants.color_dict["black"],
                 self.tooltip_outline,
             )
-            pygame.draw.rect(
-                constants.game_display, constants.color_dict["white"], self.tooltip_box
-            )
+            drawing_utility.draw_rect(constants.color_dict["white"], self.tooltip_box)
             for text_line_index in range(len(self.tooltip_text)):
                 text_line = self.tooltip_text[text_line_index]
-                constants.game_display.blit(
-                    text_utility.text(text_line, constants.myfont),
-                    (
-                        self.tooltip_box.x + scaling.scale_width(10),
-                        self.tooltip_box.y + (text_line_index * constants.font_size),
-                    ),
+                drawing_utility.display_text(
+                    text_line,
+                    constants.myfont,
+                    self.tooltip_box.x + scaling.scale_width(10),
+                    self.tooltip_box.y + text_line_index * constants.font_size,
                 )
 
     def on_rmb_click(self):
@@ -1711,6 +1707,7 @@ class button(interface_elements.interface_element):
 
         elif self.button_type == "minimize interface collection":
             self.attached_collection.minimized = not self.attached_collection.minimized
+            status.visibility_tracker.invalidate("interface")
             if not self.attached_collection.minimized:
                 # If any movement within the collection occurred while minimized, makes sure all newly shown elements are at their correct locations
                 self.attached_collection.set_origin(
@@ -1756,6 +1753,7 @@ class button(interface_elements.interface_element):
         elif self.button_type == "tab":
             tabbed_collection = self.parent_collection.parent_collection
             tabbed_collection.current_tabbed_member = self.linked_element
+            status.visibility_tracker.invalidate("interface")
             if (
                 self.identifier == "inventory"
                 and constants.effect_manager.effect_active("link_inventory_tabs")
@@ -1770,6 +1768,7 @@ class button(interface_elements.interface_element):
                         linked_tab_button.parent_collection.parent_collection.current_tabbed_member = (
                             linked_tab_button.linked_element
                         )
+                        status.visibility_tracker.invalidate("interface")
 
         elif self.button_type == "rename settlement":
             if override_action_possible or main_loop_utility.action_possible():
@@ -1817,6 +1816,10 @@ class button(interface_elements.interface_element):
         """
         super().remove()
         status.button_list = utility.remove_from_list(status.button_list, self)
+        status.button_index.invalidate()
+        status.mode_partition.invalidate()
+        if self.has_keybind:
+            status.keybind_registry.unregister(self)
 
     def can_show(self, skip_parent_collection=False):
         """
@@ -2197,14 +2200,12 @@ class same_tile_icon(button):
         if self.showing:
             if self.index == 0 and status.displayed_tile:
                 if status.displayed_tile.cell.contained_mobs[0] == status.displayed_mob:
-                    pygame.draw.rect(
-                        constants.game_display,
+                    drawing_utility.draw_rect(
                         constants.color_dict["bright green"],
                         self.outline,
                     )
                 else:
-                    pygame.draw.rect(
-                        constants.game_display,
+                    drawing_utility.draw_rect(
                         constants.color_dict["white"],
                         self.outline,
                     )
@@ -2605,15 +2606,14 @@ class minister_portrait_image(button):
         ):  # Draw outline around portrait if minister selected
             showing = True
             if self.current_minister != "none":
-                pygame.draw.rect(
-                    constants.game_display, constants.color_dict["white"], self.Rect
+                drawing_utility.draw_rect(
+                    constants.color_dict["white"], self.Rect
                 )  # draw white background
                 if (
                     status.displayed_minister == self.current_minister
                     and flags.show_selection_outlines
                 ):
-                    pygame.draw.rect(
-                        constants.game_display,
+                    drawing_utility.draw_rect(
                         constants.color_dict["bright green"],
                         self.outline,
                     )
@@ -2767,15 +2767,14 @@ class country_selection_image(button):
         """
         if self.showing:  # draw outline around portrait if country selected
             if not self.current_country == "none":
-                pygame.draw.rect(
-                    constants.game_display, constants.color_dict["white"], self.Rect
+                drawing_utility.draw_rect(
+                    constants.color_dict["white"], self.Rect
                 )  # draw white background
                 if (
                     status.displayed_country == self.current_country
                     and flags.show_selection_outlines
                 ):
-                    pygame.draw.rect(
-                        constants.game_display,
+                    drawing_utility.draw_rect(
                         constants.color_dict["bright green"],
                         self.outline,
                     )
@@ -3291,6 +3290,7 @@ class tab_button(button):
             else:
                 self.showing_outline = False
                 self.parent_collection.parent_collection.current_tabbed_member = None
+                status.visibility_tracker.invalidate("interface")
                 for (
                     tabbed_member
                 ) in self.parent_collection.parent_collection.tabbed_members:
@@ -3829,12 +3829,11 @@ class anonymous_button(button):
         """
         super().draw()
         if self.showing and self.in_notification:
-            constants.game_display.blit(
-                text_utility.text(self.message, self.font),
-                (
-                    self.x + scaling.scale_width(10),
-                    constants.display_height - (self.y + self.height),
-                ),
+            drawing_utility.display_text(
+                self.message,
+                self.font,
+                self.x + scaling.scale_width(10),
+                constants.display_height - (self.y + self.height),
             )
 
     def update_tooltip(self):
@@ -27,6 +27,7 @@ class cell_icon(actor):
         """
         super().__init__(from_save, input_dict)
         status.independent_interface_elements.append(self)
+        status.mode_partition.invalidate()
         self.showing = False
         self.image_dict = {"default": input_dict["image"]}
         self.images = [
@@ -88,6 +89,7 @@ class cell_icon(actor):
             status.independent_interface_elements = utility.remove_from_list(
                 status.independent_interface_elements, self
             )
+            status.mode_partition.invalidate()
 
     def can_show_tooltip(self):
         """
@@ -3,7 +3,7 @@
 import pygame
 import random
 from typing import Dict
-from ..util import actor_utility
+from ..util import actor_utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -51,6 +51,9 @@ class cell:
         self.settlement = None
         self.terrain = "none"
         self.terrain_features: Dict[str, bool] = {}
+        self.movement_costs: Dict[tuple, float] = (
+            {}
+        )  # costs of moving from this cell, recorded by status.movement_cost_table
         self.terrain_variant: int = 0
         self.contained_mobs: list = []
         self.reset_buildings()
@@ -785,6 +788,8 @@ class cell:
             None
         """
         self.visible = new_visibility
+        self.grid.invalidate_cell(self)
+        status.movement_cost_table.invalidate_cell(self)
         if update_image_bundle and self.tile != "none":
             self.tile.update_image_bundle()
         if new_visibility:
@@ -821,6 +826,8 @@ class cell:
         if self.tile != "none":
             self.tile.set_terrain(new_terrain, update_image_bundle)
         self.color = constants.terrain_colors[new_terrain]
+        self.grid.invalidate_cell(self)
+        status.movement_cost_table.invalidate_cell(self)
 
     def copy(self, other_cell):
         """
@@ -843,12 +850,14 @@ class cell:
         # self.tile.update_image_bundle(override_image=other_cell.tile.image) #correctly copies other cell's image bundle but ends up very pixellated due to size difference
         self.tile.update_image_bundle()
 
-    def draw(self):
+    def draw_terrain(self, surface, origin):
         """
         Description:
-            Draws this cell as a rectangle with a certain color on its grid, depending on this cell's color value, along with actors this cell contains
+            Draws this cell as a rectangle with a certain color, depending on this cell's color value, along with its terrain tile, onto the inputted surface - used by
+                this cell's grid to bake its terrain layer rather than drawing directly to the screen each frame
         Input:
-            none
+            pygame.Surface surface: Surface to draw onto
+            int tuple origin: Two values representing x and y pixel coordinates of the surface's top left corner on the screen
         Output:
             None
         """
@@ -858,14 +867,26 @@ class cell:
         blue = current_color[2]
         if not self.visible:
             red, green, blue = constants.color_dict["blonde"]
-        pygame.draw.rect(constants.game_display, (red, green, blue), self.Rect)
+        pygame.draw.rect(
+            surface, (red, green, blue), self.Rect.move(-origin[0], -origin[1])
+        )
         if self.tile != "none":
             for current_image in self.tile.images:
+                current_image.draw_to_surface(surface, origin)
+
+    def draw(self):
+        """
+        Description:
+            Draws the actors this cell contains - this cell's color and terrain are drawn as part of its grid's terrain layer
+        Input:
+            none
+        Output:
+            None
+        """
+        if self.tile != "none" and self.visible and self.contained_mobs:
+            for current_image in self.contained_mobs[0].images:
                 current_image.draw()
-            if self.visible and self.contained_mobs:
-                for current_image in self.contained_mobs[0].images:
-                    current_image.draw()
-                self.show_num_mobs()
+            self.show_num_mobs()
 
     def show_num_mobs(self):
         """
@@ -888,7 +909,12 @@ class cell:
             )
             text_x = self.pixel_x + self.width - (font_width * (len(message) + 0.3))
             text_y = self.pixel_y + (-0.8 * self.height) - (0.5 * font_height)
-            constants.game_display.blit(textsurface, (text_x, text_y))
+            drawing_utility.display_image(
+                textsurface,
+                text_x,
+                text_y,
+                signature=("text", message, font, font_width, font_height),
+            )
 
     def touching_mouse(self):
         """
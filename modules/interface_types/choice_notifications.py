@@ -1,7 +1,7 @@
 # Contains functionality for choice notifications
 
 from . import buttons, action_notifications
-from ..util import text_utility, scaling, market_utility, utility
+from ..util import text_utility, scaling, market_utility, utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -191,12 +191,11 @@ class choice_button(buttons.button):
         """
         super().draw()
         if self.showing:
-            constants.game_display.blit(
-                text_utility.text(self.message, self.font),
-                (
-                    self.x + scaling.scale_width(10),
-                    constants.display_height - (self.y + self.height),
-                ),
+            drawing_utility.display_text(
+                self.message,
+                self.font,
+                self.x + scaling.scale_width(10),
+                constants.display_height - (self.y + self.height),
             )
 
     def update_tooltip(self):
@@ -4,7 +4,7 @@ import pygame
 import time
 import random
 from .buttons import button
-from ..util import utility
+from ..util import utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -258,16 +258,13 @@ class die(button):
                 self.roll()
             super().draw()
             if self.highlighted or not self.normal_die:
-                pygame.draw.rect(
-                    constants.game_display,
+                drawing_utility.draw_rect(
                     constants.color_dict[self.outline_color],
                     self.Rect,
                     6,
                 )
             else:
-                pygame.draw.rect(
-                    constants.game_display, constants.color_dict["black"], self.Rect, 6
-                )
+                drawing_utility.draw_rect(constants.color_dict["black"], self.Rect, 6)
 
     def remove(self):
         """
@@ -1,12 +1,19 @@
 # Contains functionality for grids
 
 import random
+import math
 import pygame
 import itertools
 import json
 from typing import Dict
 from . import cells, interface_elements
-from ..util import actor_utility, utility, scaling, village_name_generator
+from ..util import (
+    actor_utility,
+    utility,
+    scaling,
+    village_name_generator,
+    drawing_utility,
+)
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -40,6 +47,7 @@ class grid(interface_elements.interface_element):
         """
         super().__init__(input_dict)
         status.grid_list.append(self)
+        status.mode_partition.invalidate()
         self.grid_type = input_dict["grid_type"]
         self.grid_line_width = input_dict.get("grid_line_width", 3)
         self.from_save = from_save
@@ -55,6 +63,14 @@ class grid(interface_elements.interface_element):
         self.internal_line_color = input_dict.get("internal_line_color", "black")
         self.external_line_color = input_dict.get("external_line_color", "black")
         self.mini_grid = "none"
+        self.terrain_surface: pygame.Surface = None
+        self.grid_line_surface: pygame.Surface = None
+        self.terrain_surface_key: tuple = None
+        self.terrain_surface_version: int = 0
+        constants.effect_manager.subscribe(
+            "hide_grid_lines", self.update_grid_lines_hidden
+        )
+        self.invalidated_cells: set = set()
         self.cell_list = [
             [None] * self.coordinate_height for y in range(self.coordinate_width)
         ]
@@ -200,20 +216,137 @@ class grid(interface_elements.interface_element):
     def draw(self):
         """
         Description:
-            Draws each cell of this grid
+            Draws this grid's cached terrain layer, the actors contained in each of its cells, and its grid lines
         Input:
             None
         Output:
             None
         """
+        self.update_terrain_surface()
+        origin = self.terrain_surface_key[0][:2]
+        drawing_utility.display_image(
+            self.terrain_surface,
+            origin[0],
+            origin[1],
+            signature=(self.terrain_surface, self.terrain_surface_version),
+        )
         for cell in self.get_flat_cell_list():
             cell.draw()
+        drawing_utility.display_image(self.grid_line_surface, origin[0], origin[1])
         self.draw_grid_lines()
 
-    def draw_grid_lines(self):
+    def invalidate_cell(self, cell) -> None:
+        """
+        Description:
+            Causes the inputted cell to be re-drawn onto this grid's cached terrain layer the next time this grid is drawn - called whenever a cell's terrain, visibility,
+                resource, or buildings change
+        Input:
+            cell cell: Cell of this grid whose appearance changed
+        Output:
+            None
+        """
+        self.invalidated_cells.add(cell)
+
+    def invalidate_terrain_surface(self) -> None:
+        """
+        Description:
+            Causes this grid's cached terrain layer and grid lines to be completely re-drawn the next time this grid is drawn
+        Input:
+            None
+        Output:
+            None
+        """
+        self.terrain_surface_key = None
+
+    def update_grid_lines_hidden(self, hidden: bool) -> None:
+        """
+        Description:
+            Called when the hide_grid_lines effect becomes active or inactive, causing this grid's grid lines to be re-drawn with or without interior lines
+        Input:
+            boolean hidden: Whether interior grid lines are now hidden
+        Output:
+            None
+        """
+        self.invalidate_terrain_surface()
+
+    def get_terrain_surface_rect(self) -> pygame.Rect:
+        """
+        Description:
+            Returns the area of the screen covered by this grid's cached terrain layer, including a margin for outer grid lines that extend past the edges of its cells
+        Input:
+            None
+        Output:
+            pygame.Rect: Returns the area of the screen covered by this grid's cached terrain layer
+        """
+        margin = self.grid_line_width + 2
+        return pygame.Rect(
+            self.x - margin,
+            constants.display_height - (self.y + self.height) - margin,
+            self.width + (2 * margin),
+            self.height + (2 * margin),
+        )
+
+    def update_terrain_surface(self) -> None:
         """
         Description:
-            Draws lines between grid cells and on the outside of the grid. Also draws an outline of the area on this grid covered by this grid's minimap grid, if applicable
+            Re-draws any invalidated cells onto this grid's cached terrain layer. If this grid was moved or resized since the last update, or its grid lines were
+                shown or hidden, re-creates the terrain layer and grid lines from scratch
+        Input:
+            None
+        Output:
+            None
+        """
+        surface_rect = self.get_terrain_surface_rect()
+        terrain_surface_key = (
+            tuple(surface_rect),
+        )  # showing or hiding grid lines resets the key through update_grid_lines_hidden
+        if terrain_surface_key != self.terrain_surface_key:
+            self.terrain_surface_key = terrain_surface_key
+            self.terrain_surface = pygame.Surface(surface_rect.size)
+            self.terrain_surface.fill(constants.color_dict["transparent"])
+            self.terrain_surface.set_colorkey(constants.color_dict["transparent"])
+            self.grid_line_surface = pygame.Surface(surface_rect.size)
+            self.grid_line_surface.fill(constants.color_dict["transparent"])
+            self.grid_line_surface.set_colorkey(
+                constants.color_dict["transparent"], pygame.RLEACCEL
+            )
+            self.bake_grid_lines()
+            invalidated_cells = self.get_flat_cell_list()
+        else:
+            invalidated_cells = self.invalidated_cells
+        if invalidated_cells:
+            for cell in invalidated_cells:
+                cell.draw_terrain(self.terrain_surface, surface_rect.topleft)
+            self.terrain_surface_version += 1
+        self.invalidated_cells = set()
+
+    def bake_line(self, color, start_coordinates, end_coordinates, width) -> None:
+        """
+        Description:
+            Draws a line between the inputted grid coordinates onto this grid's cached grid line layer
+        Input:
+            string color: Color in the color_dict dictionary for the line, like 'bright blue'
+            int tuple start_coordinates: Two values representing x and y grid coordinates of one end of the line
+            int tuple end_coordinates: Two values representing x and y grid coordinates of the other end of the line
+            int width: Pixel width of the line
+        Output:
+            None
+        """
+        origin_x, origin_y = self.terrain_surface_key[0][:2]
+        start_x, start_y = self.convert_coordinates(start_coordinates)
+        end_x, end_y = self.convert_coordinates(end_coordinates)
+        pygame.draw.line(
+            self.grid_line_surface,
+            constants.color_dict[color],
+            (start_x - origin_x, start_y - origin_y),
+            (end_x - origin_x, end_y - origin_y),
+            width,
+        )
+
+    def bake_grid_lines(self):
+        """
+        Description:
+            Draws lines between grid cells and on the outside of the grid onto this grid's cached grid line layer
         Input:
             None
         Output:
@@ -221,49 +354,54 @@ class grid(interface_elements.interface_element):
         """
         if not constants.effect_manager.effect_active("hide_grid_lines"):
             for x in range(0, self.coordinate_width + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((x, 0)),
-                    self.convert_coordinates((x, self.coordinate_height)),
+                self.bake_line(
+                    self.internal_line_color,
+                    (x, 0),
+                    (x, self.coordinate_height),
                     self.grid_line_width,
                 )
             for y in range(0, self.coordinate_height + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((0, y)),
-                    self.convert_coordinates((self.coordinate_width, y)),
+                self.bake_line(
+                    self.internal_line_color,
+                    (0, y),
+                    (self.coordinate_width, y),
                     self.grid_line_width,
                 )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((0, 0)),
-            self.convert_coordinates((0, self.coordinate_height)),
+        self.bake_line(
+            self.external_line_color,
+            (0, 0),
+            (0, self.coordinate_height),
             self.grid_line_width + 1,
         )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((self.coordinate_width, 0)),
-            self.convert_coordinates((self.coordinate_width, self.coordinate_height)),
+        self.bake_line(
+            self.external_line_color,
+            (self.coordinate_width, 0),
+            (self.coordinate_width, self.coordinate_height),
             self.grid_line_width + 1,
         )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((0, 0)),
-            self.convert_coordinates((self.coordinate_width, 0)),
+        self.bake_line(
+            self.external_line_color,
+            (0, 0),
+            (self.coordinate_width, 0),
             self.grid_line_width + 1,
         )
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((0, self.coordinate_height)),
-            self.convert_coordinates((self.coordinate_width, self.coordinate_height)),
+        self.bake_line(
+            self.external_line_color,
+            (0, self.coordinate_height),
+            (self.coordinate_width, self.coordinate_height),
             self.grid_line_width + 1,
         )
+
+    def draw_grid_lines(self):
+        """
+        Description:
+            Draws an outline of the area on this grid covered by this grid's minimap grid, if applicable - lines between grid cells are part of the cached grid line
+                layer
+        Input:
+            None
+        Output:
+            None
+        """
         if self.mini_grid != "none" and flags.show_minimap_outlines:
             mini_map_outline_color = self.mini_grid.external_line_color
             left_x = self.mini_grid.center_x - (
@@ -290,29 +428,25 @@ class grid(interface_elements.interface_element):
                 up_y = self.coordinate_height
             if down_y < 0:
                 down_y = 0
-            pygame.draw.line(
-                constants.game_display,
+            drawing_utility.draw_line(
                 constants.color_dict[mini_map_outline_color],
                 self.convert_coordinates((left_x, down_y)),
                 self.convert_coordinates((left_x, up_y)),
                 self.grid_line_width + 1,
             )
-            pygame.draw.line(
-                constants.game_display,
+            drawing_utility.draw_line(
                 constants.color_dict[mini_map_outline_color],
                 self.convert_coordinates((left_x, up_y)),
                 self.convert_coordinates((right_x, up_y)),
                 self.grid_line_width + 1,
             )
-            pygame.draw.line(
-                constants.game_display,
+            drawing_utility.draw_line(
                 constants.color_dict[mini_map_outline_color],
                 self.convert_coordinates((right_x, up_y)),
                 self.convert_coordinates((right_x, down_y)),
                 self.grid_line_width + 1,
             )
-            pygame.draw.line(
-                constants.game_display,
+            drawing_utility.draw_line(
                 constants.color_dict[mini_map_outline_color],
                 self.convert_coordinates((right_x, down_y)),
                 self.convert_coordinates((left_x, down_y)),
@@ -427,6 +561,47 @@ class grid(interface_elements.interface_element):
         else:
             return None
 
+    def get_cells_at_pixel(self, x, y):
+        """
+        Description:
+            Returns each of this grid's cells that is colliding with the inputted pixel, inverting convert_coordinates rather than checking each cell. Cell width and
+                height are rounded up, so adjacent cells can overlap by a pixel - each cell next to the estimated cell is also checked
+        Input:
+            int x: x coordinate of the pixel to check, like the mouse's x position
+            int y: y coordinate of the pixel to check, like the mouse's y position
+        Output:
+            cell list: Returns each of this grid's cells that is colliding with the inputted pixel, in the same order as get_flat_cell_list
+        """
+        estimated_x = math.floor(
+            (x - self.x) / (self.width / self.coordinate_width)
+        )  # convert_coordinates truncates, so the estimate is at most 1 cell away
+        estimated_y = math.floor(
+            (constants.display_height - y - self.y)
+            / (self.height / self.coordinate_height)
+        )
+        colliding_cells = []
+        for cell_x in (estimated_x - 1, estimated_x, estimated_x + 1):
+            for cell_y in (estimated_y - 1, estimated_y, estimated_y + 1):
+                current_cell = self.find_cell(cell_x, cell_y)
+                if current_cell and current_cell.Rect.collidepoint(x, y):
+                    colliding_cells.append(current_cell)
+        return colliding_cells
+
+    def cell_at_pixel(self, x, y):
+        """
+        Description:
+            Returns this grid's cell that is colliding with the inputted pixel, choosing the cell that comes last in get_flat_cell_list if adjacent cells overlap at it
+        Input:
+            int x: x coordinate of the pixel to check, like the mouse's x position
+            int y: y coordinate of the pixel to check, like the mouse's y position
+        Output:
+            None/cell: Returns this grid's cell that is colliding with the inputted pixel, or None if no cells collide with it
+        """
+        colliding_cells = self.get_cells_at_pixel(x, y)
+        if colliding_cells:
+            return colliding_cells[-1]
+        return None
+
     def choose_cell(self, requirements_dict):
         """
         Description:
@@ -738,6 +913,10 @@ class grid(interface_elements.interface_element):
         """
         super().remove()
         status.grid_list = utility.remove_from_list(status.grid_list, self)
+        status.mode_partition.invalidate()
+        constants.effect_manager.unsubscribe(
+            "hide_grid_lines", self.update_grid_lines_hidden
+        )
 
 
 class mini_grid(grid):
@@ -814,6 +993,7 @@ class mini_grid(grid):
                     for current_image in current_mob.images:
                         if current_image.grid == self:
                             current_image.add_to_cell()
+            self.invalidate_terrain_surface()  # outer grid lines depend on which part of the attached grid is shown
 
     def get_main_grid_coordinates(self, mini_x, mini_y):
         """
@@ -870,10 +1050,10 @@ class mini_grid(grid):
         else:
             return False
 
-    def draw_grid_lines(self):
+    def bake_grid_lines(self):
         """
         Description:
-            Draws lines between grid cells and on the outside of the grid
+            Draws lines between grid cells and on the outside of the grid onto this grid's cached grid line layer
         Input:
             None
         Output:
@@ -903,53 +1083,47 @@ class mini_grid(grid):
         if not constants.effect_manager.effect_active("hide_grid_lines"):
 
             for x in range(0, self.coordinate_width + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((x, 0)),
-                    self.convert_coordinates((x, self.coordinate_height)),
+                self.bake_line(
+                    self.internal_line_color,
+                    (x, 0),
+                    (x, self.coordinate_height),
                     self.grid_line_width,
                 )
 
             for y in range(0, self.coordinate_height + 1):
-                pygame.draw.line(
-                    constants.game_display,
-                    constants.color_dict[self.internal_line_color],
-                    self.convert_coordinates((0, y)),
-                    self.convert_coordinates((self.coordinate_width, y)),
+                self.bake_line(
+                    self.internal_line_color,
+                    (0, y),
+                    (self.coordinate_width, y),
                     self.grid_line_width,
                 )
 
         for y in range(0, self.coordinate_height + 1):
-            pygame.draw.line(
-                constants.game_display,
-                constants.color_dict[self.external_line_color],
-                self.convert_coordinates((left_x, down_y)),
-                self.convert_coordinates((left_x, up_y)),
+            self.bake_line(
+                self.external_line_color,
+                (left_x, down_y),
+                (left_x, up_y),
                 self.grid_line_width + 1,
             )
 
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((left_x, up_y)),
-            self.convert_coordinates((right_x, up_y)),
+        self.bake_line(
+            self.external_line_color,
+            (left_x, up_y),
+            (right_x, up_y),
             self.grid_line_width + 1,
         )
 
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((right_x, up_y)),
-            self.convert_coordinates((right_x, down_y)),
+        self.bake_line(
+            self.external_line_color,
+            (right_x, up_y),
+            (right_x, down_y),
             self.grid_line_width + 1,
         )
 
-        pygame.draw.line(
-            constants.game_display,
-            constants.color_dict[self.external_line_color],
-            self.convert_coordinates((right_x, down_y)),
-            self.convert_coordinates((left_x, down_y)),
+        self.bake_line(
+            self.external_line_color,
+            (right_x, down_y),
+            (left_x, down_y),
             self.grid_line_width + 1,
         )
 
@@ -2,7 +2,7 @@
 
 from .labels import label
 from .buttons import button
-from ..util import scaling, text_utility
+from ..util import scaling, text_utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -111,13 +111,12 @@ class instructions_page(label):
             self.image.draw()
             for text_line_index in range(len(self.message)):
                 text_line = self.message[text_line_index]
-                constants.game_display.blit(
-                    text_utility.text(text_line, self.font),
-                    (
-                        self.x + 10,
-                        constants.display_height
-                        - (self.y + self.height - (text_line_index * self.font.size)),
-                    ),
+                drawing_utility.display_text(
+                    text_line,
+                    self.font,
+                    self.x + 10,
+                    constants.display_height
+                    - (self.y + self.height - text_line_index * self.font.size),
                 )
 
     def format_message(self):
@@ -36,10 +36,12 @@ class interface_element:
             0, constants.display_height - (self.height), self.width, self.height
         )
         self.showing = False
+        self.showing_version_key = None
         self.parent_collection = input_dict.get("parent_collection", "none")
         self.has_parent_collection = self.parent_collection != "none"
         if not self.has_parent_collection:
             status.independent_interface_elements.append(self)
+            status.mode_partition.invalidate()
 
         input_dict["coordinates"] = input_dict.get("coordinates", (0, 0))
         self.x, self.y = input_dict["coordinates"]
@@ -102,6 +104,7 @@ class interface_element:
             status.independent_interface_elements = utility.remove_from_list(
                 status.independent_interface_elements, self
             )
+            status.mode_partition.invalidate()
 
     def draw(self):
         """
@@ -133,6 +136,11 @@ class interface_element:
         """
         return self.showing and hasattr(self, "image")
 
+    showing_dependencies = [
+        "game_mode",
+        "interface",
+    ]  # state that can_show depends on, allowing its result to be reused until any of it changes - see visibility_tracker_template
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -175,10 +183,24 @@ class interface_element:
         self.Rect.x = self.x
         self.y = new_y
         self.Rect.y = constants.display_height - (self.y + self.height)
+        status.button_index.invalidate()
+        self.invalidate_layout()
         if self.has_parent_collection:
             self.x_offset = self.x - self.parent_collection.x
             self.y_offset = self.y - self.parent_collection.y
 
+    def invalidate_layout(self):
+        """
+        Description:
+            Records that this element was moved, resized, shown, or hidden, causing its parent collection, if any, to update its layout when next traversed
+        Input:
+            None
+        Output:
+            None
+        """
+        if self.has_parent_collection:
+            self.parent_collection.layout_outdated = True
+
     def set_modes(self, new_modes):
         """
         Description:
@@ -189,6 +211,8 @@ class interface_element:
             None
         """
         self.modes = new_modes
+        status.mode_partition.invalidate()
+        status.visibility_tracker.invalidate("interface")
 
     def calibrate(self, new_actor, override_exempt=False):
         """
@@ -307,6 +331,7 @@ class interface_collection(interface_element):
             None
         """
         self.members = []
+        self.layout_outdated = True
         self.minimized = False
         self.is_info_display = input_dict.get("is_info_display", False)
         if self.is_info_display:
@@ -446,6 +471,7 @@ class interface_collection(interface_element):
             status.independent_interface_elements = utility.remove_from_list(
                 status.independent_interface_elements, new_member
             )
+            status.mode_partition.invalidate()
         new_member.parent_collection = self
         if not "index" in member_config:
             self.members.append(new_member)
@@ -459,6 +485,8 @@ class interface_collection(interface_element):
 
         if member_config["calibrate_exempt"] and hasattr(self, "calibrate_exempt_list"):
             self.calibrate_exempt_list.append(new_member)
+        self.layout_outdated = True
+        status.visibility_tracker.invalidate("interface")
 
     def remove_member(self, removed_member):
         """
@@ -476,7 +504,10 @@ class interface_collection(interface_element):
         removed_member.parent_collection = "none"
         removed_member.has_parent_collection = False
         status.independent_interface_elements.append(removed_member)
+        status.mode_partition.invalidate()
+        self.layout_outdated = True
         self.members.remove(removed_member)
+        status.visibility_tracker.invalidate("interface")
 
     def remove_recursive(self, complete=False):
         """
@@ -518,6 +549,7 @@ class interface_collection(interface_element):
             None
         """
         super().set_origin(new_x, new_y)
+        self.layout_outdated = True
         for (
             member
         ) in (
@@ -552,6 +584,8 @@ class interface_collection(interface_element):
         """
         return self.showing
 
+    showing_dependencies = ["game_mode", "interface", "displayed"]
+
     def can_show(self, skip_parent_collection=False):
         """
         Description:
@@ -571,14 +605,42 @@ class interface_collection(interface_element):
             return result and not self.minimized
 
     def update_collection(self):
+        """
+        Description:
+            Updates this collection's layout if any of its members were added, removed, moved, resized, shown, or hidden, or this collection was moved, since its
+                layout was last updated
+        Input:
+            None
+        Output:
+            None
+        """
+        if self.layout_outdated:
+            self.update_layout()
+            self.layout_outdated = False  # cleared after updating, since moving members during the update would otherwise cause another update
+            status.layout_tracker.layouts += 1
+        else:
+            status.layout_tracker.skipped += 1
+
+    def update_layout(self):
+        """
+        Description:
+            Resizes this collection to contain each of its members, if it resizes with its contents
+        Input:
+            None
+        Output:
+            None
+        """
         if self.resize_with_contents:
             for member in self.members:
                 if hasattr(member, "members"):
                     member.update_collection()
             if len(self.member_rects) > 0:
+                old_rect = self.Rect.copy()
                 self.Rect.update(
                     self.member_rects[0].unionall(self.member_rects)
                 )  # self.Rect = self.member_rects[0].unionall(self.member_rects) #Rect.unionall(self.member_rects)
+                if self.Rect != old_rect:
+                    self.invalidate_layout()
                 if hasattr(self, "image"):
                     self.x = self.Rect.x
                     self.image.update_state(
@@ -864,7 +926,7 @@ class ordered_collection(interface_collection):
                 size += self.separation
         return size
 
-    def update_collection(self):
+    def update_layout(self):
         """
         Description:
             Changes locations of collection members to put all visible members in order while skipping hidden ones. Each overlapped element follows ordering logic but
@@ -874,7 +936,7 @@ class ordered_collection(interface_collection):
         Output:
             None
         """
-        super().update_collection()
+        super().update_layout()
         for key in self.second_dimension_coordinates:
             second_dimension_coordinate = int(key)
             if self.direction == "vertical":
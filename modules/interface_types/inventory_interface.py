@@ -4,6 +4,7 @@ import pygame
 from .interface_elements import ordered_collection
 from .buttons import button
 from ..util import (
+    drawing_utility,
     actor_utility,
     utility,
     main_loop_utility,
@@ -246,8 +247,7 @@ class item_icon(button):
         """
         if self.showing:
             if self == getattr(status, "displayed_" + self.actor_type):
-                pygame.draw.rect(
-                    constants.game_display,
+                drawing_utility.draw_rect(
                     constants.color_dict["bright green"],
                     self.outline,
                     width=2,
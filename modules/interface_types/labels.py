@@ -2,7 +2,7 @@
 
 import pygame
 from .buttons import button
-from ..util import scaling, text_utility, utility, market_utility
+from ..util import scaling, text_utility, utility, market_utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -55,6 +55,8 @@ class label(button):
         )
         self.image.width = self.width
         self.Rect.width = self.width
+        status.button_index.invalidate()
+        self.invalidate_layout()
         self.image.set_image(self.image.image_id)
         self.image.Rect = self.Rect
 
@@ -91,12 +93,11 @@ class label(button):
         """
         if self.showing:
             super().draw(allow_show_outline=False)
-            constants.game_display.blit(
-                text_utility.text(self.message, self.font),
-                (
-                    self.x + scaling.scale_width(10),
-                    constants.display_height - (self.y + self.height),
-                ),
+            drawing_utility.display_text(
+                self.message,
+                self.font,
+                self.x + scaling.scale_width(10),
+                constants.display_height - (self.y + self.height),
             )
 
 
@@ -430,6 +431,8 @@ class commodity_prices_label_template(label):
                 self.width = message_size + scaling.scale_width(20)
                 self.image.width = self.width
                 self.Rect.width = self.width
+                status.button_index.invalidate()
+                self.invalidate_layout()
                 self.image.set_image(self.image.image_id)  # update width scaling
                 self.image.Rect = self.Rect
 
@@ -446,13 +449,12 @@ class commodity_prices_label_template(label):
             self.image.draw()
             for text_line_index in range(len(self.message)):
                 text_line = self.message[text_line_index]
-                constants.game_display.blit(
-                    text_utility.text(text_line, self.font),
-                    (
-                        self.x + scaling.scale_width(10),
-                        constants.display_height
-                        - (self.y + self.height - (text_line_index * self.font.size)),
-                    ),
+                drawing_utility.display_text(
+                    text_line,
+                    self.font,
+                    self.x + scaling.scale_width(10),
+                    constants.display_height
+                    - (self.y + self.height - text_line_index * self.font.size),
                 )
 
     def update_tooltip(self):
@@ -509,13 +511,12 @@ class multi_line_label(label):
             self.image.draw()
             for text_line_index in range(len(self.message)):
                 text_line = self.message[text_line_index]
-                constants.game_display.blit(
-                    text_utility.text(text_line, self.font),
-                    (
-                        self.x + scaling.scale_width(10),
-                        constants.display_height
-                        - (self.y + self.height - (text_line_index * self.font.size)),
-                    ),
+                drawing_utility.display_text(
+                    text_line,
+                    self.font,
+                    self.x + scaling.scale_width(10),
+                    constants.display_height
+                    - (self.y + self.height - text_line_index * self.font.size),
                 )
 
     def update_tooltip(self):
@@ -592,4 +593,6 @@ class multi_line_label(label):
             self.width,
             self.height,
         )
+        status.button_index.invalidate()
+        self.invalidate_layout()
         self.image.update_state(self.x, self.y, self.width, self.height)
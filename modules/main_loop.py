@@ -4,6 +4,7 @@ import time
 import pygame
 from .util import (
     main_loop_utility,
+    drawing_utility,
     utility,
     text_utility,
     turn_management_utility,
@@ -24,30 +25,40 @@ def main_loop():
         None
     """
     while not flags.crashed:
+        if constants.frame_profiler:
+            constants.frame_profiler.start_frame()
+        constants.effect_manager.start_frame()
         if not flags.loading:
             main_loop_utility.update_display()
         else:
             main_loop_utility.draw_loading_screen()
         constants.input_manager.update_input()
-        for event in pygame.event.get():
+        if constants.frame_profiler:
+            constants.frame_profiler.start_phase("events")
+        events = pygame.event.get()
+        for event in events:
             flags.capital = flags.r_shift or flags.l_shift
             flags.ctrl = flags.r_ctrl or flags.l_ctrl
             match event.type:
                 case pygame.QUIT:
                     flags.crashed = True
+                case pygame.VIDEOEXPOSE | pygame.WINDOWEXPOSED:
+                    drawing_utility.request_full_display_update()
                 case pygame.KEYDOWN:
-                    for current_button in status.button_list:
-                        if (
-                            (
-                                current_button.showing
-                                or (
-                                    current_button.has_button_press_override
-                                    and current_button.button_press_override()
-                                )
-                            )
-                            and event.key == current_button.keybind_id
-                            and not flags.typing
+                    pressed_button = None
+                    if not flags.typing:
+                        for current_button in status.keybind_registry.get_buttons(
+                            event.key
                         ):
+                            if current_button.showing or (
+                                current_button.has_button_press_override
+                                and current_button.button_press_override()
+                            ):
+                                pressed_button = current_button
+                                break
+                    # Buttons without keybinds are never pressed by keys, so only bound buttons need to be reset
+                    for current_button in status.keybind_registry.bound_buttons:
+                        if current_button == pressed_button:
                             if (
                                 current_button.has_released
                             ):  # if stuck on loading, don't want multiple 'key down' events to repeat on_click - shouldn't on_click again until released
@@ -91,17 +102,17 @@ def main_loop():
                             ]
 
                 case pygame.KEYUP:
-                    for current_button in status.button_list:
-                        if (
-                            not flags.typing
-                            or current_button.keybind_id == pygame.K_TAB
-                            or current_button.keybind_id == pygame.K_e
+                    if (
+                        not flags.typing
+                        or event.key == pygame.K_TAB
+                        or event.key == pygame.K_e
+                    ):
+                        for current_button in status.keybind_registry.get_buttons(
+                            event.key
                         ):
-                            if current_button.has_keybind:
-                                if event.key == current_button.keybind_id:
-                                    current_button.on_release()
-                                    current_button.has_released = True
-                                    current_button.being_pressed = False
+                            current_button.on_release()
+                            current_button.has_released = True
+                            current_button.being_pressed = False
                     match event.key:
                         case pygame.K_RSHIFT:
                             flags.r_shift = False
@@ -140,11 +151,13 @@ def main_loop():
             if not flags.rmb_down:  # if user just released rmb
                 clicked_button = False
                 stopping = False
+                touched_buttons = status.button_index.get_buttons_at(
+                    pygame.mouse.get_pos()
+                )
                 if status.current_instructions_page == None:
-                    for current_button in status.button_list:  # here
+                    for current_button in touched_buttons:
                         if (
-                            current_button.touching_mouse()
-                            and current_button.showing
+                            current_button.showing
                             and (current_button.in_notification)
                             and not stopping
                         ):  # if notification, click before other buttons
@@ -162,8 +175,8 @@ def main_loop():
                         clicked_button = True
                         stopping = True
                 if not stopping:
-                    for current_button in status.button_list:
-                        if current_button.touching_mouse() and current_button.showing:
+                    for current_button in touched_buttons:
+                        if current_button.showing:
                             current_button.on_rmb_click()
                             current_button.on_rmb_release()
                             clicked_button = True
@@ -174,11 +187,13 @@ def main_loop():
                 clicked_button = False  # if any button, including a panel, is clicked, do not deselect units
                 allow_on_click = True  # certain buttons, like panels, allow clicking on another button at the same time
                 stopping = False
+                touched_buttons = status.button_index.get_buttons_at(
+                    pygame.mouse.get_pos()
+                )
                 if status.current_instructions_page == None:
-                    for current_button in status.button_list:  # here
+                    for current_button in touched_buttons:
                         if (
-                            current_button.touching_mouse()
-                            and current_button.showing
+                            current_button.showing
                             and (current_button.in_notification)
                             and not stopping
                         ):  # if notification, click before other buttons
@@ -200,11 +215,9 @@ def main_loop():
                         break
 
                 if not stopping:
-                    for current_button in status.button_list:
+                    for current_button in touched_buttons:
                         if (
-                            current_button.touching_mouse()
-                            and current_button.showing
-                            and allow_on_click
+                            current_button.showing and allow_on_click
                         ):  # only click 1 button at a time
                             if (
                                 current_button.on_click()
@@ -220,167 +233,45 @@ def main_loop():
                 )  # whether button was clicked or not determines whether characters are deselected
 
         if flags.lmb_down or flags.rmb_down:
-            for current_button in status.button_list:
-                if current_button.touching_mouse() and current_button.showing:
+            touched_buttons = status.button_index.get_buttons_at(pygame.mouse.get_pos())
+            for current_button in status.mode_partition.get_elements("buttons"):
+                if current_button in touched_buttons and current_button.showing:
                     current_button.showing_outline = True
                 elif not current_button.being_pressed:
                     current_button.showing_outline = False
         else:
-            for current_button in status.button_list:
+            for current_button in status.mode_partition.get_elements("buttons"):
                 if current_button.has_released:
                     current_button.showing_outline = False
+        if constants.frame_profiler:
+            constants.frame_profiler.end_phase("events")
 
         constants.current_time = time.time()
         if constants.current_time - constants.last_selection_outline_switch > 1:
             flags.show_selection_outlines = not flags.show_selection_outlines
             constants.last_selection_outline_switch = constants.current_time
+        if constants.frame_profiler:
+            constants.frame_profiler.start_phase("event_manager")
         constants.event_manager.update(constants.current_time)
+        if constants.frame_profiler:
+            constants.frame_profiler.end_phase("event_manager")
+            constants.frame_profiler.start_phase("enemy_turn")
         if (
             not flags.player_turn
             and constants.previous_turn_time + constants.end_turn_wait_time
             <= constants.current_time
         ):  # if enough time has passed based on delay from previous movement
-            enemy_turn_done = True
-            for enemy in status.npmob_list:
-                if not enemy.turn_done:
-                    enemy_turn_done = False
-                    break
-            if enemy_turn_done:
-                flags.player_turn = True
-                flags.enemy_combat_phase = True
-                turn_management_utility.manage_combat()
-            else:
-                current_enemy = status.enemy_turn_queue[0]
-                removed = False
-                spawning = False
-                did_nothing = False
-                moving = False
-                if (
-                    current_enemy.npmob_type == "native_warriors"
-                    and current_enemy.despawning
-                ):
-                    if (
-                        current_enemy == status.displayed_mob
-                        or not current_enemy.visible()
-                    ):
-                        current_enemy.remove_complete()
-                        removed = True
-
-                elif (
-                    current_enemy.npmob_type == "native_warriors"
-                    and current_enemy.creation_turn == constants.turn
-                ):  # if unit just created
-                    spawn_cell = current_enemy.grids[0].find_cell(
-                        current_enemy.x, current_enemy.y
-                    )
-                    if (status.minimap_grid.center_x, status.minimap_grid.center_y) == (
-                        current_enemy.x,
-                        current_enemy.y,
-                    ) and spawn_cell.visible:  # if camera just moved to spawn location to show spawning
-                        spawning = True
-                        current_enemy.show_images()
-                        current_enemy.select()
-                        current_enemy.attack_on_spawn()
-                        current_enemy.turn_done = True
-                    else:  # if camera did not move to spawn location
-                        spawning = True
-                        if (
-                            spawn_cell.visible
-                        ):  # if spawn location visible but camera hasn't moved there yet, move camera there
-                            status.minimap_grid.calibrate(
-                                current_enemy.x, current_enemy.y
-                            )
-                        else:  # if spawn location not visible, end turn
-                            current_enemy.show_images()
-                            current_enemy.turn_done = True
-
-                elif (
-                    not current_enemy.visible()
-                ):  # if not just spawned and hidden, do action without displaying
-                    current_enemy.end_turn_move()
-                    moving = True
-
-                elif (
-                    current_enemy == status.displayed_mob
-                ):  # if enemy is selected and did not just spawn, move it while minimap follows
-                    if (
-                        not current_enemy.creation_turn == constants.turn
-                    ):  # don't do anything on first turn, but still move camera to spawn location if visible
-                        current_enemy.end_turn_move()  # do_turn()
-                        moving = True
-                        if current_enemy.visible():
-                            if current_enemy != status.displayed_mob:
-                                current_enemy.select()
-                            else:
-                                status.minimap_grid.calibrate(
-                                    current_enemy.x, current_enemy.y
-                                )
-                    else:
-                        current_enemy.turn_done = True
-
-                if (
-                    (not (removed or spawning))
-                    and (not current_enemy.creation_turn == constants.turn)
-                    and current_enemy.visible()
-                ):  # if unit visible and not selected, start its turn
-                    if (
-                        current_enemy.npmob_type == "native_warriors"
-                        and current_enemy.find_closest_target() == "none"
-                        and not current_enemy.despawning
-                    ):  # if native warriors have no target, they stand still and no movement is shown
-                        did_nothing = True
-                        current_enemy.turn_done = True
-
-                    elif (
-                        current_enemy.npmob_type == "beast"
-                        and current_enemy.find_closest_target
-                        == current_enemy.images[0].current_cell
-                        and not current_enemy.images[0].current_cell.has_pmob()
-                    ):
-                        # if beasts stand still and don't attack anything, no movement is shown
-                        did_nothing = True
-                        current_enemy.turn_done = True
-                    elif (
-                        current_enemy.visible()
-                    ):  # if unit will do an action, move the camera to it and select it
-                        current_enemy.select()
-
-                elif (
-                    current_enemy.creation_turn == constants.turn and not spawning
-                ):  # if enemy visible but just spawned, end turn
-                    did_nothing = True
-                    current_enemy.turn_done = True
-
-                if removed:  # show unit despawning if visible
-                    current_enemy.turn_done = True
-                    if not current_enemy.visible():
-                        constants.end_turn_wait_time = 0
-                    else:
-                        constants.end_turn_wait_time = 1
-                    status.enemy_turn_queue.pop(0)
-
-                else:  # If unit visible, have short delay depending on action taken to let user see it
-                    if (not spawning) and (
-                        did_nothing or not current_enemy.visible()
-                    ):  # do not wait if not visible or nothing to show, exception for spawning units, which may not be visible as user watches them spawn
-                        constants.end_turn_wait_time = 0
-                    elif (
-                        spawning
-                        and not current_enemy.grids[0]
-                        .find_cell(current_enemy.x, current_enemy.y)
-                        .visible
-                    ):  # do not wait if spawning unit won't be visible even after it spawns
-                        constants.end_turn_wait_time = 0
-                    elif (
-                        moving and not enemy.turn_done
-                    ):  # if will move again after this
-                        constants.end_turn_wait_time = 0.25
-                    else:  # if done with turn
-                        constants.end_turn_wait_time = 0.5
-
-                    if current_enemy.turn_done:
-                        status.enemy_turn_queue.pop(0)
+            if (
+                turn_management_utility.manage_hidden_enemy_turn_steps() == 0
+            ):  # hidden steps are done all at once, while steps the player can see are done one per frame
+                turn_management_utility.manage_enemy_turn_step()
             if constants.effect_manager.effect_active("fast_turn"):
                 constants.end_turn_wait_time = 0
             constants.previous_turn_time = time.time()
+        if constants.frame_profiler:
+            constants.frame_profiler.end_phase("enemy_turn")
+            constants.frame_profiler.end_frame()
+        main_loop_utility.pace_frame(len(events) > 0)
+    if constants.frame_profiler:
+        constants.frame_profiler.save_csv()
     pygame.quit()
@@ -18,6 +18,7 @@ from modules.tools.data_managers import (
     notification_manager_template,
     value_tracker_template,
     achievement_manager_template,
+    frame_profiler_template,
 )
 from modules.action_types import (
     public_relations_campaign,
@@ -940,6 +941,11 @@ def value_trackers():
             }
         )
 
+    if constants.effect_manager.effect_active("profile_frames"):
+        constants.frame_profiler = frame_profiler_template.frame_profiler_template(
+            "profiles/frame_profile.csv", constants.frame_profile_window
+        )
+
     constants.actor_creation_manager.create_interface_element(
         {
             "coordinates": scaling.scale_coordinates(
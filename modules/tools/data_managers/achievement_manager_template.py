@@ -30,9 +30,11 @@ class achievement_manager_template:
         ]
         self.achievements: List[str] = []
         loaded_achievements = []
-        if os.path.exists(
-            "save_games/achievements.pickle"
-        ) and not constants.effect_manager.effect_active("reset_achievements"):
+        if (
+            os.path.exists("save_games/achievements.pickle")
+            and not constants.effect_manager.effect_active("reset_achievements")
+            and not constants.effect_manager.effect_active("disable_achievements")
+        ):
             with open("save_games/achievements.pickle", "rb") as file:
                 loaded_achievements = pickle.load(file)
         input_dict = {
@@ -75,6 +77,8 @@ class achievement_manager_template:
         Output:
             None
         """
+        if constants.effect_manager.effect_active("disable_achievements"):
+            return
         if (not achievement_type in self.achievements) or (
             achievement_type in self.victory_conditions
             and not achievement_type in flags.victories_this_game
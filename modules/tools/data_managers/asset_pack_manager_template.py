@@ -0,0 +1,196 @@
+import pygame
+import os
+import json
+import mmap
+import struct
+import modules.constants.constants as constants
+
+ASSET_PACK_HEADER = b"SFAPACK1"
+
+
+class asset_pack_manager_template:
+    """
+    Object that stores the decoded pixels of each image file in one asset pack file, allowing images to be loaded without decoding their image files each time the
+        game starts. Images whose files were changed since the asset pack was built are decoded from their files instead
+    """
+
+    def __init__(self, pack_path, source_folder):
+        """
+        Description:
+            Initializes this object, building a new asset pack if the existing one is missing or out of date
+        Input:
+            string pack_path: File path of the asset pack, like 'cache/asset_pack.dat'
+            string source_folder: Folder containing the image files to store in the asset pack, like 'graphics'
+        Output:
+            None
+        """
+        self.pack_path = pack_path
+        self.source_folder = source_folder
+        self.index = {}
+        self.pack_file = None
+        self.pack_data = None
+        self.data_start = 0
+        self.hits = 0
+        self.misses = 0
+        if (
+            constants.effect_manager.effect_active("rebuild_asset_pack")
+            or not self.open_pack()
+        ):
+            self.build_pack()
+            self.open_pack()
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Asset pack: "
+            + str(len(self.index))
+            + " images, "
+            + str(self.hits)
+            + " loaded from pack, "
+            + str(self.misses)
+            + " decoded from image files"
+        )
+
+    def get_source_mtimes(self):
+        """
+        Description:
+            Finds each image file in the source folder and when it was last modified
+        Input:
+            None
+        Output:
+            dictionary: Returns dictionary of string file path keys and float modification time values, like {'graphics/misc/title.png': 1650000000.0}
+        """
+        source_mtimes = {}
+        for folder, subfolders, files in os.walk(self.source_folder):
+            for file in files:
+                if file.endswith(".png"):
+                    file_path = os.path.join(folder, file).replace("\\", "/")
+                    source_mtimes[file_path] = os.path.getmtime(file_path)
+        return source_mtimes
+
+    def open_pack(self):
+        """
+        Description:
+            Opens the existing asset pack and reads its index, if it exists and matches the current image files
+        Input:
+            None
+        Output:
+            boolean: Returns True if the asset pack was opened, otherwise returns False
+        """
+        self.close_pack()
+        if not os.path.exists(self.pack_path):
+            return False
+        pack_file = open(self.pack_path, "rb")
+        try:
+            if pack_file.read(len(ASSET_PACK_HEADER)) != ASSET_PACK_HEADER:
+                raise ValueError("Invalid asset pack header")
+            (index_length,) = struct.unpack("<Q", pack_file.read(8))
+            index = json.loads(pack_file.read(index_length).decode("utf-8"))
+            source_mtimes = self.get_source_mtimes()
+            if source_mtimes.keys() != index.keys() or any(
+                index[file_path]["mtime"] != source_mtimes[file_path]
+                for file_path in source_mtimes
+            ):  # if any image files were added, removed, or modified since the asset pack was built
+                raise ValueError("Outdated asset pack")
+            self.pack_data = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.data_start = len(ASSET_PACK_HEADER) + 8 + index_length
+        except (ValueError, struct.error):
+            pack_file.close()
+            return False
+        self.pack_file = pack_file
+        self.index = index
+        return True
+
+    def close_pack(self):
+        """
+        Description:
+            Closes the currently open asset pack, if any
+        Input:
+            None
+        Output:
+            None
+        """
+        if self.pack_data:
+            self.pack_data.close()
+            self.pack_data = None
+        if self.pack_file:
+            self.pack_file.close()
+            self.pack_file = None
+        self.index = {}
+
+    def build_pack(self):
+        """
+        Description:
+            Decodes each image file in the source folder and writes their pixels to a new asset pack, along with an index of where each image's pixels are stored
+        Input:
+            None
+        Output:
+            None
+        """
+        self.close_pack()
+        index = {}
+        pixel_data = []
+        offset = 0
+        for file_path, mtime in self.get_source_mtimes().items():
+            try:
+                image = pygame.image.load(file_path)
+            except (
+                pygame.error
+            ):  # unreadable files are left to be decoded, and their errors reported, when loaded
+                index[file_path] = {"format": None, "mtime": mtime}
+                continue
+            if image.get_flags() & pygame.SRCALPHA or image.get_colorkey() != None:
+                pixel_format = "RGBA"
+            else:
+                pixel_format = "RGB"
+            pixels = pygame.image.tobytes(image, pixel_format)
+            index[file_path] = {
+                "offset": offset,
+                "length": len(pixels),
+                "size": image.get_size(),
+                "format": pixel_format,
+                "mtime": mtime,
+            }
+            pixel_data.append(pixels)
+            offset += len(pixels)
+        encoded_index = json.dumps(index).encode("utf-8")
+
+        pack_folder = os.path.dirname(self.pack_path)
+        if pack_folder:
+            os.makedirs(pack_folder, exist_ok=True)
+        temporary_path = self.pack_path + ".tmp"
+        with open(temporary_path, "wb") as pack_file:
+            pack_file.write(ASSET_PACK_HEADER)
+            pack_file.write(struct.pack("<Q", len(encoded_index)))
+            pack_file.write(encoded_index)
+            for pixels in pixel_data:
+                pack_file.write(pixels)
+        os.replace(temporary_path, self.pack_path)
+
+    def load_image(self, file_path):
+        """
+        Description:
+            Returns a Surface of the image at the inputted file path, reading its pixels from the asset pack if possible and otherwise decoding the image file
+        Input:
+            string file_path: File path of the image to load, like 'graphics/misc/title.png'
+        Output:
+            pygame.Surface: Returns a Surface of the requested image
+        """
+        entry = self.index.get(file_path, None)
+        if entry and entry["format"] and os.path.getmtime(file_path) == entry["mtime"]:
+            self.hits += 1
+            start = self.data_start + entry["offset"]
+            return pygame.image.frombytes(
+                self.pack_data[start : start + entry["length"]],
+                tuple(entry["size"]),
+                entry["format"],
+            )
+        self.misses += 1
+        return pygame.image.load(file_path)
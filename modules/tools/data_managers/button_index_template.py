@@ -0,0 +1,101 @@
+import modules.constants.constants as constants
+import modules.constants.status as status
+
+
+class button_index_template:
+    """
+    Object that sorts each showing button into the squares of a uniform grid covering the screen, allowing the buttons at a pixel to be found without checking every
+        button. Rebuilt when next used after any button is created, removed, moved, resized, shown, or hidden, or the game mode changes
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.squares = {}
+        self.outdated = True
+        self.rebuilds = 0
+        self.queries = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Button index: "
+            + str(len(self.squares))
+            + " occupied squares, "
+            + str(self.rebuilds)
+            + " rebuilds, "
+            + str(self.queries)
+            + " queries"
+        )
+
+    def invalidate(self):
+        """
+        Description:
+            Records that buttons were created, removed, moved, resized, shown, or hidden, causing this index to be rebuilt when next used
+        Input:
+            None
+        Output:
+            None
+        """
+        self.outdated = True
+
+    def rebuild(self):
+        """
+        Description:
+            Sorts each showing button of the current game mode into each grid square its Rect overlaps, keeping each square's buttons in the same order as
+                status.button_list
+        Input:
+            None
+        Output:
+            None
+        """
+        self.squares = {}
+        square_size = constants.button_index_square_size
+        for current_button in status.mode_partition.get_elements("buttons"):
+            if current_button.showing:
+                rect = current_button.Rect
+                for square_x in range(
+                    rect.left // square_size, (rect.right - 1) // square_size + 1
+                ):
+                    for square_y in range(
+                        rect.top // square_size, (rect.bottom - 1) // square_size + 1
+                    ):
+                        self.squares.setdefault((square_x, square_y), []).append(
+                            current_button
+                        )
+        self.outdated = False
+        self.rebuilds += 1
+
+    def get_buttons_at(self, position):
+        """
+        Description:
+            Returns each showing button touching the inputted pixel, in the same order as status.button_list
+        Input:
+            int tuple position: Two values representing the x and y pixel coordinates to check, like the mouse position
+        Output:
+            button list: Returns each showing button touching the inputted pixel
+        """
+        if self.outdated:
+            self.rebuild()
+        self.queries += 1
+        square_size = constants.button_index_square_size
+        return [
+            current_button
+            for current_button in self.squares.get(
+                (position[0] // square_size, position[1] // square_size), []
+            )
+            if current_button.Rect.collidepoint(position)
+        ]
@@ -1,10 +1,12 @@
 import json
 from .. import effects
+from ...util import utility
 
 
 class effect_manager_template:
     """
-    Object that controls global effects
+    Object that controls global effects. Keeps the number of active effects of each type, allowing effect_active to check a type without searching the active
+        effects, and notifies the functions subscribed to a type when it becomes active or inactive
     """
 
     def __init__(self):
@@ -18,6 +20,11 @@ class effect_manager_template:
         """
         self.possible_effects = []
         self.active_effects = []
+        self.effects_by_type = {}
+        self.active_type_counts = {}
+        self.subscribers = {}
+        self.lookup_counts = {}
+        self.previous_lookup_counts = {}
         file = open("configuration/release_config.json")
 
         # returns JSON object as a dictionary
@@ -63,8 +70,34 @@ class effect_manager_template:
         text = "Active effects: "
         for current_effect in self.active_effects:
             text += "\n    " + current_effect.__str__()
+        text += (
+            "\nEffect lookups last frame: "
+            + str(sum(self.previous_lookup_counts.values()))
+            + " "
+            + str(
+                dict(
+                    sorted(
+                        self.previous_lookup_counts.items(),
+                        key=lambda item: item[1],
+                        reverse=True,
+                    )
+                )
+            )
+        )
         return text
 
+    def start_frame(self):
+        """
+        Description:
+            Called at the start of each frame - records the previous frame's effect lookups and resets the counts for the new frame
+        Input:
+            None
+        Output:
+            None
+        """
+        self.previous_lookup_counts = self.lookup_counts
+        self.lookup_counts = {}
+
     def effect_active(self, effect_type):
         """
         Description:
@@ -74,10 +107,84 @@ class effect_manager_template:
         Output:
             boolean: Returns whether any effect of the inputted type is active
         """
-        for current_effect in self.active_effects:
-            if current_effect.effect_type == effect_type:
-                return True
-        return False
+        self.lookup_counts[effect_type] = self.lookup_counts.get(effect_type, 0) + 1
+        return effect_type in self.active_type_counts
+
+    def add_active_effect(self, current_effect):
+        """
+        Description:
+            Records that the inputted effect became active, notifying the subscribers of its type if no other effect of its type was active
+        Input:
+            effect current_effect: Effect that became active
+        Output:
+            None
+        """
+        self.active_effects.append(current_effect)
+        effect_type = current_effect.effect_type
+        self.active_type_counts[effect_type] = (
+            self.active_type_counts.get(effect_type, 0) + 1
+        )
+        if self.active_type_counts[effect_type] == 1:
+            self.notify(effect_type, True)
+
+    def remove_active_effect(self, current_effect):
+        """
+        Description:
+            Records that the inputted effect became inactive, notifying the subscribers of its type if no other effect of its type is active
+        Input:
+            effect current_effect: Effect that became inactive
+        Output:
+            None
+        """
+        self.active_effects = utility.remove_from_list(
+            self.active_effects, current_effect
+        )
+        effect_type = current_effect.effect_type
+        self.active_type_counts[effect_type] -= 1
+        if self.active_type_counts[effect_type] == 0:
+            del self.active_type_counts[effect_type]
+            self.notify(effect_type, False)
+
+    def subscribe(self, effect_type, function):
+        """
+        Description:
+            Causes the inputted function to be called whenever the inputted effect type becomes active or inactive, allowing values that depend on it to be
+                stored rather than checked each time they are used
+        Input:
+            string effect_type: Type of effect to subscribe to, like 'hide_grid_lines'
+            function function: Function to call with whether the effect type is now active
+        Output:
+            None
+        """
+        self.subscribers.setdefault(effect_type, []).append(function)
+
+    def unsubscribe(self, effect_type, function):
+        """
+        Description:
+            Stops calling the inputted function when the inputted effect type becomes active or inactive
+        Input:
+            string effect_type: Type of effect that was subscribed to
+            function function: Function that was subscribed
+        Output:
+            None
+        """
+        if effect_type in self.subscribers:
+            self.subscribers[effect_type] = utility.remove_from_list(
+                self.subscribers[effect_type], function
+            )
+
+    def notify(self, effect_type, new_status):
+        """
+        Description:
+            Calls each function subscribed to the inputted effect type with its new status
+        Input:
+            string effect_type: Type of effect that became active or inactive
+            boolean new_status: Whether the effect type is now active
+        Output:
+            None
+        """
+        for function in self.subscribers.get(effect_type, []):
+            function(new_status)
 
     def set_effect(self, effect_type, new_status):
         """
@@ -89,12 +196,11 @@ class effect_manager_template:
         Output:
             None
         """
-        for current_effect in self.possible_effects:
-            if current_effect.effect_type == effect_type:
-                if new_status == True:
-                    current_effect.apply()
-                else:
-                    current_effect.remove()
+        for current_effect in self.effects_by_type.get(effect_type, []):
+            if new_status == True:
+                current_effect.apply()
+            else:
+                current_effect.remove()
 
     def effect_exists(self, effect_type):
         """
@@ -105,7 +211,4 @@ class effect_manager_template:
         Output:
             boolean: Returns whether any effects of the inputted type exist
         """
-        for current_effect in self.possible_effects:
-            if current_effect.effect_type == effect_type:
-                return True
-        return False
+        return effect_type in self.effects_by_type
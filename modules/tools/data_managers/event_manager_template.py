@@ -1,10 +1,12 @@
+import heapq
 from ...constructs import events
 import modules.constants.constants as constants
 
 
 class event_manager_template:
     """
-    Object that tracks a list of events and calls the relevant functions once an inputted amount of time has passed
+    Object that tracks a set of events and calls the relevant functions once an inputted amount of time has passed. Events are kept in a heap ordered by the
+        absolute time they activate at, allowing each update to only check the events that are due
     """
 
     def __init__(self):
@@ -16,8 +18,9 @@ class event_manager_template:
         Output:
             None
         """
-        self.event_list = []
-        self.event_time_list = []
+        self.pending_events = set()
+        self.event_heap = []
+        self.num_events_added = 0
         self.previous_time = 0.0
 
     def add_event(self, function, inputs, activation_time):
@@ -31,7 +34,7 @@ class event_manager_template:
         Output:
             None
         """
-        self.event_list.append(events.event(function, inputs, activation_time, self))
+        self.schedule(events.event(function, inputs, activation_time, self))
 
     def add_repeating_event(self, function, inputs, activation_time, num_repeats=-1):
         """
@@ -44,10 +47,47 @@ class event_manager_template:
         Output:
             None
         """
-        self.event_list.append(
+        self.schedule(
             events.repeating_event(function, inputs, activation_time, self, num_repeats)
         )
 
+    def schedule(self, new_event):
+        """
+        Description:
+            Adds the inputted event to the heap, to activate once its activation time has passed since the most recent update
+        Input:
+            event new_event: Event to add
+        Output:
+            None
+        """
+        new_event.deadline = self.previous_time + new_event.activation_time
+        new_event.sequence_number = self.num_events_added
+        self.num_events_added += 1
+        self.pending_events.add(new_event)
+        heapq.heappush(
+            self.event_heap, (new_event.deadline, new_event.sequence_number, new_event)
+        )
+
+    def remove_event(self, removed_event):
+        """
+        Description:
+            Stops the inputted event before activation. Its heap entry is skipped when reached, and the heap is rebuilt without skipped entries once they make up
+                most of it
+        Input:
+            event removed_event: Event to remove
+        Output:
+            None
+        """
+        if removed_event in self.pending_events:
+            self.pending_events.remove(removed_event)
+            if len(self.event_heap) > 2 * len(self.pending_events) + 16:
+                self.event_heap = [
+                    heap_entry
+                    for heap_entry in self.event_heap
+                    if heap_entry[2] in self.pending_events
+                ]
+                heapq.heapify(self.event_heap)
+
     def update(self, new_time):
         """
         Description:
@@ -57,23 +97,20 @@ class event_manager_template:
         Output:
             None
         """
-        time_difference = new_time - self.previous_time
+        # Events added while activating, like the next repeat of a repeating event, are timed from the new time
+        self.previous_time = new_time
         activated_events = []
-        for current_event in self.event_list:
-            current_event.activation_time -= (
-                time_difference  # updates event times with new time
-            )
-            if (
-                current_event.activation_time <= 0
-            ):  # if any event runs out of time, activate it
+        while self.event_heap and self.event_heap[0][0] <= new_time:
+            current_event = heapq.heappop(self.event_heap)[2]
+            if current_event in self.pending_events:
                 activated_events.append(current_event)
-        if (
-            len(activated_events) > 0
-        ):  # when an event activates, call its stored function
-            for current_event in activated_events:
-                current_event.activate()
-                current_event.remove()
-        self.previous_time = new_time
+        if len(activated_events) > 1:  # activates events in the order they were added
+            activated_events.sort(
+                key=lambda current_event: current_event.sequence_number
+            )
+        for current_event in activated_events:
+            current_event.activate()
+            current_event.remove()
 
     def clear(self):
         """
@@ -84,11 +121,8 @@ class event_manager_template:
         Output:
             None
         """
-        existing_events = []
-        for current_event in self.event_list:
-            existing_events.append(current_event)
-        for current_event in existing_events:
-            current_event.remove()
+        self.pending_events = set()
+        self.event_heap = []
 
     def go(self):
         """
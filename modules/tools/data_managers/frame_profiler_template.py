@@ -0,0 +1,191 @@
+import time
+import os
+import csv
+from collections import deque
+import modules.constants.constants as constants
+from modules.util import drawing_utility
+
+FRAME_PHASES = [
+    "events",
+    "traversal",
+    "draw_list",
+    "tooltips",
+    "present",
+    "event_manager",
+    "enemy_turn",
+]
+
+
+class frame_profiler_template:
+    """
+    Object that times each phase of each frame of the main loop, keeping the times of recent frames to find rolling percentiles, show them in an overlay, and save them
+        to a CSV file
+    """
+
+    def __init__(self, csv_path, window_size):
+        """
+        Description:
+            Initializes this object
+        Input:
+            string csv_path: File path to save frame times to, like 'profiles/frame_profile.csv'
+            int window_size: Number of recent frames to keep times of
+        Output:
+            None
+        """
+        self.csv_path = csv_path
+        self.frame_times = deque(maxlen=window_size)
+        self.current_frame = dict.fromkeys(FRAME_PHASES, 0.0)
+        self.phase_start_times = {}
+        self.frame_start_time = time.perf_counter()
+        self.frame_count = 0
+        self.overlay_lines = []
+        self.last_overlay_update = 0.0
+
+    def start_phase(self, phase):
+        """
+        Description:
+            Starts timing the inputted phase of the current frame
+        Input:
+            string phase: Phase to time, like 'traversal'
+        Output:
+            None
+        """
+        self.phase_start_times[phase] = time.perf_counter()
+
+    def end_phase(self, phase):
+        """
+        Description:
+            Stops timing the inputted phase of the current frame, adding the time since it started to its time this frame - a phase can be timed multiple times in the
+                same frame
+        Input:
+            string phase: Phase to stop timing, like 'traversal'
+        Output:
+            None
+        """
+        start_time = self.phase_start_times.pop(phase)
+        self.current_frame[phase] += time.perf_counter() - start_time
+
+    def start_frame(self):
+        """
+        Description:
+            Starts timing the current frame, excluding any time spent since the last frame ended, like time spent waiting for the next frame
+        Input:
+            None
+        Output:
+            None
+        """
+        self.frame_start_time = time.perf_counter()
+
+    def end_frame(self):
+        """
+        Description:
+            Records the phase times and total time of the current frame, not including frame pacing
+        Input:
+            None
+        Output:
+            None
+        """
+        self.current_frame["total"] = time.perf_counter() - self.frame_start_time
+        self.frame_times.append(self.current_frame)
+        self.frame_count += 1
+        self.current_frame = dict.fromkeys(FRAME_PHASES, 0.0)
+
+    def get_percentiles(self, phase, percentiles=(50, 95, 99)):
+        """
+        Description:
+            Returns the inputted percentiles of the inputted phase's times over recent frames
+        Input:
+            string phase: Phase to find percentiles of, like 'traversal' or 'total'
+            int tuple percentiles=(50, 95, 99): Percentiles to find
+        Output:
+            float list: Returns the time in seconds at each inputted percentile, or 0 for each if no frames have been recorded
+        """
+        phase_times = sorted(frame[phase] for frame in self.frame_times)
+        if not phase_times:
+            return [0.0 for percentile in percentiles]
+        return [
+            phase_times[
+                min(len(phase_times) - 1, (len(phase_times) * percentile) // 100)
+            ]
+            for percentile in percentiles
+        ]
+
+    def update_overlay(self):
+        """
+        Description:
+            Updates the text of the overlay with the current percentiles of each phase's time, in milliseconds
+        Input:
+            None
+        Output:
+            None
+        """
+        self.overlay_lines = [
+            "Frame times (ms)  p50 / p95 / p99",
+        ]
+        for phase in FRAME_PHASES + ["total"]:
+            self.overlay_lines.append(
+                phase
+                + ": "
+                + " / ".join(
+                    str(round(phase_time * 1000, 2))
+                    for phase_time in self.get_percentiles(phase)
+                )
+            )
+
+    def draw(self):
+        """
+        Description:
+            Draws the overlay at the top right of the screen, updating its text once per second
+        Input:
+            None
+        Output:
+            None
+        """
+        current_time = time.time()
+        if current_time > self.last_overlay_update + 1:
+            self.update_overlay()
+            self.last_overlay_update = current_time
+        font = constants.fonts["default"]
+        width = max(font.calculate_size(line) for line in self.overlay_lines) + 10
+        height = font.size * len(self.overlay_lines) + 10
+        x = constants.display_width - width
+        drawing_utility.draw_rect(constants.color_dict["white"], (x, 0, width, height))
+        for line_index, line in enumerate(self.overlay_lines):
+            drawing_utility.display_image(
+                font.pygame_font.render(line, False, constants.color_dict["black"]),
+                x + 5,
+                5 + font.size * line_index,
+                signature=("text", line, font),
+            )
+
+    def save_csv(self):
+        """
+        Description:
+            Saves the phase times of each recent frame to this object's CSV file, in milliseconds, along with the percentiles of each phase
+        Input:
+            None
+        Output:
+            None
+        """
+        csv_folder = os.path.dirname(self.csv_path)
+        if csv_folder:
+            os.makedirs(csv_folder, exist_ok=True)
+        columns = FRAME_PHASES + ["total"]
+        first_frame = self.frame_count - len(self.frame_times)
+        with open(self.csv_path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["frame"] + columns)
+            for frame_index, frame in enumerate(self.frame_times):
+                writer.writerow(
+                    [first_frame + frame_index]
+                    + [round(frame[phase] * 1000, 4) for phase in columns]
+                )
+            for percentile in (50, 95, 99):
+                writer.writerow(
+                    ["p" + str(percentile)]
+                    + [
+                        round(self.get_percentiles(phase, (percentile,))[0] * 1000, 4)
+                        for phase in columns
+                    ]
+                )
+        print("Saved frame times to " + self.csv_path)
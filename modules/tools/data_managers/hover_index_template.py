@@ -0,0 +1,158 @@
+import pygame
+import modules.constants.status as status
+
+
+class hover_index_template:
+    """
+    Object that finds the objects whose tooltips can be shown at the mouse's position, asking the grids which cells are under the mouse and the button index which
+        buttons are under the mouse rather than checking every object. Results are reused until the mouse moves or anything drawn before the tooltips changes
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.tooltip_drawers = []
+        self.mouse_position = None
+        self.scene_records = None
+        self.recomputes = 0
+        self.queries = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Hover index: "
+            + str(len(self.tooltip_drawers))
+            + " tooltip drawers, "
+            + str(self.recomputes)
+            + " recomputes, "
+            + str(self.queries)
+            + " queries"
+        )
+
+    def get_tooltip_drawers(self):
+        """
+        Description:
+            Returns the objects whose tooltips can be shown at the mouse's position, finding them again only if the mouse moved or the draws recorded so far this frame
+                differ from those recorded before the last search, like from a unit moving or a button appearing
+        Input:
+            None
+        Output:
+            object list: Returns the objects whose tooltips can be shown, in the order their tooltips should be drawn
+        """
+        self.queries += 1
+        mouse_position = pygame.mouse.get_pos()
+        if (
+            mouse_position != self.mouse_position
+            or status.frame_draw_records != self.scene_records
+        ):
+            self.tooltip_drawers = self.find_tooltip_drawers(mouse_position)
+            self.mouse_position = mouse_position
+            self.scene_records = status.frame_draw_records.copy()
+            self.recomputes += 1
+        return self.tooltip_drawers
+
+    def find_tooltip_drawers(self, mouse_position):
+        """
+        Description:
+            Finds the objects whose tooltips can be shown at the inputted position. Mobs are shown first, with the mobs of each tile in the order they are stacked,
+                followed by buildings and then tiles. A showing button's tooltip replaces all actor tooltips, and the tooltip of a button in a notification or a free
+                image replaces all others
+        Input:
+            int tuple mouse_position: Two values representing the x and y pixel coordinates of the mouse
+        Output:
+            object list: Returns the objects whose tooltips can be shown, in the order their tooltips should be drawn
+        """
+        mouse_x, mouse_y = mouse_position
+        hovered_cells = []
+        for current_grid in status.mode_partition.get_elements("grids"):
+            hovered_cells += current_grid.get_cells_at_pixel(mouse_x, mouse_y)
+
+        checked_mobs = set()
+        # Mobs are grouped by the cell of their first image, which stacks them in the same order on each grid
+        mob_groups = {}
+        for current_cell in hovered_cells:
+            for current_mob in current_cell.contained_mobs:
+                if not current_mob in checked_mobs:
+                    checked_mobs.add(current_mob)
+                    if current_mob.can_show_tooltip():
+                        mob_groups.setdefault(
+                            current_mob.images[0].current_cell, []
+                        ).append(current_mob)
+        group_cells = list(mob_groups)
+        if len(group_cells) > 1:  # groups are ordered by their first mob in mob_list
+            group_cells.sort(
+                key=lambda group_cell: min(
+                    status.mob_list.index(current_mob)
+                    for current_mob in mob_groups[group_cell]
+                )
+            )
+        tooltip_drawers = []
+        for group_cell in group_cells:
+            hovered_mobs = mob_groups[group_cell]
+            for same_tile_mob in group_cell.contained_mobs:
+                if (
+                    same_tile_mob in hovered_mobs
+                    and not same_tile_mob in tooltip_drawers
+                ):
+                    tooltip_drawers.append(same_tile_mob)
+
+        hovered_buildings = []
+        hovered_tiles = []
+        for current_cell in hovered_cells:
+            building_cells = [current_cell]
+            if current_cell.tile != "none":
+                if (
+                    not current_cell.tile in hovered_tiles
+                    and current_cell.tile.can_show_tooltip()
+                ):
+                    hovered_tiles.append(current_cell.tile)
+                equivalent_tile = current_cell.tile.get_equivalent_tile()
+                if (
+                    equivalent_tile != "none"
+                ):  # buildings are also hovered through their tile's equivalent on the minimap
+                    building_cells.append(equivalent_tile.cell)
+            for building_cell in building_cells:
+                for current_building in building_cell.contained_buildings.values():
+                    if (
+                        current_building != "none"
+                        and not current_building in hovered_buildings
+                        and current_building.can_show_tooltip()
+                    ):
+                        hovered_buildings.append(current_building)
+        if len(hovered_buildings) > 1:
+            hovered_buildings.sort(key=status.building_list.index)
+        if len(hovered_tiles) > 1:
+            hovered_tiles.sort(key=status.actor_list.index)
+        tooltip_drawers += hovered_buildings + hovered_tiles
+
+        notification_tooltip_button = None
+        for current_button in status.button_index.get_buttons_at(mouse_position):
+            if current_button.can_show_tooltip():
+                if (
+                    current_button.in_notification
+                    and current_button != status.current_instructions_page
+                ):
+                    notification_tooltip_button = current_button
+                else:
+                    tooltip_drawers = [current_button]
+
+        if notification_tooltip_button:
+            tooltip_drawers = [notification_tooltip_button]
+        else:
+            for current_free_image in status.mode_partition.get_elements("free_images"):
+                if current_free_image.can_show_tooltip():
+                    tooltip_drawers = [current_free_image]
+        return tooltip_drawers
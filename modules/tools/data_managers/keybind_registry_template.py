@@ -0,0 +1,81 @@
+from ...util import utility
+
+
+class keybind_registry_template:
+    """
+    Object that records the buttons bound to each key, allowing key presses to be handled without checking every button
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.bound_buttons = []
+        self.buttons_by_key = {}
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Keybind registry: "
+            + str(len(self.bound_buttons))
+            + " buttons bound to "
+            + str(len(self.buttons_by_key))
+            + " keys"
+        )
+
+    def register(self, new_button):
+        """
+        Description:
+            Records the inputted button as bound to its keybind. Buttons are registered as they are created, keeping each list in the same order as status.button_list
+        Input:
+            button new_button: Button with a keybind to record
+        Output:
+            None
+        """
+        self.bound_buttons.append(new_button)
+        self.buttons_by_key.setdefault(new_button.keybind_id, []).append(new_button)
+
+    def unregister(self, removed_button):
+        """
+        Description:
+            Stops recording the inputted button as bound to its keybind. Lists are replaced rather than modified, allowing a button to be removed while the buttons
+                bound to a key are being iterated through
+        Input:
+            button removed_button: Button to stop recording
+        Output:
+            None
+        """
+        self.bound_buttons = utility.remove_from_list(
+            self.bound_buttons, removed_button
+        )
+        if removed_button.keybind_id in self.buttons_by_key:
+            remaining_buttons = utility.remove_from_list(
+                self.buttons_by_key[removed_button.keybind_id], removed_button
+            )
+            if remaining_buttons:
+                self.buttons_by_key[removed_button.keybind_id] = remaining_buttons
+            else:
+                del self.buttons_by_key[removed_button.keybind_id]
+
+    def get_buttons(self, key):
+        """
+        Description:
+            Returns each button bound to the inputted key, in the same order as status.button_list
+        Input:
+            pygame key object key: Key to find the buttons of, like pygame.K_n
+        Output:
+            button list: Returns each button bound to the inputted key
+        """
+        return self.buttons_by_key.get(key, [])
@@ -0,0 +1,54 @@
+class layout_tracker_template:
+    """
+    Object that counts how many interface collections updated or reused their layouts each frame - a collection only updates its layout when its members were
+        added, removed, moved, resized, shown, or hidden, or it was moved, since its layout was last updated
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.layouts = 0
+        self.skipped = 0
+        self.previous_layouts = 0
+        self.previous_skipped = 0
+        self.total_layouts = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Layout tracker: "
+            + str(self.previous_layouts)
+            + " layouts updated and "
+            + str(self.previous_skipped)
+            + " skipped last frame, "
+            + str(self.total_layouts)
+            + " layouts updated in total"
+        )
+
+    def start_frame(self):
+        """
+        Description:
+            Called once per frame before the interface traversal - records the previous frame's counts and resets the counts for the new frame
+        Input:
+            None
+        Output:
+            None
+        """
+        self.previous_layouts = self.layouts
+        self.previous_skipped = self.skipped
+        self.total_layouts += self.layouts
+        self.layouts = 0
+        self.skipped = 0
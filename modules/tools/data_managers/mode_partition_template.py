@@ -0,0 +1,155 @@
+import modules.constants.constants as constants
+import modules.constants.status as status
+
+
+class mode_partition_template:
+    """
+    Object that sorts the independent interface elements, buttons, free images, and grids by the game modes they can appear in, allowing the interface traversal,
+        hit-testing, and tooltip searches to only check those that can appear in the current game mode. Sorted again when next used after any of these are
+        created, removed, or have their modes changed
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.partitions = {}
+        self.outdated = True
+        self.hiding_interface_elements = []
+        self.rebuilds = 0
+        self.swaps = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Mode partition: "
+            + str(len(self.get_elements("interface_elements")))
+            + " of "
+            + str(len(status.independent_interface_elements))
+            + " independent interface elements in the current game mode, "
+            + str(self.rebuilds)
+            + " rebuilds, "
+            + str(self.swaps)
+            + " swaps"
+        )
+
+    def invalidate(self):
+        """
+        Description:
+            Records that independent interface elements, buttons, free images, or grids were created, removed, or had their modes changed, causing this object to
+                sort them again when next used
+        Input:
+            None
+        Output:
+            None
+        """
+        self.outdated = True
+
+    def rebuild(self):
+        """
+        Description:
+            Sorts each independent interface element, button, free image, and grid into the partition of each game mode it can appear in, keeping each partition
+                in the same order as the list it was sorted from. Independent interface elements still showing that left the current game mode's partition are
+                traversed once more so that they can be hidden
+        Input:
+            None
+        Output:
+            None
+        """
+        previous_elements = self.partitions.get(constants.current_game_mode, {}).get(
+            "interface_elements", []
+        )
+        self.partitions = {}
+        for kind, elements in [
+            ("interface_elements", status.independent_interface_elements),
+            ("buttons", status.button_list),
+            ("free_images", status.free_image_list),
+            ("grids", status.grid_list),
+        ]:
+            for current_element in elements:
+                for game_mode in set(current_element.modes):
+                    self.partitions.setdefault(game_mode, {}).setdefault(
+                        kind, []
+                    ).append(current_element)
+        self.outdated = False
+        self.rebuilds += 1
+
+        current_elements = self.get_elements("interface_elements")
+        for current_element in previous_elements:
+            if (
+                current_element.showing
+                and not current_element in current_elements
+                and current_element in status.independent_interface_elements
+            ):
+                self.hiding_interface_elements.append(current_element)
+
+    def swap(self, previous_game_mode):
+        """
+        Description:
+            Called when the game mode changes - each independent interface element of the previous game mode is traversed once more so that it can be hidden, and
+                anything sorted by whether it is showing is sorted again
+        Input:
+            string previous_game_mode: Game mode that was switched from, like 'strategic'
+        Output:
+            None
+        """
+        self.hiding_interface_elements += self.get_elements(
+            "interface_elements", previous_game_mode
+        )
+        status.button_index.invalidate()
+        self.swaps += 1
+
+    def get_elements(self, kind, game_mode=None):
+        """
+        Description:
+            Returns the objects of the inputted kind that can appear in the inputted game mode
+        Input:
+            string kind: Kind of object to return - 'interface_elements' for independent interface elements, 'buttons', 'free_images', or 'grids'
+            string game_mode=None: Game mode to return the objects of, defaulting to the current game mode
+        Output:
+            list: Returns the objects of the inputted kind that can appear in the inputted game mode, in the same order as the list they were sorted from
+        """
+        if self.outdated:
+            self.rebuild()
+        if game_mode == None:
+            game_mode = constants.current_game_mode
+        return self.partitions.get(game_mode, {}).get(kind, [])
+
+    def get_traversal_roots(self):
+        """
+        Description:
+            Returns the independent interface elements to traverse this frame - those of the current game mode, along with any from other game modes that need to
+                be hidden. The full_visibility_traversal effect traverses every independent interface element instead
+        Input:
+            None
+        Output:
+            interface_element list: Returns the independent interface elements to traverse this frame
+        """
+        if constants.effect_manager.effect_active("full_visibility_traversal"):
+            self.hiding_interface_elements = []
+            return status.independent_interface_elements
+        current_elements = self.get_elements("interface_elements")
+        if self.hiding_interface_elements:
+            hiding_elements = []
+            for current_element in self.hiding_interface_elements:
+                if (
+                    not current_element in hiding_elements
+                    and not current_element in current_elements
+                    and current_element in status.independent_interface_elements
+                ):
+                    hiding_elements.append(current_element)
+            self.hiding_interface_elements = []
+            return hiding_elements + current_elements
+        return current_elements
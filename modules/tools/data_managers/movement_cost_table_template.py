@@ -0,0 +1,142 @@
+import weakref
+import modules.constants.constants as constants
+
+
+class movement_cost_table_template:
+    """
+    Object that finds the costs of moving between cells, which each cell records in its movement_costs dictionary for each direction and movement profile - the
+        combination of a mob's movement abilities and movement values that the cost depends on. Each cost is found when first needed and found again only after a
+        cell at either end of its movement has its terrain, visibility, or buildings changed
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.recorded_grids = (
+            weakref.WeakSet()
+        )  # grids with recorded costs, not keeping grids of previous games alive
+        self.misses = 0
+        self.invalidations = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Movement cost table: "
+            + str(self.misses)
+            + " costs found, "
+            + str(self.invalidations)
+            + " cell invalidations"
+        )
+
+    def get_key(self, current_mob, direction):
+        """
+        Description:
+            Returns the key that a cell records the cost of the inputted mob moving from it in the inputted direction with - mobs with the same movement profile share
+                recorded costs. mob.get_movement_cost builds the same key without calling this, as it is used for every lookup
+        Input:
+            mob current_mob: Mob that would move
+            string direction: Direction the mob would move in, like 'left', or 'none' if not moving to another cell
+        Output:
+            tuple: Returns the direction followed by whether the mob is a pmob, can swim in rivers, can walk, can explore, and can swim in the ocean, and its
+                default movement cost and maximum movement points
+        """
+        return (
+            direction,
+            current_mob.is_pmob,
+            current_mob.can_swim_river,
+            current_mob.can_walk,
+            current_mob.can_explore,
+            current_mob.can_swim_ocean,
+            current_mob.movement_cost,
+            current_mob.max_movement_points,
+        )
+
+    def invalidate_cell(self, cell):
+        """
+        Description:
+            Causes the movement costs of moving from or into the inputted cell to be found again when next needed - called whenever a cell's terrain, visibility, or
+                buildings change
+        Input:
+            cell cell: Cell whose terrain, visibility, or buildings changed
+        Output:
+            None
+        """
+        if not cell.grid in self.recorded_grids:
+            return  # skips grids that mobs have not moved on, like the minimap grid, whose cells are often changed to copy other cells
+        self.invalidations += 1
+        cell.movement_costs.clear()
+        for adjacent_cell in cell.adjacent_cells.values():
+            if adjacent_cell:
+                adjacent_cell.movement_costs.clear()
+
+    def find_movement_cost(self, current_mob, local_cell, direction):
+        """
+        Description:
+            Finds the cost in movement points for the inputted mob to move from the inputted cell in the inputted direction, based on the terrain, visibility, and
+                infrastructure of the cells moved between, and records it in the cell moved from
+        Input:
+            mob current_mob: Mob that would move
+            cell local_cell: Cell the mob would move from
+            string direction: Direction the mob would move in, like 'left', or 'none' if not moving to another cell
+        Output:
+            double: Returns how many movement points would be spent by the movement
+        """
+        self.misses += 1
+        self.recorded_grids.add(local_cell.grid)
+        cost = current_mob.movement_cost
+        if direction == "none":
+            adjacent_cell = local_cell
+        else:
+            adjacent_cell = local_cell.adjacent_cells[direction]
+
+        if adjacent_cell:
+            cost = cost * constants.terrain_movement_cost_dict[adjacent_cell.terrain]
+            if current_mob.is_pmob:
+                local_infrastructure = local_cell.get_intact_building("infrastructure")
+                adjacent_infrastructure = adjacent_cell.get_intact_building(
+                    "infrastructure"
+                )
+                if local_cell.has_walking_connection(adjacent_cell):
+                    if not (
+                        local_infrastructure == "none"
+                        or adjacent_infrastructure == "none"
+                    ):  # if both have infrastructure and connected by land or bridge, use discount
+                        # don't count adjacent ferry as road, but allow ferry in tile to count as road for moving to adjacent tiles
+                        if not (
+                            adjacent_infrastructure != "none"
+                            and adjacent_infrastructure.infrastructure_type == "ferry"
+                        ):
+                            cost = cost / 2
+                    # otherwise, use default cost but not full cost (no canoe penantly)
+                    if (  # if entering a ferry without canoes - if using canoes, ignore ferry
+                        adjacent_infrastructure != "none"
+                        and adjacent_infrastructure.infrastructure_type == "ferry"
+                        and not current_mob.can_swim_river
+                    ):
+                        cost = 2
+                elif (
+                    adjacent_cell.terrain == "water"
+                    and adjacent_cell.y > 0
+                    and (current_mob.can_walk and not current_mob.can_swim_river)
+                    or adjacent_cell.terrain_features.get("cataract", False)
+                ):  # elif river w/o canoes
+                    cost = current_mob.max_movement_points
+                if (not adjacent_cell.visible) and current_mob.can_explore:
+                    cost = current_mob.movement_cost
+            if local_cell.y == 0 and not current_mob.can_swim_ocean:
+                cost = current_mob.max_movement_points
+        local_cell.movement_costs[self.get_key(current_mob, direction)] = cost
+        return cost
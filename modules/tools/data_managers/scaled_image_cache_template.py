@@ -0,0 +1,174 @@
+import pygame
+import os
+import shutil
+import struct
+import hashlib
+import modules.constants.constants as constants
+
+SCALED_IMAGE_HEADER = b"SFASCL1"
+
+
+class scaled_image_cache_template:
+    """
+    Object that saves scaled versions of image files to disk for the current display resolution, allowing later launches at the same resolution to load already scaled
+        images rather than scaling them again
+    """
+
+    def __init__(self, cache_folder, resolution):
+        """
+        Description:
+            Initializes this object, clearing the saved images for the current resolution if the rebuild_scaled_image_cache effect is active
+        Input:
+            string cache_folder: Folder to save scaled images in, like 'cache/scaled_images'
+            int tuple resolution: Two values representing the pixel width and height of the display
+        Output:
+            None
+        """
+        self.resolution_folder = os.path.join(
+            cache_folder, str(int(resolution[0])) + "x" + str(int(resolution[1]))
+        )
+        if constants.effect_manager.effect_active("rebuild_scaled_image_cache"):
+            shutil.rmtree(self.resolution_folder, ignore_errors=True)
+        os.makedirs(self.resolution_folder, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        num_files, num_bytes = self.get_size()
+        return (
+            "Scaled image disk cache ("
+            + os.path.basename(self.resolution_folder)
+            + "): "
+            + str(num_files)
+            + " images, "
+            + str(round(num_bytes / 1048576, 2))
+            + " MB, "
+            + str(self.hits)
+            + " hits, "
+            + str(self.misses)
+            + " misses"
+        )
+
+    def get_size(self):
+        """
+        Description:
+            Returns the number of scaled images saved for the current resolution and their total size on disk
+        Input:
+            None
+        Output:
+            int: Returns the number of saved scaled images
+            int: Returns the total bytes of the saved scaled images
+        """
+        num_files = 0
+        num_bytes = 0
+        for file in os.listdir(self.resolution_folder):
+            num_files += 1
+            num_bytes += os.path.getsize(os.path.join(self.resolution_folder, file))
+        return (num_files, num_bytes)
+
+    def get_source_path(self, scaled_key):
+        """
+        Description:
+            Returns the file path of the image file that the inputted scaled image was created from, or None if it was not created from an image file, like for text
+        Input:
+            tuple scaled_key: Key of a scaled image, starting with the loaded image's key, like ('graphics/mobs/default.png(255, 0, 0)', 50, 50, False)
+        Output:
+            string/None: Returns the file path of the image file the inputted scaled image was created from, if any
+        """
+        source_key = scaled_key[0]
+        if isinstance(source_key, str) and ".png" in source_key:
+            return source_key[: source_key.index(".png") + len(".png")]
+        return None
+
+    def get_file_path(self, scaled_key):
+        """
+        Description:
+            Returns the file path to save the inputted scaled image at
+        Input:
+            tuple scaled_key: Key of a scaled image
+        Output:
+            string: Returns the file path to save the inputted scaled image at
+        """
+        return os.path.join(
+            self.resolution_folder,
+            hashlib.sha1(repr(scaled_key).encode("utf-8")).hexdigest() + ".dat",
+        )
+
+    def load(self, scaled_key):
+        """
+        Description:
+            Returns the saved scaled image with the inputted key, if it exists and its image file was not changed after it was saved
+        Input:
+            tuple scaled_key: Key of a scaled image, like ('graphics/mobs/default.png', 50, 50, False)
+        Output:
+            pygame.Surface/None: Returns the saved scaled image, or None if it could not be loaded
+        """
+        source_path = self.get_source_path(scaled_key)
+        if not source_path:
+            return None
+        file_path = self.get_file_path(scaled_key)
+        if not os.path.exists(file_path):
+            self.misses += 1
+            return None
+        with open(file_path, "rb") as file:
+            contents = file.read()
+        header_length = len(SCALED_IMAGE_HEADER) + struct.calcsize("<dII4s")
+        if contents[: len(SCALED_IMAGE_HEADER)] != SCALED_IMAGE_HEADER:
+            self.misses += 1
+            return None
+        mtime, width, height, pixel_format = struct.unpack(
+            "<dII4s", contents[len(SCALED_IMAGE_HEADER) : header_length]
+        )
+        if (
+            mtime != os.path.getmtime(source_path) or width == 0 or height == 0
+        ):  # empty images can not be loaded from bytes, so they are scaled again
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pygame.image.frombytes(
+            contents[header_length:],
+            (width, height),
+            pixel_format.decode("utf-8").strip(),
+        )
+
+    def save(self, scaled_key, scaled_image):
+        """
+        Description:
+            Saves the inputted scaled image to disk, if it was created from an image file and is not empty
+        Input:
+            tuple scaled_key: Key of the scaled image, like ('graphics/mobs/default.png', 50, 50, False)
+            pygame.Surface scaled_image: Scaled image to save
+        Output:
+            None
+        """
+        source_path = self.get_source_path(scaled_key)
+        if not source_path or 0 in scaled_image.get_size():
+            return
+        if (
+            scaled_image.get_flags() & pygame.SRCALPHA
+            or scaled_image.get_colorkey() != None
+        ):
+            pixel_format = "RGBA"
+        else:
+            pixel_format = "RGB"
+        width, height = scaled_image.get_size()
+        with open(self.get_file_path(scaled_key), "wb") as file:
+            file.write(SCALED_IMAGE_HEADER)
+            file.write(
+                struct.pack(
+                    "<dII4s",
+                    os.path.getmtime(source_path),
+                    width,
+                    height,
+                    pixel_format.ljust(4).encode("utf-8"),
+                )
+            )
+            file.write(pygame.image.tobytes(scaled_image, pixel_format))
@@ -0,0 +1,190 @@
+from collections import OrderedDict
+import modules.constants.constants as constants
+
+
+class surface_cache_template:
+    """
+    Object that stores Surfaces under keys describing their contents, allowing identical Surfaces to be shared rather than re-created and discarding the least recently
+        used Surfaces once full
+    """
+
+    def __init__(self, name, max_entries_key=None, max_bytes_key=None):
+        """
+        Description:
+            Initializes this object
+        Input:
+            string name: Name of this cache, used when printed
+            string max_entries_key=None: Key used to access the maximum number of Surfaces this cache can hold in constants, or None if there is no maximum
+            string max_bytes_key=None: Key used to access the maximum estimated bytes of Surfaces this cache can hold in constants, or None if there is no maximum
+        Output:
+            None
+        """
+        self.name = name
+        self.max_entries_key = max_entries_key
+        self.max_bytes_key = max_bytes_key
+        self.surfaces = OrderedDict()
+        self.surface_bytes = {}
+        self.total_bytes = 0
+        self.pinned_keys = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            self.name
+            + ": "
+            + str(len(self.surfaces))
+            + " entries, "
+            + str(round(self.total_bytes / 1048576, 2))
+            + " MB, "
+            + str(len(self.pinned_keys))
+            + " pinned, "
+            + str(self.hits)
+            + " hits, "
+            + str(self.misses)
+            + " misses, "
+            + str(round(self.get_hit_rate() * 100, 1))
+            + "% hit rate"
+        )
+
+    def get_hit_rate(self):
+        """
+        Description:
+            Returns the fraction of lookups in this cache that found a Surface
+        Input:
+            None
+        Output:
+            float: Returns the fraction of lookups in this cache that found a Surface, or 0 if there have been no lookups
+        """
+        if self.hits + self.misses == 0:
+            return 0.0
+        return self.hits / (self.hits + self.misses)
+
+    def __contains__(self, key):
+        """
+        Description:
+            Returns whether this cache holds a Surface for the inputted key, without affecting its hit/miss counts or eviction order
+        Input:
+            hashable key: Key to check for
+        Output:
+            boolean: Returns whether this cache holds a Surface for the inputted key
+        """
+        return key in self.surfaces
+
+    def get(self, key):
+        """
+        Description:
+            Returns the Surface stored under the inputted key, marking it as recently used, or None if this cache has no such Surface
+        Input:
+            hashable key: Key describing the contents of the requested Surface
+        Output:
+            pygame.Surface/None: Returns the Surface stored under the inputted key, or None if this cache has no such Surface
+        """
+        surface = self.surfaces.get(key, None)
+        if surface == None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def set(self, key, surface, pinned=False):
+        """
+        Description:
+            Stores the inputted Surface under the inputted key, discarding the least recently used Surfaces if this cache is full
+        Input:
+            hashable key: Key describing the contents of the inputted Surface
+            pygame.Surface surface: Surface to store
+            boolean pinned=False: Whether the Surface should never be discarded, like for core interface images
+        Output:
+            None
+        """
+        if key in self.surfaces:
+            self.remove(key)
+        self.surfaces[key] = surface
+        self.surface_bytes[key] = (
+            surface.get_width() * surface.get_height() * surface.get_bytesize()
+        )
+        self.total_bytes += self.surface_bytes[key]
+        if pinned:
+            self.pinned_keys.add(key)
+        self.evict()
+
+    def evict(self):
+        """
+        Description:
+            Discards the least recently used unpinned Surfaces until this cache is within its maximum number of entries and bytes, always keeping the most recently used
+                Surface
+        Input:
+            None
+        Output:
+            None
+        """
+        if not self.over_budget(len(self.surfaces), self.total_bytes):
+            return
+        most_recent_key = next(reversed(self.surfaces))
+        evicted_keys = []
+        num_entries = len(self.surfaces)
+        num_bytes = self.total_bytes
+        for key in self.surfaces:
+            if key == most_recent_key or not self.over_budget(num_entries, num_bytes):
+                break
+            if not key in self.pinned_keys:
+                evicted_keys.append(key)
+                num_entries -= 1
+                num_bytes -= self.surface_bytes[key]
+        for key in evicted_keys:
+            self.remove(key)
+
+    def over_budget(self, num_entries, num_bytes):
+        """
+        Description:
+            Returns whether a cache holding the inputted number of entries and bytes would be over this cache's maximum number of entries or bytes
+        Input:
+            int num_entries: Number of entries to check
+            int num_bytes: Estimated bytes to check
+        Output:
+            boolean: Returns whether the inputted number of entries or bytes is over this cache's maximum
+        """
+        if self.max_entries_key and num_entries > getattr(
+            constants, self.max_entries_key
+        ):
+            return True
+        if self.max_bytes_key and num_bytes > getattr(constants, self.max_bytes_key):
+            return True
+        return False
+
+    def remove(self, key):
+        """
+        Description:
+            Removes the Surface stored under the inputted key from this cache
+        Input:
+            hashable key: Key of the Surface to remove
+        Output:
+            None
+        """
+        del self.surfaces[key]
+        self.total_bytes -= self.surface_bytes.pop(key)
+        self.pinned_keys.discard(key)
+
+    def clear(self):
+        """
+        Description:
+            Removes all Surfaces from this cache
+        Input:
+            None
+        Output:
+            None
+        """
+        self.surfaces.clear()
+        self.surface_bytes.clear()
+        self.total_bytes = 0
+        self.pinned_keys.clear()
@@ -0,0 +1,230 @@
+from collections import deque
+import modules.constants.status as status
+
+
+class target_distance_field_template:
+    """
+    Object that records, for each cell of a grid, the distance to the closest pmob or building that npmobs can target, along with the targets in each cell,
+        allowing npmobs to find their closest targets without measuring the distance to every pmob and building. Built again when first used each enemy turn and
+        after targets are created, or when a cell loses its last target - targets that are damaged, removed, moved, or hidden in vehicles, groups, or buildings
+        otherwise update it in place
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.grid = None
+        self.distances = []
+        self.targets_by_cell = {}
+        self.target_cells = {}
+        self.outdated = True
+        self.rebuilds = 0
+        self.updates = 0
+        self.lookups = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Target distance field: "
+            + str(len(self.target_cells))
+            + " targets, "
+            + str(self.rebuilds)
+            + " rebuilds, "
+            + str(self.updates)
+            + " updates, "
+            + str(self.lookups)
+            + " lookups"
+        )
+
+    def invalidate(self):
+        """
+        Description:
+            Records that targets may have been created or changed in ways this object was not told about, causing it to be built again when next used
+        Input:
+            None
+        Output:
+            None
+        """
+        self.outdated = True
+
+    def is_target(self, possible_target):
+        """
+        Description:
+            Returns whether the inputted pmob or building can be targeted by npmobs on this object's grid - buildings must be intact and able to be damaged, pmobs
+                must not be in a vehicle, group, or building, and units in the ocean are ignored
+        Input:
+            pmob/building possible_target: Pmob or building to check
+        Output:
+            boolean: Returns whether the inputted pmob or building can be targeted
+        """
+        if possible_target.actor_type == "building":
+            if not (possible_target.can_damage() and not possible_target.damaged):
+                return False
+        elif (
+            possible_target.in_vehicle
+            or possible_target.in_group
+            or possible_target.in_building
+        ):
+            return False
+        return (
+            not possible_target.y == 0
+            and self.grid in possible_target.grids
+            and 0 <= possible_target.x < self.grid.coordinate_width
+            and 0 <= possible_target.y < self.grid.coordinate_height
+        )
+
+    def rebuild(self, grid):
+        """
+        Description:
+            Finds each target on the inputted grid and records the distance from each of the grid's cells to the closest target, spreading outward from every target
+                at once
+        Input:
+            grid grid: Grid to find the distances on
+        Output:
+            None
+        """
+        self.grid = grid
+        self.targets_by_cell = {}
+        self.target_cells = {}
+        self.distances = [
+            [-1] * grid.coordinate_height for _ in range(grid.coordinate_width)
+        ]
+        for possible_target in status.building_list + status.pmob_list:
+            if self.is_target(possible_target):
+                self.record_target(possible_target)
+        self.spread(list(self.targets_by_cell))
+        self.outdated = False
+        self.rebuilds += 1
+
+    def record_target(self, target):
+        """
+        Description:
+            Records the inputted target as being in the cell at its coordinates
+        Input:
+            pmob/building target: Target to record
+        Output:
+            None
+        """
+        coordinates = (target.x, target.y)
+        self.targets_by_cell.setdefault(coordinates, []).append(target)
+        self.target_cells[target] = coordinates
+
+    def spread(self, source_coordinates):
+        """
+        Description:
+            Sets the distance of each inputted cell to 0 and updates the distances of any cells that are closer to them than to any previously recorded target
+        Input:
+            int tuple list source_coordinates: Coordinates of cells containing targets
+        Output:
+            None
+        """
+        frontier = deque()
+        for x, y in source_coordinates:
+            if self.distances[x][y] != 0:
+                self.distances[x][y] = 0
+                frontier.append((x, y))
+        while frontier:
+            x, y = frontier.popleft()
+            adjacent_distance = self.distances[x][y] + 1
+            for adjacent_x, adjacent_y in [
+                (x - 1, y),
+                (x + 1, y),
+                (x, y - 1),
+                (x, y + 1),
+            ]:
+                if (
+                    0 <= adjacent_x < self.grid.coordinate_width
+                    and 0 <= adjacent_y < self.grid.coordinate_height
+                ):
+                    current_distance = self.distances[adjacent_x][adjacent_y]
+                    if current_distance == -1 or current_distance > adjacent_distance:
+                        self.distances[adjacent_x][adjacent_y] = adjacent_distance
+                        frontier.append((adjacent_x, adjacent_y))
+
+    def remove_target(self, target):
+        """
+        Description:
+            Called when a target dies or otherwise stops being a target - removes it from its cell. If no targets remain in the cell, the distances around it may
+                have increased, so this object is built again when next used
+        Input:
+            pmob/building target: Target to remove
+        Output:
+            None
+        """
+        if self.outdated or not target in self.target_cells:
+            return
+        coordinates = self.target_cells.pop(target)
+        cell_targets = self.targets_by_cell[coordinates]
+        cell_targets.remove(target)
+        if not cell_targets:
+            del self.targets_by_cell[coordinates]
+            self.invalidate()
+        self.updates += 1
+
+    def update_target(self, possible_target):
+        """
+        Description:
+            Called when a pmob moves, enters or leaves a vehicle, group, or building, or when a building is damaged or repaired - records the inputted pmob or
+                building in the cell it is now in if it can be targeted, only updating the distances that became shorter
+        Input:
+            pmob/building possible_target: Pmob or building that changed
+        Output:
+            None
+        """
+        self.remove_target(possible_target)
+        if self.outdated or not self.is_target(possible_target):
+            return
+        self.record_target(possible_target)
+        self.spread([(possible_target.x, possible_target.y)])
+        self.updates += 1
+
+    def get_closest_targets(self, npmob):
+        """
+        Description:
+            Returns each target on the inputted npmob's grid that is as close as possible to it and within its aggro distance. The distance to the closest targets
+                is read from the npmob's cell, and only the cells at that distance are searched for them
+        Input:
+            npmob npmob: Npmob to find the closest targets of
+        Output:
+            pmob/building list: Returns the closest targets, with buildings before pmobs and each in the order of its list, or an empty list if none are in range
+        """
+        if self.outdated or self.grid != npmob.grids[0]:
+            self.rebuild(npmob.grids[0])
+        self.lookups += 1
+        if not (
+            0 <= npmob.x < self.grid.coordinate_width
+            and 0 <= npmob.y < self.grid.coordinate_height
+        ):
+            return []
+        distance = self.distances[npmob.x][npmob.y]
+        if distance == -1 or distance > npmob.aggro_distance:
+            return []
+        closest_targets = []
+        for x_offset in range(-1 * distance, distance + 1):
+            y_offset = distance - abs(x_offset)
+            for current_y_offset in set([y_offset, -1 * y_offset]):
+                closest_targets += self.targets_by_cell.get(
+                    (npmob.x + x_offset, npmob.y + current_y_offset), []
+                )
+        if len(closest_targets) > 1:
+            closest_targets.sort(
+                key=lambda current_target: (
+                    (0, status.building_list.index(current_target))
+                    if current_target.actor_type == "building"
+                    else (1, status.pmob_list.index(current_target))
+                )
+            )
+        return closest_targets
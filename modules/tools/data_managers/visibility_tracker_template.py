@@ -0,0 +1,133 @@
+import modules.constants.constants as constants
+import modules.constants.status as status
+import modules.constants.flags as flags
+
+
+class visibility_tracker_template:
+    """
+    Object that records versions of the state that interface elements' can_show functions depend on, allowing the interface traversal to reuse an element's showing
+        value until something it depends on changes. An interface element class declares its dependencies with a showing_dependencies list defined alongside its
+        can_show function, using the names below - classes whose can_show function has no showing_dependencies list are checked every frame
+            'game_mode': The current game mode
+            'displayed': The displayed mob, tile, minister, or country, or the information shown about them
+            'interface': The members, tabs, and minimized state of interface collections
+            'flags': Any value in the flags module
+            'money': The player's money
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.versions = {
+            "game_mode": 0,
+            "displayed": 0,
+            "interface": 0,
+            "flags": 0,
+            "money": 0,
+        }
+        self.current_values = {}
+        self.class_dependencies = {}
+        self.recomputed = 0
+        self.reused = 0
+        self.mismatches = 0
+
+    def __str__(self):
+        """
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        """
+        return (
+            "Visibility tracker: "
+            + str(self.recomputed)
+            + " can_show calls and "
+            + str(self.reused)
+            + " reused showing values last frame, "
+            + str(self.mismatches)
+            + " mismatches found by full traversal, versions "
+            + str(self.versions)
+        )
+
+    def invalidate(self, dependency):
+        """
+        Description:
+            Records that the inputted state changed, causing each element that depends on it to call can_show again
+        Input:
+            string dependency: Name of the state that changed, like 'displayed'
+        Output:
+            None
+        """
+        self.versions[dependency] += 1
+
+    def update(self):
+        """
+        Description:
+            Called once per frame before the interface traversal - records a new version of any tracked state whose value changed since the previous frame, and resets
+                the per-frame counters
+        Input:
+            None
+        Output:
+            None
+        """
+        new_values = {
+            "game_mode": constants.current_game_mode,
+            "displayed": (
+                status.displayed_mob,
+                status.displayed_tile,
+                status.displayed_minister,
+                status.displayed_country,
+            ),
+            "flags": tuple(
+                value for value in vars(flags).values() if type(value) == bool
+            ),
+            "money": constants.money,
+        }
+        for dependency, value in new_values.items():
+            if self.current_values.get(dependency, None) != value:
+                self.current_values[dependency] = value
+                self.invalidate(dependency)
+        self.recomputed = 0
+        self.reused = 0
+
+    def get_dependencies(self, current_element):
+        """
+        Description:
+            Returns the showing_dependencies list of the class that defines the inputted element's can_show function. A list inherited from a parent class is not used
+                if the element's class replaces the parent's can_show function without declaring its own dependencies
+        Input:
+            interface_element current_element: Element to find the dependencies of
+        Output:
+            string list: Returns the names of the state the element's can_show function depends on, or None if it should be called every frame
+        """
+        if getattr(current_element, "can_show_override", "none") != "none":
+            return None  # showing is decided by another element's can_show
+        element_class = type(current_element)
+        if not element_class in self.class_dependencies:
+            self.class_dependencies[element_class] = None
+            for current_class in element_class.__mro__:
+                if "can_show" in current_class.__dict__:
+                    self.class_dependencies[element_class] = current_class.__dict__.get(
+                        "showing_dependencies", None
+                    )
+                    break
+        return self.class_dependencies[element_class]
+
+    def get_version_key(self, dependencies):
+        """
+        Description:
+            Returns the current versions of the inputted dependencies, which will differ from any previous result if any of them have changed since
+        Input:
+            string list dependencies: Names of the state to find the versions of
+        Output:
+            int tuple: Returns the current version of each inputted dependency
+        """
+        return tuple(self.versions[dependency] for dependency in dependencies)
@@ -1,7 +1,5 @@
 # Contains functionality for global effects
 
-from ..util import utility
-
 
 class effect:
     def __init__(self, effect_id, effect_type, effect_manager):
@@ -20,6 +18,7 @@ class effect:
 
         self.effect_id = effect_id
         self.effect_type = effect_type
+        self.effect_manager.effects_by_type.setdefault(effect_type, []).append(self)
         # eventually add int/string duration: Duration of effect in turns, or 'none' if infinite/conditional
 
     def __str__(self):
@@ -44,7 +43,7 @@ class effect:
             None
         """
         if not self in self.effect_manager.active_effects:
-            self.effect_manager.active_effects.append(self)
+            self.effect_manager.add_active_effect(self)
 
     def remove(self):
         """
@@ -56,6 +55,4 @@ class effect:
             None
         """
         if self in self.effect_manager.active_effects:
-            self.effect_manager.active_effects = utility.remove_from_list(
-                self.effect_manager.active_effects, self
-            )
+            self.effect_manager.remove_active_effect(self)
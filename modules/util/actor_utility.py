@@ -495,6 +495,7 @@ def calibrate_actor_info_display(info_display, new_actor, override_exempt=False)
     """
     if new_actor == "none":
         print(0 / 0)
+    status.visibility_tracker.invalidate("displayed")
     if info_display == status.tile_info_display:
         for current_same_tile_icon in status.same_tile_icon_list:
             current_same_tile_icon.reset()
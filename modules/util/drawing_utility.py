@@ -1,7 +1,11 @@
 # Contains functions that control the display of images
 
+import bisect
 import pygame
+from . import text_utility
 import modules.constants.constants as constants
+import modules.constants.status as status
+import modules.constants.flags as flags
 
 
 def rect_to_surface(rect):
@@ -16,7 +20,101 @@ def rect_to_surface(rect):
     return pygame.Surface((rect.width, rect.height))
 
 
-def display_image(image, x, y):
+def scale_image(image, width, height, smooth=False):
+    """
+    Description:
+        Returns a copy of the inputted image scaled to the inputted size
+    Input:
+        pygame.Surface image: Image to scale
+        int width: Pixel width of the scaled image
+        int height: Pixel height of the scaled image
+        boolean smooth=False: Whether to use smooth scaling, which looks better for large size changes but is slower - only possible for 24 and 32 bit images
+    Output:
+        pygame.Surface: Returns a scaled copy of the inputted image
+    """
+    if smooth and image.get_bitsize() in [24, 32]:
+        return pygame.transform.smoothscale(image, (width, height))
+    else:
+        return pygame.transform.scale(image, (width, height))
+
+
+def replace_colors(image, color_replacements):
+    """
+    Description:
+        Replaces each pixel of the inputted image that has a certain color with another color, preserving the alpha value of each pixel. Replacements are done in order,
+            so a pixel changed by one replacement can be changed again by a later one
+    Input:
+        pygame.Surface image: Image to modify
+        tuple list color_replacements: List of (original, replacement) tuples, with each original and replacement being an RGB color like (255, 0, 0)
+    Output:
+        None
+    """
+    if image.get_bitsize() in [24, 32]:
+        for original_color, replacement_color in color_replacements:
+            matching_pixels = pygame.mask.from_threshold(
+                image,
+                (original_color[0], original_color[1], original_color[2], 128),
+                (1, 1, 1, 255),
+            )  # matches red, green, and blue exactly with any alpha value
+            if matching_pixels.count() == 0:
+                continue
+            image.blit(
+                matching_pixels.to_surface(
+                    setcolor=(0, 0, 0, 255), unsetcolor=(255, 255, 255, 255)
+                ),
+                (0, 0),
+                special_flags=pygame.BLEND_RGB_MULT,
+            )  # clears red, green, and blue of matching pixels - RGB blend modes leave alpha unchanged
+            image.blit(
+                matching_pixels.to_surface(
+                    setcolor=(
+                        replacement_color[0],
+                        replacement_color[1],
+                        replacement_color[2],
+                        255,
+                    ),
+                    unsetcolor=(0, 0, 0, 255),
+                ),
+                (0, 0),
+                special_flags=pygame.BLEND_RGB_ADD,
+            )  # adds replacement color to cleared pixels
+    else:
+        width, height = image.get_size()
+        for original_color, replacement_color in color_replacements:
+            for x in range(width):
+                for y in range(height):
+                    current_color = image.get_at((x, y))
+                    if (
+                        current_color[0] == original_color[0]
+                        and current_color[1] == original_color[1]
+                        and current_color[2] == original_color[2]
+                    ):
+                        image.set_at(
+                            (x, y),
+                            (
+                                replacement_color[0],
+                                replacement_color[1],
+                                replacement_color[2],
+                                current_color[3],
+                            ),
+                        )  # preserves alpha value
+
+
+def record_draw(signature, rect):
+    """
+    Description:
+        Records that the inputted screen area was drawn to this frame, allowing the areas that changed since the previous frame to be found at the end of the frame
+    Input:
+        object signature: Hashable description of what was drawn, like an image Surface or a text/color tuple - identical draws across frames should have identical
+            signatures
+        pygame.Rect rect: Area of the screen that was drawn to
+    Output:
+        None
+    """
+    status.frame_draw_records.append((signature, (rect.x, rect.y, rect.w, rect.h)))
+
+
+def display_image(image, x, y, signature=None):
     """
     Description:
         Draws the inputted image at the inputted coordinates
@@ -24,10 +122,31 @@ def display_image(image, x, y):
         pygame.image image: Image to be displayed
         int x: Pixel x coordinate at which to display the image
         int y: Pixel y coordinate at which to display the image
+        object signature=None: Optional description of the drawn image to use for dirty rect tracking instead of the image itself, like when a Surface is re-rendered each
+            frame or modified in place
     Output:
         None
     """
-    constants.game_display.blit(image, (x, y))
+    if signature == None:
+        signature = image
+    record_draw(signature, constants.game_display.blit(image, (x, y)))
+
+
+def display_text(message, font, x, y):
+    """
+    Description:
+        Renders and draws the inputted text at the inputted coordinates
+    Input:
+        string message: Text to display
+        font font: Constructs font with which the text is rendered
+        int x: Pixel x coordinate at which to display the text
+        int y: Pixel y coordinate at which to display the text
+    Output:
+        None
+    """
+    display_image(
+        text_utility.text(message, font), x, y, signature=("text", message, font)
+    )
 
 
 def display_image_angle(image, x, y, angle):
@@ -45,4 +164,199 @@ def display_image_angle(image, x, y, angle):
     topleft = (x, y)
     rotated_image = pygame.transform.rotate(image, angle)
     new_rect = rotated_image.get_rect(center=image.get_rect(topleft=topleft).center)
-    constants.game_display.blit(rotated_image, new_rect.topleft)
+    display_image(
+        rotated_image, new_rect.x, new_rect.y, signature=("angle", image, angle)
+    )
+
+
+def draw_rect(color, rect, width=0):
+    """
+    Description:
+        Draws a rectangle of the inputted color on the screen
+    Input:
+        int tuple color: RGB color of the rectangle, like (255, 255, 255)
+        pygame.Rect/int tuple rect: Area of the rectangle
+        int width=0: Width of the rectangle's outline, or 0 to fill the rectangle
+    Output:
+        None
+    """
+    drawn_rect = pygame.draw.rect(constants.game_display, color, rect, width)
+    record_draw(("rect", tuple(color), width), drawn_rect)
+
+
+def draw_line(color, start_pos, end_pos, width=1):
+    """
+    Description:
+        Draws a line of the inputted color on the screen
+    Input:
+        int tuple color: RGB color of the line, like (255, 255, 255)
+        int tuple start_pos: Two values representing x and y pixel coordinates of one end of the line
+        int tuple end_pos: Two values representing x and y pixel coordinates of the other end of the line
+        int width=1: Pixel width of the line
+    Output:
+        None
+    """
+    drawn_rect = pygame.draw.line(
+        constants.game_display, color, start_pos, end_pos, width
+    )
+    record_draw(
+        ("line", tuple(color), tuple(start_pos), tuple(end_pos), width), drawn_rect
+    )
+
+
+def request_full_display_update():
+    """
+    Description:
+        Causes the entire screen to be presented at the end of the current frame, regardless of which areas changed - used when the previous contents of the
+            window can't be trusted, like after a game mode change or the window being uncovered
+    Input:
+        None
+    Output:
+        None
+    """
+    flags.full_display_update = True
+
+
+def find_reordered_records(current_records, previous_records):
+    """
+    Description:
+        Returns draws that happened on both inputted frames but in a different order relative to other draws that happened on both. The longest sequence of draws
+            that kept their order is left out, so each pair of draws that switched order has at least one draw returned - any area where a pair overlaps is within
+            the returned draw's area
+    Input:
+        tuple list current_records: Draw records of the current frame, as recorded by record_draw
+        tuple list previous_records: Draw records of the previous frame
+    Output:
+        tuple list: Returns the draw records that were drawn in a different order
+    """
+    previous_indexes = {}
+    occurrences = {}
+    for previous_index, previous_record in enumerate(previous_records):
+        occurrence = occurrences.get(previous_record, 0)
+        occurrences[previous_record] = occurrence + 1
+        previous_indexes[(previous_record, occurrence)] = previous_index
+
+    matched_records = (
+        []
+    )  # (previous index, record) of each draw also on the previous frame, in the current frame's order
+    occurrences = {}
+    for current_record in current_records:
+        occurrence = occurrences.get(current_record, 0)
+        occurrences[current_record] = occurrence + 1
+        previous_index = previous_indexes.get((current_record, occurrence), None)
+        if previous_index != None:
+            matched_records.append((previous_index, current_record))
+
+    run_ends = (
+        []
+    )  # run_ends[length - 1] is the smallest previous index ending an increasing run of that length
+    run_end_positions = []
+    predecessors = []
+    for position, (previous_index, current_record) in enumerate(matched_records):
+        length = bisect.bisect_left(run_ends, previous_index)
+        if length == len(run_ends):
+            run_ends.append(previous_index)
+            run_end_positions.append(position)
+        else:
+            run_ends[length] = previous_index
+            run_end_positions[length] = position
+        if length > 0:
+            predecessors.append(run_end_positions[length - 1])
+        else:
+            predecessors.append(-1)
+
+    in_order_positions = set()
+    if run_end_positions:
+        position = run_end_positions[-1]
+        while position != -1:
+            in_order_positions.add(position)
+            position = predecessors[position]
+    return [
+        current_record
+        for position, (previous_index, current_record) in enumerate(matched_records)
+        if not position in in_order_positions
+    ]
+
+
+def get_dirty_rects():
+    """
+    Description:
+        Compares the draws recorded this frame to those of the previous frame, finding each area of the screen whose contents may have changed. Draws that happened
+            identically in the same order on both frames are skipped, while the old and new areas of any draw that appeared, disappeared, changed, or was drawn in a
+            different order relative to other draws are returned
+    Input:
+        None
+    Output:
+        pygame.Rect list: Returns list of screen areas that need to be presented
+    """
+    current_records = status.frame_draw_records
+    previous_records = status.previous_frame_draw_records
+    if current_records == previous_records:
+        return []
+
+    start_index = 0  # skips unchanged draws at the beginning and end of each frame, like the background image and mouse follower
+    max_start_index = min(len(current_records), len(previous_records))
+    while (
+        start_index < max_start_index
+        and current_records[start_index] == previous_records[start_index]
+    ):
+        start_index += 1
+    current_end_index = len(current_records)
+    previous_end_index = len(previous_records)
+    while (
+        current_end_index > start_index
+        and previous_end_index > start_index
+        and current_records[current_end_index - 1]
+        == previous_records[previous_end_index - 1]
+    ):
+        current_end_index -= 1
+        previous_end_index -= 1
+    current_changed = current_records[start_index:current_end_index]
+    previous_changed = previous_records[start_index:previous_end_index]
+
+    unmatched_counts = {}
+    for current_record in current_changed:
+        unmatched_counts[current_record] = unmatched_counts.get(current_record, 0) + 1
+    for previous_record in previous_changed:
+        unmatched_counts[previous_record] = unmatched_counts.get(previous_record, 0) - 1
+    changed_records = [
+        current_record
+        for current_record in unmatched_counts
+        if unmatched_counts[current_record] != 0
+    ]
+    changed_records += find_reordered_records(
+        current_changed, previous_changed
+    )  # draws that happened on both frames but in a different order relative to other draws could have changed what is shown where they overlap
+
+    dirty_rects = []
+    screen_rect = constants.game_display.get_rect()
+    for signature, area in changed_records:
+        dirty_rect = pygame.Rect(area).clip(screen_rect)
+        if dirty_rect.width > 0 and dirty_rect.height > 0:
+            dirty_rects.append(dirty_rect)
+    return dirty_rects
+
+
+def update_display():
+    """
+    Description:
+        Presents the frame drawn to the screen. If dirty rect rendering is enabled, only areas that changed since the previous frame are presented, unless a full update was
+            requested or too much of the screen changed for a partial update to be worthwhile
+    Input:
+        None
+    Output:
+        None
+    """
+    if flags.full_display_update or not constants.effect_manager.effect_active(
+        "dirty_rect_rendering"
+    ):
+        pygame.display.update()
+    else:
+        dirty_rects = get_dirty_rects()
+        if len(dirty_rects) > constants.max_dirty_rects:
+            pygame.display.update()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+    flags.full_display_update = False
+    status.previous_frame_draw_records = status.frame_draw_records
+    status.frame_draw_records = []
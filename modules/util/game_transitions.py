@@ -1,7 +1,14 @@
 # Contains functions used when switching between parts of the game, like loading screen display
 
 import time
-from . import main_loop_utility, text_utility, actor_utility, minister_utility, scaling
+from . import (
+    main_loop_utility,
+    drawing_utility,
+    text_utility,
+    actor_utility,
+    minister_utility,
+    scaling,
+)
 from ..actor_types import tiles
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -91,6 +98,8 @@ def set_game_mode(new_game_mode):
         if new_game_mode == "main_menu" or previous_game_mode == "new_game_setup":
             start_loading()
         constants.current_game_mode = new_game_mode
+        status.mode_partition.swap(previous_game_mode)
+        drawing_utility.request_full_display_update()
         if new_game_mode == "strategic":
             constants.default_text_box_height = constants.font_size * 5.5
             constants.text_box_height = constants.default_text_box_height
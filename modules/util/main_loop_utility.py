@@ -5,6 +5,7 @@ import time
 from . import (
     scaling,
     text_utility,
+    drawing_utility,
     actor_utility,
     minister_utility,
     utility,
@@ -29,10 +30,11 @@ def update_display():
             1  # end load timer faster once program starts repeating this part
         )
         draw_loading_screen()
+        drawing_utility.request_full_display_update()
     else:
-        possible_tooltip_drawers = []
-
-        traversal_utility.draw_interface_elements(status.independent_interface_elements)
+        traversal_utility.draw_interface_elements(
+            status.mode_partition.get_traversal_roots()
+        )
         # could modify with a layer dictionary to display elements on different layers - currently, drawing elements in order of collection creation is working w/o overlap
         # issues
 
@@ -43,48 +45,6 @@ def update_display():
         if status.displayed_mob:
             status.displayed_mob.draw_outline()
 
-        for current_mob in status.mob_list:
-            if current_mob.can_show_tooltip():
-                for same_tile_mob in current_mob.images[0].current_cell.contained_mobs:
-                    if (
-                        same_tile_mob.can_show_tooltip()
-                        and not same_tile_mob in possible_tooltip_drawers
-                    ):  # if multiple mobs are in the same tile, draw their tooltips in order
-                        possible_tooltip_drawers.append(same_tile_mob)
-
-        for current_building in status.building_list:
-            if current_building.can_show_tooltip():
-                possible_tooltip_drawers.append(current_building)
-
-        for current_actor in status.actor_list:
-            if (
-                current_actor.can_show_tooltip()
-                and not current_actor in possible_tooltip_drawers
-            ):
-                possible_tooltip_drawers.append(
-                    current_actor
-                )  # only one of these will be drawn to prevent overlapping tooltips
-
-        notification_tooltip_button = None
-        for current_button in status.button_list:
-            if (
-                current_button.can_show_tooltip()
-            ):  # while multiple actor tooltips can be shown at once, if a button tooltip is showing no other tooltips should be showing
-                if (
-                    current_button.in_notification
-                    and current_button != status.current_instructions_page
-                ):
-                    notification_tooltip_button = current_button
-                else:
-                    possible_tooltip_drawers = [current_button]
-
-        if notification_tooltip_button:
-            possible_tooltip_drawers = [notification_tooltip_button]
-        else:
-            for current_free_image in status.free_image_list:
-                if current_free_image.can_show_tooltip():
-                    possible_tooltip_drawers = [current_free_image]
-
         if flags.show_text_box:
             draw_text_box()
 
@@ -92,21 +52,31 @@ def update_display():
 
         if status.current_instructions_page:
             status.current_instructions_page.draw()
-            if (
-                status.current_instructions_page.can_show_tooltip()
-            ):  # while multiple actor tooltips can be shown at once, if a button tooltip is showing no other tooltips should be showing
-                possible_tooltip_drawers = [
-                    status.current_instructions_page
-                ]  # instructions have priority over everything
         if (constants.old_mouse_x, constants.old_mouse_y) != pygame.mouse.get_pos():
             constants.mouse_moved_time = constants.current_time
             constants.old_mouse_x, constants.old_mouse_y = pygame.mouse.get_pos()
         if (
             time.time() > constants.mouse_moved_time + 0.15
         ):  # show tooltip when mouse is still
+            if constants.frame_profiler:
+                constants.frame_profiler.start_phase("tooltips")
+            if (
+                status.current_instructions_page
+                and status.current_instructions_page.can_show_tooltip()
+            ):  # instructions have priority over everything
+                possible_tooltip_drawers = [status.current_instructions_page]
+            else:
+                possible_tooltip_drawers = status.hover_index.get_tooltip_drawers()
             manage_tooltip_drawing(possible_tooltip_drawers)
+            if constants.frame_profiler:
+                constants.frame_profiler.end_phase("tooltips")
 
-    pygame.display.update()
+    if constants.frame_profiler:
+        constants.frame_profiler.draw()
+        constants.frame_profiler.start_phase("present")
+    drawing_utility.update_display()
+    if constants.frame_profiler:
+        constants.frame_profiler.end_phase("present")
 
     if constants.effect_manager.effect_active("track_fps"):
         current_time = time.time()
@@ -117,6 +87,57 @@ def update_display():
             constants.last_fps_update = current_time
 
 
+def game_busy():
+    """
+    Description:
+        Returns whether the game is doing something that should be shown at the full frame rate even without user input, like an enemy turn, loading, a pending
+            event, or rolling dice
+    Input:
+        None
+    Output:
+        boolean: Returns whether the game is doing something that should be shown at the full frame rate
+    """
+    if flags.loading or not flags.player_turn:
+        return True
+    if flags.lmb_down or flags.rmb_down or flags.mmb_down:
+        return True
+    if constants.event_manager.pending_events:
+        return True
+    for current_die in status.dice_list:
+        if current_die.rolling:
+            return True
+    return False
+
+
+def pace_frame(had_input):
+    """
+    Description:
+        Limits the frame rate to constants.target_fps, dropping to constants.idle_fps once there has been no input or other activity for constants.idle_delay seconds.
+            While idle, checks for input every few milliseconds rather than sleeping for the whole frame, allowing the game to respond to input almost instantly
+    Input:
+        boolean had_input: Whether any input events were handled this frame
+    Output:
+        None
+    """
+    current_time = time.time()
+    if had_input or game_busy():
+        constants.last_activity_time = current_time
+    if (
+        constants.idle_fps > 0
+        and current_time > constants.last_activity_time + constants.idle_delay
+    ):
+        idle_end_time = current_time + 1 / constants.idle_fps
+        while (
+            time.time() < idle_end_time and not pygame.event.peek()
+        ):  # peeking leaves any input in the queue, in order, to be handled on the next frame
+            pygame.time.wait(5)
+        constants.frame_clock.tick()
+    else:
+        constants.frame_clock.tick(
+            constants.target_fps
+        )  # target_fps of 0 does not limit the frame rate
+
+
 def action_possible():
     """
     Description:
@@ -268,8 +289,7 @@ def draw_text_box():
         )  # manages width of user input
     text_box_width = greatest_width + scaling.scale_width(10)
     x, y = (0, constants.display_height - constants.text_box_height)
-    pygame.draw.rect(
-        constants.game_display,
+    drawing_utility.draw_rect(
         constants.color_dict["white"],
         (x, y, text_box_width, constants.text_box_height),
     )  # draws white rect to prevent overlapping
@@ -277,14 +297,12 @@ def draw_text_box():
         color = "red"
     else:
         color = "black"
-    pygame.draw.rect(
-        constants.game_display,
+    drawing_utility.draw_rect(
         constants.color_dict[color],
         (x, y, text_box_width, constants.text_box_height),
         scaling.scale_height(3),
     )  # black text box outline
-    pygame.draw.line(
-        constants.game_display,
+    drawing_utility.draw_line(
         constants.color_dict[color],
         (
             0,
@@ -302,32 +320,26 @@ def draw_text_box():
 
     for text_index in range(len(status.text_list)):
         if text_index < max_text_box_lines:
-            textsurface = constants.myfont.pygame_font.render(
-                status.text_list[(-1 * text_index) - 1], False, (0, 0, 0)
-            )
-            constants.game_display.blit(
+            message = status.text_list[(-1 * text_index) - 1]
+            textsurface = constants.myfont.pygame_font.render(message, False, (0, 0, 0))
+            drawing_utility.display_image(
                 textsurface,
-                (
-                    scaling.scale_width(10),
-                    (-1 * font.size * text_index)
-                    + constants.display_height
-                    - ((2 * font.size) + scaling.scale_height(5)),
-                ),
+                scaling.scale_width(10),
+                (-1 * font.size * text_index)
+                + constants.display_height
+                - ((2 * font.size) + scaling.scale_height(5)),
+                signature=("text", message, constants.myfont),
             )
     if constants.input_manager.taking_input:
-        textsurface = constants.myfont.pygame_font.render(
-            "Response: " + constants.message, False, (0, 0, 0)
-        )
+        message = "Response: " + constants.message
     else:
-        textsurface = constants.myfont.pygame_font.render(
-            constants.message, False, (0, 0, 0)
-        )
-    constants.game_display.blit(
+        message = constants.message
+    textsurface = constants.myfont.pygame_font.render(message, False, (0, 0, 0))
+    drawing_utility.display_image(
         textsurface,
-        (
-            scaling.scale_width(10),
-            constants.display_height - (font.size + scaling.scale_height(5)),
-        ),
+        scaling.scale_width(10),
+        constants.display_height - (font.size + scaling.scale_height(5)),
+        signature=("text", message, constants.myfont),
     )
 
 
@@ -342,35 +354,29 @@ def manage_rmb_down(clicked_button):
     """
     stopping = False
     if (not clicked_button) and action_possible():
-        for current_grid in status.grid_list:
-            if (
-                current_grid.showing
-            ):  # if constants.current_game_mode in current_grid.modes:
-                for current_cell in current_grid.get_flat_cell_list():
-                    if current_cell.touching_mouse():
-                        stopping = True  # if doesn't reach this point, do same as lmb
-                        if len(current_cell.contained_mobs) > 1:
-                            moved_mob = current_cell.contained_mobs[1]
-                            for current_image in moved_mob.images:
-                                if not current_image.current_cell == "none":
-                                    while (
-                                        not moved_mob
-                                        == current_image.current_cell.contained_mobs[0]
-                                    ):
-                                        current_image.current_cell.contained_mobs.append(
-                                            current_image.current_cell.contained_mobs.pop(
-                                                0
-                                            )
-                                        )
-                            flags.show_selection_outlines = True
-                            constants.last_selection_outline_switch = (
-                                constants.current_time
-                            )
-                            if status.minimap_grid in moved_mob.grids:
-                                status.minimap_grid.calibrate(moved_mob.x, moved_mob.y)
-                            moved_mob.select()
-                            if moved_mob.is_pmob:
-                                moved_mob.selection_sound()
+        for current_grid in status.mode_partition.get_elements("grids"):
+            if current_grid.showing:
+                current_cell = current_grid.cell_at_pixel(*pygame.mouse.get_pos())
+                if current_cell:
+                    stopping = True  # if doesn't reach this point, do same as lmb
+                    if len(current_cell.contained_mobs) > 1:
+                        moved_mob = current_cell.contained_mobs[1]
+                        for current_image in moved_mob.images:
+                            if not current_image.current_cell == "none":
+                                while (
+                                    not moved_mob
+                                    == current_image.current_cell.contained_mobs[0]
+                                ):
+                                    current_image.current_cell.contained_mobs.append(
+                                        current_image.current_cell.contained_mobs.pop(0)
+                                    )
+                        flags.show_selection_outlines = True
+                        constants.last_selection_outline_switch = constants.current_time
+                        if status.minimap_grid in moved_mob.grids:
+                            status.minimap_grid.calibrate(moved_mob.x, moved_mob.y)
+                        moved_mob.select()
+                        if moved_mob.is_pmob:
+                            moved_mob.selection_sound()
     elif flags.drawing_automatic_route:
         stopping = True
         flags.drawing_automatic_route = False
@@ -431,24 +437,22 @@ def manage_lmb_down(clicked_button):
             )
         ):  # do not do selecting operations if user was trying to click a button #and action_possible()
             selected_mob = False
-            for current_grid in status.grid_list:
-                if (
-                    current_grid.showing
-                ):  # if constants.current_game_mode in current_grid.modes:
-                    for current_cell in current_grid.get_flat_cell_list():
-                        if current_cell.touching_mouse():
-                            if current_cell.visible:
-                                if len(current_cell.contained_mobs) > 0:
-                                    selected_mob = True
-                                    current_mob = current_cell.contained_mobs[0]
-                                    actor_utility.calibrate_actor_info_display(
-                                        status.mob_info_display,
-                                        None,
-                                        override_exempt=True,
-                                    )
-                                    current_mob.select()
-                                    if current_mob.is_pmob:
-                                        current_mob.selection_sound()
+            for current_grid in status.mode_partition.get_elements("grids"):
+                if current_grid.showing:
+                    current_cell = current_grid.cell_at_pixel(*pygame.mouse.get_pos())
+                    if current_cell:
+                        if current_cell.visible:
+                            if len(current_cell.contained_mobs) > 0:
+                                selected_mob = True
+                                current_mob = current_cell.contained_mobs[0]
+                                actor_utility.calibrate_actor_info_display(
+                                    status.mob_info_display,
+                                    None,
+                                    override_exempt=True,
+                                )
+                                current_mob.select()
+                                if current_mob.is_pmob:
+                                    current_mob.selection_sound()
             if selected_mob:
                 unit = status.displayed_mob
                 if unit and unit.grids[0] == status.minimap_grid.attached_grid:
@@ -473,67 +477,61 @@ def manage_lmb_down(clicked_button):
             not clicked_button
         ) and flags.choosing_destination:  # if clicking to move somewhere
             for current_grid in status.grid_list:  # destination_grids:
-                for current_cell in current_grid.get_flat_cell_list():
-                    if current_cell.touching_mouse():
-                        click_move_minimap()
-                        target_cell = "none"
-                        if current_cell.grid.is_abstract_grid:
-                            target_cell = current_cell
-                        else:
-                            target_cell = status.strategic_map_grid.find_cell(
-                                status.minimap_grid.center_x,
-                                status.minimap_grid.center_y,
-                            )  # center
-                        if not current_grid in status.displayed_mob.grids:
-                            stopping = False
+                current_cell = current_grid.cell_at_pixel(*pygame.mouse.get_pos())
+                if current_cell:
+                    click_move_minimap()
+                    target_cell = "none"
+                    if current_cell.grid.is_abstract_grid:
+                        target_cell = current_cell
+                    else:
+                        target_cell = status.strategic_map_grid.find_cell(
+                            status.minimap_grid.center_x,
+                            status.minimap_grid.center_y,
+                        )  # center
+                    if not current_grid in status.displayed_mob.grids:
+                        stopping = False
+                        if (
+                            not current_grid.is_abstract_grid
+                        ):  # if grid has more than 1 cell, check if correct part of grid
+                            (
+                                destination_x,
+                                destination_y,
+                            ) = target_cell.tile.get_main_grid_coordinates()
                             if (
-                                not current_grid.is_abstract_grid
-                            ):  # if grid has more than 1 cell, check if correct part of grid
                                 (
-                                    destination_x,
-                                    destination_y,
-                                ) = target_cell.tile.get_main_grid_coordinates()
-                                if (
-                                    (
-                                        not (
-                                            destination_y == 0
-                                            or (
-                                                destination_y == 1
-                                                and target_cell.has_intact_building(
-                                                    "port"
-                                                )
-                                            )
+                                    not (
+                                        destination_y == 0
+                                        or (
+                                            destination_y == 1
+                                            and target_cell.has_intact_building("port")
                                         )
                                     )
-                                    and destination_x >= 0
-                                    and destination_x
-                                    < status.strategic_map_grid.coordinate_width
-                                ):  # or is harbor
-                                    text_utility.print_to_screen(
-                                        "You can only send ships to coastal waters and coastal ports."
-                                    )
-                                    stopping = True
-                            if not stopping:
-                                status.displayed_mob.end_turn_destination = (
-                                    target_cell.tile
                                 )
-                                status.displayed_mob.movement_sound(allow_fadeout=False)
-                                flags.show_selection_outlines = True
-                                constants.last_selection_outline_switch = (
-                                    constants.current_time
-                                )  # outlines should be shown immediately once destination is chosen
-                                status.displayed_mob.remove_from_turn_queue()
-                                status.displayed_mob.select()
-                                status.displayed_mob.images[
-                                    0
-                                ].current_cell.tile.select()
-                        else:  # cannot move to same continent
-                            actor_utility.calibrate_actor_info_display(
-                                status.mob_info_display, None
-                            )
-                            text_utility.print_to_screen(
-                                "You can only send ships to other theatres."
-                            )
+                                and destination_x >= 0
+                                and destination_x
+                                < status.strategic_map_grid.coordinate_width
+                            ):  # or is harbor
+                                text_utility.print_to_screen(
+                                    "You can only send ships to coastal waters and coastal ports."
+                                )
+                                stopping = True
+                        if not stopping:
+                            status.displayed_mob.end_turn_destination = target_cell.tile
+                            status.displayed_mob.movement_sound(allow_fadeout=False)
+                            flags.show_selection_outlines = True
+                            constants.last_selection_outline_switch = (
+                                constants.current_time
+                            )  # outlines should be shown immediately once destination is chosen
+                            status.displayed_mob.remove_from_turn_queue()
+                            status.displayed_mob.select()
+                            status.displayed_mob.images[0].current_cell.tile.select()
+                    else:  # cannot move to same continent
+                        actor_utility.calibrate_actor_info_display(
+                            status.mob_info_display, None
+                        )
+                        text_utility.print_to_screen(
+                            "You can only send ships to other theatres."
+                        )
             flags.choosing_destination = False
 
         elif (not clicked_button) and flags.choosing_advertised_commodity:
@@ -541,109 +539,109 @@ def manage_lmb_down(clicked_button):
 
         elif (not clicked_button) and flags.drawing_automatic_route:
             for current_grid in status.grid_list:  # destination_grids:
-                for current_cell in current_grid.get_flat_cell_list():
-                    if current_cell.touching_mouse():
-                        if current_cell.grid.is_abstract_grid:
-                            text_utility.print_to_screen(
-                                "Only tiles adjacent to the most recently chosen destination can be added to the movement route."
-                            )
+                current_cell = current_grid.cell_at_pixel(*pygame.mouse.get_pos())
+                if current_cell:
+                    if current_cell.grid.is_abstract_grid:
+                        text_utility.print_to_screen(
+                            "Only tiles adjacent to the most recently chosen destination can be added to the movement route."
+                        )
+                    else:
+                        displayed_mob = status.displayed_mob
+                        if current_cell.grid.is_mini_grid:
+                            target_tile = current_cell.tile.get_equivalent_tile()
+                            if target_tile == "none":
+                                return ()
+                            target_cell = target_tile.cell
                         else:
-                            displayed_mob = status.displayed_mob
-                            if current_cell.grid.is_mini_grid:
-                                target_tile = current_cell.tile.get_equivalent_tile()
-                                if target_tile == "none":
-                                    return ()
-                                target_cell = target_tile.cell
-                            else:
-                                target_cell = current_cell
-                            # target_cell = status.strategic_map_grid.find_cell(status.minimap_grid.center_x, status.minimap_grid.center_y)
-                            destination_x, destination_y = (
-                                target_cell.x,
-                                target_cell.y,
-                            )  # target_cell.tile.get_main_grid_coordinates()
-                            (
-                                previous_destination_x,
-                                previous_destination_y,
-                            ) = displayed_mob.base_automatic_route[-1]
-                            if (
-                                utility.find_coordinate_distance(
-                                    (destination_x, destination_y),
-                                    (previous_destination_x, previous_destination_y),
+                            target_cell = current_cell
+                        # target_cell = status.strategic_map_grid.find_cell(status.minimap_grid.center_x, status.minimap_grid.center_y)
+                        destination_x, destination_y = (
+                            target_cell.x,
+                            target_cell.y,
+                        )  # target_cell.tile.get_main_grid_coordinates()
+                        (
+                            previous_destination_x,
+                            previous_destination_y,
+                        ) = displayed_mob.base_automatic_route[-1]
+                        if (
+                            utility.find_coordinate_distance(
+                                (destination_x, destination_y),
+                                (previous_destination_x, previous_destination_y),
+                            )
+                            == 1
+                        ):
+                            destination_infrastructure = target_cell.get_building(
+                                "infrastructure"
+                            )
+                            if not target_cell.visible:
+                                text_utility.print_to_screen(
+                                    "Movement routes cannot be created through unexplored tiles."
                                 )
-                                == 1
+                                return ()
+                            elif (
+                                displayed_mob.is_vehicle
+                                and displayed_mob.vehicle_type == "train"
+                                and not target_cell.has_building("railroad")
                             ):
-                                destination_infrastructure = target_cell.get_building(
-                                    "infrastructure"
+                                text_utility.print_to_screen(
+                                    "Trains can only create movement routes along railroads."
                                 )
-                                if not target_cell.visible:
-                                    text_utility.print_to_screen(
-                                        "Movement routes cannot be created through unexplored tiles."
-                                    )
-                                    return ()
-                                elif (
-                                    displayed_mob.is_vehicle
-                                    and displayed_mob.vehicle_type == "train"
-                                    and not target_cell.has_building("railroad")
-                                ):
-                                    text_utility.print_to_screen(
-                                        "Trains can only create movement routes along railroads."
-                                    )
-                                    return ()
-                                elif (
-                                    target_cell.terrain == "water"
-                                    and not displayed_mob.can_swim
-                                ) and (
-                                    displayed_mob.is_vehicle
-                                    and destination_infrastructure == "none"
-                                ):
-                                    # non-train units can still move slowly through water, even w/o canoes or a bridge
-                                    # railroad bridge allows anything to move through
-                                    text_utility.print_to_screen(
-                                        "This unit cannot create movement routes through water."
-                                    )
-                                    return ()
-                                elif (
-                                    target_cell.terrain == "water"
-                                    and displayed_mob.can_swim
-                                    and (not displayed_mob.can_swim_ocean)
-                                    and destination_y == 0
-                                ):
-                                    text_utility.print_to_screen(
-                                        "This unit cannot create movement routes through ocean water."
-                                    )
-                                    return ()
-                                elif (
-                                    target_cell.terrain == "water"
-                                    and displayed_mob.can_swim
-                                    and (not displayed_mob.can_swim_river)
-                                    and destination_y > 0
-                                ):
-                                    text_utility.print_to_screen(
-                                        "This unit cannot create movement routes through river water."
-                                    )
-                                    return ()
-                                elif (
-                                    (not target_cell.terrain == "water")
-                                    and (not displayed_mob.can_walk)
-                                    and not target_cell.has_intact_building("port")
-                                ):
-                                    text_utility.print_to_screen(
-                                        "This unit cannot create movement routes on land, except through ports."
-                                    )
-                                    return ()
-
-                                displayed_mob.add_to_automatic_route(
-                                    (destination_x, destination_y)
+                                return ()
+                            elif (
+                                target_cell.terrain == "water"
+                                and not displayed_mob.can_swim
+                            ) and (
+                                displayed_mob.is_vehicle
+                                and destination_infrastructure == "none"
+                            ):
+                                # non-train units can still move slowly through water, even w/o canoes or a bridge
+                                # railroad bridge allows anything to move through
+                                text_utility.print_to_screen(
+                                    "This unit cannot create movement routes through water."
+                                )
+                                return ()
+                            elif (
+                                target_cell.terrain == "water"
+                                and displayed_mob.can_swim
+                                and (not displayed_mob.can_swim_ocean)
+                                and destination_y == 0
+                            ):
+                                text_utility.print_to_screen(
+                                    "This unit cannot create movement routes through ocean water."
                                 )
-                                click_move_minimap()
-                                flags.show_selection_outlines = True
-                                constants.last_selection_outline_switch = (
-                                    constants.current_time
+                                return ()
+                            elif (
+                                target_cell.terrain == "water"
+                                and displayed_mob.can_swim
+                                and (not displayed_mob.can_swim_river)
+                                and destination_y > 0
+                            ):
+                                text_utility.print_to_screen(
+                                    "This unit cannot create movement routes through river water."
                                 )
-                            else:
+                                return ()
+                            elif (
+                                (not target_cell.terrain == "water")
+                                and (not displayed_mob.can_walk)
+                                and not target_cell.has_intact_building("port")
+                            ):
                                 text_utility.print_to_screen(
-                                    "Only tiles adjacent to the most recently chosen destination can be added to the movement route."
+                                    "This unit cannot create movement routes on land, except through ports."
                                 )
+                                return ()
+
+                            displayed_mob.add_to_automatic_route(
+                                (destination_x, destination_y)
+                            )
+                            click_move_minimap()
+                            flags.show_selection_outlines = True
+                            constants.last_selection_outline_switch = (
+                                constants.current_time
+                            )
+                        else:
+                            text_utility.print_to_screen(
+                                "Only tiles adjacent to the most recently chosen destination can be added to the movement route."
+                            )
 
         elif not clicked_button:
             click_move_minimap()
@@ -662,25 +660,25 @@ def click_move_minimap():
         current_grid
     ) in status.grid_list:  # if grid clicked, move minimap to location clicked
         if current_grid.showing:
-            for current_cell in current_grid.get_flat_cell_list():
-                if current_cell.touching_mouse():
+            current_cell = current_grid.cell_at_pixel(*pygame.mouse.get_pos())
+            if current_cell:
+                if (
+                    current_grid == status.minimap_grid
+                ):  # if minimap clicked, calibrate to corresponding place on main map
                     if (
-                        current_grid == status.minimap_grid
-                    ):  # if minimap clicked, calibrate to corresponding place on main map
-                        if (
-                            current_cell.terrain != "none"
-                        ):  # if off map, do not move minimap there
-                            main_x, main_y = current_grid.get_main_grid_coordinates(
-                                current_cell.x, current_cell.y
-                            )
-                            status.minimap_grid.calibrate(main_x, main_y)
-                    elif current_grid == status.strategic_map_grid:
-                        status.minimap_grid.calibrate(current_cell.x, current_cell.y)
-                    else:  # if abstract grid, show the inventory of the tile clicked without calibrating minimap
-                        actor_utility.calibrate_actor_info_display(
-                            status.tile_info_display, current_grid.cell_list[0][0].tile
+                        current_cell.terrain != "none"
+                    ):  # if off map, do not move minimap there
+                        main_x, main_y = current_grid.get_main_grid_coordinates(
+                            current_cell.x, current_cell.y
                         )
-                    return
+                        status.minimap_grid.calibrate(main_x, main_y)
+                elif current_grid == status.strategic_map_grid:
+                    status.minimap_grid.calibrate(current_cell.x, current_cell.y)
+                else:  # if abstract grid, show the inventory of the tile clicked without calibrating minimap
+                    actor_utility.calibrate_actor_info_display(
+                        status.tile_info_display, current_grid.cell_list[0][0].tile
+                    )
+                return
 
 
 def debug_print():
@@ -694,3 +692,18 @@ def debug_print():
     """
     print("")
     print(constants.effect_manager)
+    print(constants.asset_pack_manager)
+    print(status.rendered_images)
+    print(status.combined_surfaces)
+    print(status.scaled_images)
+    print(constants.scaled_image_cache)
+    print(status.button_index)
+    print(status.keybind_registry)
+    print(status.hover_index)
+    print(status.visibility_tracker)
+    print(status.mode_partition)
+    print(status.layout_tracker)
+    print(status.target_distance_field)
+    print(status.movement_cost_table)
+    if constants.frame_profiler:
+        constants.frame_profiler.save_csv()
@@ -41,6 +41,7 @@ def calibrate_minister_info_display(new_minister):
     if new_minister == "none":
         print(0 / 0)
     status.displayed_minister = new_minister
+    status.visibility_tracker.invalidate("displayed")
     target = "none"
     if status.displayed_minister:
         target = new_minister
@@ -0,0 +1,235 @@
+# Contains functions that run games without user input, like for benchmarks and headless simulations
+
+import random
+from . import turn_management_utility, actor_utility
+import modules.constants.constants as constants
+import modules.constants.status as status
+import modules.constants.flags as flags
+
+
+def dismiss_notifications(max_notifications=10000):
+    """
+    Description:
+        Closes the displayed notification and each queued notification after it, finishing any dice rolls immediately and choosing the last option of any choice
+            notifications, which is normally the option to cancel
+    Input:
+        int max_notifications=10000: Maximum number of notifications to close, preventing notifications that create new notifications when closed from running forever
+    Output:
+        int: Returns the number of notifications closed
+    """
+    num_dismissed = 0
+    while (
+        status.displayed_notification
+        and num_dismissed < max_notifications
+        and not flags.crashed
+    ):
+        current_notification = status.displayed_notification
+        if current_notification.notification_type == "roll":
+            for current_die in status.dice_list.copy():
+                while current_die.rolling:
+                    current_die.roll()  # the last die to stop rolling removes its notification
+            if status.displayed_notification == current_notification:
+                current_notification.on_click(die_override=True)
+        elif current_notification.notification_type == "choice":
+            current_notification.choice_buttons[-1].on_click()
+        elif current_notification.notification_type in [
+            "action",
+            "off_tile_exploration",
+        ]:  # action notifications are always removed when clicked
+            current_notification.on_click()
+        else:
+            current_notification.on_click(override_can_remove=True)
+        num_dismissed += 1
+    return num_dismissed
+
+
+def appoint_ministers():
+    """
+    Description:
+        Appoints an available minister to each empty office, like a player would need to before ending the turn, such as after a minister retires
+    Input:
+        None
+    Output:
+        None
+    """
+    for current_position in constants.minister_types:
+        if (
+            status.current_ministers[current_position] == None
+            and status.available_minister_list
+        ):
+            status.available_minister_list[0].appoint(current_position)
+    dismiss_notifications()
+
+
+def start_simulation(seed=None, save_file=None, country_name="Britain"):
+    """
+    Description:
+        Starts a game to simulate, either loading the inputted save file or creating a new game as the inputted country. Ministers are appointed automatically and any
+            resulting notifications are closed
+    Input:
+        int seed=None: Seed for the random number generator, allowing the same game to be simulated repeatedly, or None to not seed it
+        string save_file=None: Name of the save file to load from the save_games folder, like 'save1.pickle', or None to create a new game
+        string country_name='Britain': Name of the country to play as in a new game, like 'France'
+    Output:
+        None
+    """
+    if seed != None:
+        random.seed(seed)
+    constants.effect_manager.set_effect("skip_intro", True)
+    if save_file:
+        constants.save_load_manager.load_game(save_file)
+    else:
+        constants.save_load_manager.new_game(getattr(status, country_name))
+    dismiss_notifications()
+    appoint_ministers()
+
+
+def create_synthetic_colony(num_pmobs=0, num_buildings=0, num_villages=0, num_npmobs=0):
+    """
+    Description:
+        Adds a synthetic colony to the current game, allowing the performance of large colonies to be measured without playing until they develop. Resource buildings
+            with warehouses are built on land cells, work crews are created to work in them and then on random land cells, new villages are added until there are the
+            inputted number of villages, and each npmob is either native warriors from a random village or a beast
+    Input:
+        int num_pmobs=0: Number of work crews to create
+        int num_buildings=0: Number of resource buildings to create
+        int num_villages=0: Total number of villages the strategic map should have
+        int num_npmobs=0: Number of npmobs to create
+    Output:
+        None
+    """
+    land_cells = [
+        current_cell
+        for current_cell in status.strategic_map_grid.get_flat_cell_list()
+        if current_cell.terrain != "water" and current_cell.y != 0
+    ]
+    random.shuffle(land_cells)
+    open_cells = [
+        current_cell for current_cell in land_cells if current_cell.resource == "none"
+    ]
+
+    while len(status.village_list) < num_villages and open_cells:
+        open_cells.pop().set_resource("natives")
+
+    resource_buildings = []
+    for current_cell in open_cells[:num_buildings]:
+        current_cell.set_resource(random.choice(constants.collectable_resources))
+        constants.actor_creation_manager.create(
+            True,
+            {
+                "init_type": "settlement",
+                "coordinates": (current_cell.x, current_cell.y),
+                "name": constants.flavor_text_manager.generate_flavor_text(
+                    "settlement_names"
+                ),
+            },
+        )  # a named settlement is created first so that the building does not prompt the player to name a new one
+        input_dict = {
+            "coordinates": (current_cell.x, current_cell.y),
+            "grids": [status.strategic_map_grid, status.strategic_map_grid.mini_grid],
+            "name": current_cell.resource + " production facility",
+            "modes": status.strategic_map_grid.modes,
+            "init_type": "resource",
+            "image": "buildings/resource_building.png",
+            "resource_type": current_cell.resource,
+        }
+        resource_buildings.append(
+            constants.actor_creation_manager.create(False, input_dict)
+        )
+        input_dict["image"] = "misc/empty.png"
+        input_dict["name"] = "warehouses"
+        input_dict["init_type"] = "warehouses"
+        constants.actor_creation_manager.create(False, input_dict)
+
+    for pmob_index in range(num_pmobs):
+        if pmob_index < len(resource_buildings):
+            current_cell = resource_buildings[pmob_index].cell
+        else:
+            current_cell = random.choice(land_cells)
+        input_dict = {
+            "coordinates": (current_cell.x, current_cell.y),
+            "grids": [status.strategic_map_grid, status.strategic_map_grid.mini_grid],
+            "modes": status.strategic_map_grid.modes,
+        }
+        worker = constants.actor_creation_manager.create(
+            False,
+            dict(input_dict, **status.worker_types["European"].generate_input_dict()),
+        )
+        officer = constants.actor_creation_manager.create(
+            False,
+            dict(
+                input_dict,
+                image="mobs/foreman/default.png",
+                name="foreman",
+                init_type="foreman",
+                officer_type="foreman",
+            ),
+        )
+        work_crew = constants.actor_creation_manager.create_group(worker, officer)
+        if pmob_index < len(resource_buildings):
+            work_crew.work_building(resource_buildings[pmob_index])
+
+    for npmob_index in range(num_npmobs):
+        if status.village_list and npmob_index % 2 == 0:
+            random.choice(status.village_list).spawn_warrior()
+        else:
+            actor_utility.spawn_beast()
+    dismiss_notifications()
+
+
+def simulate_enemy_turn(max_steps=100000):
+    """
+    Description:
+        Does each step of the enemy turn and any resulting combats without waiting between steps, ending once it is the player's turn again
+    Input:
+        int max_steps=100000: Maximum number of enemy turn steps to do, preventing an enemy turn that never ends from running forever
+    Output:
+        None
+    """
+    num_steps = 0
+    while not flags.player_turn and num_steps < max_steps and not flags.crashed:
+        turn_management_utility.manage_enemy_turn_step()
+        dismiss_notifications()
+        num_steps += 1
+    dismiss_notifications()
+
+
+def simulate_turn():
+    """
+    Description:
+        Fills any empty offices, ends the current turn, and simulates the following enemy turn and start of the next player turn, closing any notifications that
+            appear
+    Input:
+        None
+    Output:
+        None
+    """
+    dismiss_notifications()
+    appoint_ministers()
+    turn_management_utility.end_turn()
+    dismiss_notifications()
+    simulate_enemy_turn()
+
+
+def simulate_turns(num_turns, on_turn_end=None):
+    """
+    Description:
+        Simulates the inputted number of turns, stopping early if the game ends
+    Input:
+        int num_turns: Number of turns to simulate
+        function on_turn_end=None: Function called with the index of each turn after it is simulated, like for recording statistics, or None
+    Output:
+        int: Returns the number of turns simulated
+    """
+    for turn_index in range(num_turns):
+        if flags.crashed or constants.current_game_mode not in [
+            "strategic",
+            "europe",
+            "ministers",
+            "trial",
+        ]:  # stops if the game ended, like from bankruptcy
+            return turn_index
+        simulate_turn()
+        if on_turn_end:
+            on_turn_end(turn_index)
+    return num_turns
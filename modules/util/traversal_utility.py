@@ -1,5 +1,6 @@
 # Contains functions to manage interface collection traversal, doing particular actions for each element with simple decision-making
 
+import modules.constants.constants as constants
 import modules.constants.status as status
 
 
@@ -12,6 +13,10 @@ def draw_interface_elements(interface_elements):
         interface_element list interface_elements: List of interface elements to traverse through - no element in the list should be a member of any other element in the
             list, either directly or indirectly. This will preferably be the list of all 'root' elements
     """
+    if constants.frame_profiler:
+        constants.frame_profiler.start_phase("traversal")
+    status.visibility_tracker.update()
+    status.layout_tracker.start_frame()
     for current_interface_element in interface_elements:
         collection_traversal(
             current_interface_element,
@@ -20,9 +25,14 @@ def draw_interface_elements(interface_elements):
             condition=check_showing,
             posttraversal_action=update_collection,
         )
+    if constants.frame_profiler:
+        constants.frame_profiler.end_phase("traversal")
+        constants.frame_profiler.start_phase("draw_list")
     for current_interface_element in status.draw_list:
         current_interface_element.draw()
     status.draw_list = []
+    if constants.frame_profiler:
+        constants.frame_profiler.end_phase("draw_list")
 
 
 def collection_traversal(current_element, **kwargs):
@@ -86,14 +96,47 @@ def collection_traversal(current_element, **kwargs):
 def set_showing(current_element):
     """
     Description:
-        Updates the inputted elements showing attribute
+        Updates the inputted elements showing attribute. If the element's class declares what its can_show function depends on and none of it has changed since
+            can_show was last called, the previous result is reused. The full_visibility_traversal effect calls can_show for every element regardless, reporting any
+            element whose reused result would have been incorrect
     Input:
         interface_element current_element: Element being traversed through
     Output:
         None
     """
     old_showing = current_element.showing
-    current_element.showing = current_element.can_show()
+    visibility_tracker = status.visibility_tracker
+    dependencies = visibility_tracker.get_dependencies(current_element)
+    if dependencies == None:
+        current_element.showing = current_element.can_show()
+        visibility_tracker.recomputed += 1
+    else:
+        version_key = visibility_tracker.get_version_key(dependencies)
+        would_reuse = version_key == getattr(
+            current_element, "showing_version_key", None
+        )
+        if would_reuse and not constants.effect_manager.effect_active(
+            "full_visibility_traversal"
+        ):
+            visibility_tracker.reused += 1
+            return old_showing
+        current_element.showing = current_element.can_show()
+        visibility_tracker.recomputed += 1
+        current_element.showing_version_key = version_key  # recorded before any later changes, so changes made during can_show cause it to be called again
+        if would_reuse and current_element.showing != old_showing:
+            visibility_tracker.mismatches += 1
+            print(
+                "Reused showing value of "
+                + type(current_element).__name__
+                + " would have been "
+                + str(old_showing)
+                + " instead of "
+                + str(current_element.showing)
+            )
+    if old_showing != current_element.showing:
+        status.button_index.invalidate()
+        if hasattr(current_element, "invalidate_layout"):
+            current_element.invalidate_layout()
     return (
         old_showing or current_element.showing
     )  # if wasn't showing and still not showing, lower collection elements don't need to be updated - can skip traversal
@@ -127,6 +170,12 @@ def set_not_showing(current_element):
     if not current_element.showing:
         return False
     current_element.showing = False
+    current_element.showing_version_key = (
+        None  # can_show must be called again once the collection above is showing
+    )
+    status.button_index.invalidate()
+    if hasattr(current_element, "invalidate_layout"):
+        current_element.invalidate_layout()
     return True
 
 
@@ -43,6 +43,7 @@ def start_enemy_turn():
     manage_warriors()
     manage_beasts()
     reset_mobs("npmobs")
+    status.target_distance_field.invalidate()
     # manage_combat() #should probably do reset_mobs, manage_production, etc. after combat completed in a separate function
     # the manage_combat function starts the player turn
 
@@ -725,6 +726,195 @@ def manage_enemy_movement():
             current_npmob.end_turn_move()
 
 
+def manage_enemy_turn_step():
+    """
+    Description:
+        Does the next step of the enemy turn, moving, spawning, or removing the next npmob in the enemy turn queue and setting constants.end_turn_wait_time to how long
+            to wait before the next step, depending on what the user needs to see. Starts enemy combat once all npmobs are done
+    Input:
+        None
+    Output:
+        None
+    """
+    enemy_turn_done = True
+    for enemy in status.npmob_list:
+        if not enemy.turn_done:
+            enemy_turn_done = False
+            break
+    if enemy_turn_done:
+        flags.player_turn = True
+        flags.enemy_combat_phase = True
+        manage_combat()
+    else:
+        current_enemy = status.enemy_turn_queue[0]
+        removed = False
+        spawning = False
+        did_nothing = False
+        moving = False
+        if current_enemy.npmob_type == "native_warriors" and current_enemy.despawning:
+            if current_enemy == status.displayed_mob or not current_enemy.visible():
+                current_enemy.remove_complete()
+                removed = True
+
+        elif (
+            current_enemy.npmob_type == "native_warriors"
+            and current_enemy.creation_turn == constants.turn
+        ):  # if unit just created
+            spawn_cell = current_enemy.grids[0].find_cell(
+                current_enemy.x, current_enemy.y
+            )
+            if (status.minimap_grid.center_x, status.minimap_grid.center_y) == (
+                current_enemy.x,
+                current_enemy.y,
+            ) and spawn_cell.visible:  # if camera just moved to spawn location to show spawning
+                spawning = True
+                current_enemy.show_images()
+                current_enemy.select()
+                current_enemy.attack_on_spawn()
+                current_enemy.turn_done = True
+            else:  # if camera did not move to spawn location
+                spawning = True
+                if (
+                    spawn_cell.visible
+                ):  # if spawn location visible but camera hasn't moved there yet, move camera there
+                    status.minimap_grid.calibrate(current_enemy.x, current_enemy.y)
+                else:  # if spawn location not visible, end turn
+                    current_enemy.show_images()
+                    current_enemy.turn_done = True
+
+        elif (
+            not current_enemy.visible()
+        ):  # if not just spawned and hidden, do action without displaying
+            current_enemy.end_turn_move()
+            moving = True
+
+        elif (
+            current_enemy == status.displayed_mob
+        ):  # if enemy is selected and did not just spawn, move it while minimap follows
+            if (
+                not current_enemy.creation_turn == constants.turn
+            ):  # don't do anything on first turn, but still move camera to spawn location if visible
+                current_enemy.end_turn_move()  # do_turn()
+                moving = True
+                if current_enemy.visible():
+                    if current_enemy != status.displayed_mob:
+                        current_enemy.select()
+                    else:
+                        status.minimap_grid.calibrate(current_enemy.x, current_enemy.y)
+            else:
+                current_enemy.turn_done = True
+
+        if (
+            (not (removed or spawning))
+            and (not current_enemy.creation_turn == constants.turn)
+            and current_enemy.visible()
+        ):  # if unit visible and not selected, start its turn
+            if (
+                current_enemy.npmob_type == "native_warriors"
+                and current_enemy.find_closest_target() == "none"
+                and not current_enemy.despawning
+            ):  # if native warriors have no target, they stand still and no movement is shown
+                did_nothing = True
+                current_enemy.turn_done = True
+
+            elif (
+                current_enemy.npmob_type == "beast"
+                and current_enemy.find_closest_target
+                == current_enemy.images[0].current_cell
+                and not current_enemy.images[0].current_cell.has_pmob()
+            ):
+                # if beasts stand still and don't attack anything, no movement is shown
+                did_nothing = True
+                current_enemy.turn_done = True
+            elif (
+                current_enemy.visible()
+            ):  # if unit will do an action, move the camera to it and select it
+                current_enemy.select()
+
+        elif (
+            current_enemy.creation_turn == constants.turn and not spawning
+        ):  # if enemy visible but just spawned, end turn
+            did_nothing = True
+            current_enemy.turn_done = True
+
+        if removed:  # show unit despawning if visible
+            current_enemy.turn_done = True
+            if not current_enemy.visible():
+                constants.end_turn_wait_time = 0
+            else:
+                constants.end_turn_wait_time = 1
+            status.enemy_turn_queue.pop(0)
+
+        else:  # If unit visible, have short delay depending on action taken to let user see it
+            if (not spawning) and (
+                did_nothing or not current_enemy.visible()
+            ):  # do not wait if not visible or nothing to show, exception for spawning units, which may not be visible as user watches them spawn
+                constants.end_turn_wait_time = 0
+            elif (
+                spawning
+                and not current_enemy.grids[0]
+                .find_cell(current_enemy.x, current_enemy.y)
+                .visible
+            ):  # do not wait if spawning unit won't be visible even after it spawns
+                constants.end_turn_wait_time = 0
+            elif moving and not enemy.turn_done:  # if will move again after this
+                constants.end_turn_wait_time = 0.25
+            else:  # if done with turn
+                constants.end_turn_wait_time = 0.5
+
+            if current_enemy.turn_done:
+                status.enemy_turn_queue.pop(0)
+
+
+def enemy_turn_step_hidden(current_enemy):
+    """
+    Description:
+        Returns whether the inputted npmob's next enemy turn step would not be shown to the player - whether it is despawning, spawning, or moving somewhere the
+            player can not see, matching the cases in which manage_enemy_turn_step does not wait before the next step
+    Input:
+        npmob current_enemy: Npmob at the front of the enemy turn queue
+    Output:
+        boolean: Returns whether the inputted npmob's next enemy turn step would not be shown to the player
+    """
+    if (
+        current_enemy.npmob_type == "native_warriors"
+        and not current_enemy.despawning
+        and current_enemy.creation_turn == constants.turn
+    ):  # spawning warriors are only hidden if their spawn location is not visible
+        return (
+            not current_enemy.grids[0]
+            .find_cell(current_enemy.x, current_enemy.y)
+            .visible
+        )
+    return not current_enemy.visible()
+
+
+def manage_hidden_enemy_turn_steps():
+    """
+    Description:
+        Does each enemy turn step that would not be shown to the player in one loop, rather than one per frame, stopping once the npmob at the front of the enemy
+            turn queue needs to be shown or an npmob becomes visible while moving. Npmobs that are not visible are moved, queue combat, and damage buildings
+            exactly as in manage_enemy_turn_step
+    Input:
+        None
+    Output:
+        int: Returns the number of enemy turn steps done
+    """
+    num_steps = 0
+    while (
+        not flags.player_turn
+        and status.enemy_turn_queue
+        and enemy_turn_step_hidden(status.enemy_turn_queue[0])
+    ):
+        manage_enemy_turn_step()
+        num_steps += 1
+        if (
+            constants.end_turn_wait_time > 0
+        ):  # if an npmob became visible while moving, let the player see it before continuing
+            break
+    return num_steps
+
+
 def manage_combat():
     """
     Description:
@@ -0,0 +1,78 @@
+# Functions and synthetic colony presets shared by the benchmark scripts
+# Imported by the benchmarks rather than run directly, and does not import the game, allowing each benchmark to set up the game in its own order
+
+import statistics
+import subprocess
+
+PRESETS = {
+    "small": {
+        "pmobs": 10,
+        "buildings": 5,
+        "villages": 10,
+        "npmobs": 5,
+        "map_width": 15,
+        "map_height": 16,
+    },
+    "large": {
+        "pmobs": 100,
+        "buildings": 50,
+        "villages": 40,
+        "npmobs": 30,
+        "map_width": 30,
+        "map_height": 32,
+    },
+    "huge": {
+        "pmobs": 400,
+        "buildings": 200,
+        "villages": 120,
+        "npmobs": 100,
+        "map_width": 60,
+        "map_height": 64,
+    },
+}
+
+
+def summarize(times):
+    """
+    Description:
+        Returns the distribution of the inputted times, in milliseconds
+    Input:
+        float list times: Times in seconds, like of frames or turns
+    Output:
+        dictionary: Returns dictionary with the number of times and their mean, minimum, percentiles, and maximum in milliseconds
+    """
+    if not times:
+        return {"count": 0}
+    sorted_times = sorted(times)
+    summary = {
+        "count": len(sorted_times),
+        "mean_ms": round(statistics.mean(sorted_times) * 1000, 4),
+        "min_ms": round(sorted_times[0] * 1000, 4),
+    }
+    for percentile in (50, 95, 99):
+        summary["p" + str(percentile) + "_ms"] = round(
+            sorted_times[
+                min(len(sorted_times) - 1, (len(sorted_times) * percentile) // 100)
+            ]
+            * 1000,
+            4,
+        )
+    summary["max_ms"] = round(sorted_times[-1] * 1000, 4)
+    return summary
+
+
+def get_version():
+    """
+    Description:
+        Returns the current git commit, allowing results to be matched to the version that produced them
+    Input:
+        None
+    Output:
+        string: Returns the current git commit hash, or 'unknown' if it could not be found
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
@@ -0,0 +1,206 @@
+# Checks that presenting only the areas returned by drawing_utility.get_dirty_rects shows the same screen as presenting the whole frame
+# Run from the project folder with python scripts/dirty_rect_check.py [--frames N] [--seed S]
+#   Draws frames of random overlapping rectangles that appear, disappear, change, and switch order, and exits with an error code if any presented screen differs
+#   from the fully drawn frame
+
+import os
+import sys
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+import modules.constants.status as status
+from modules.util import drawing_utility
+
+SCREEN_SIZE = (200, 150)
+
+
+def draw_frame(records):
+    """
+    Description:
+        Returns a screen with the inputted draws done in order, each draw filling its area with a color found from its signature
+    Input:
+        tuple list records: List of (signature, (x, y, width, height)) draw records
+    Output:
+        pygame.Surface: Returns the drawn screen
+    """
+    screen = pygame.Surface(SCREEN_SIZE)
+    for signature, area in records:
+        screen.fill(
+            (
+                (signature * 67) % 256,
+                (signature * 131) % 256,
+                (signature * 197) % 256,
+            ),
+            area,
+        )
+    return screen
+
+
+def find_dirty_rects(current_records, previous_records):
+    """
+    Description:
+        Returns the areas that get_dirty_rects would present after a frame with the inputted draws follows a frame with the inputted previous draws
+    Input:
+        tuple list current_records: Draw records of the current frame
+        tuple list previous_records: Draw records of the previous frame
+    Output:
+        pygame.Rect list: Returns the areas to present
+    """
+    status.frame_draw_records = current_records
+    status.previous_frame_draw_records = previous_records
+    return drawing_utility.get_dirty_rects()
+
+
+def presents_correctly(current_records, previous_records):
+    """
+    Description:
+        Returns whether presenting only the dirty areas of the inputted current frame over the inputted previous frame shows the same screen as the current frame
+    Input:
+        tuple list current_records: Draw records of the current frame
+        tuple list previous_records: Draw records of the previous frame
+    Output:
+        boolean: Returns whether the presented screen matches the current frame
+    """
+    presented_screen = draw_frame(previous_records)
+    current_screen = draw_frame(current_records)
+    for dirty_rect in find_dirty_rects(current_records, previous_records):
+        presented_screen.blit(current_screen, dirty_rect, dirty_rect)
+    return pygame.image.tobytes(presented_screen, "RGB") == pygame.image.tobytes(
+        current_screen, "RGB"
+    )
+
+
+def random_record(num_signatures):
+    """
+    Description:
+        Returns a draw record with a random signature and area
+    Input:
+        int num_signatures: Number of possible signatures, with fewer causing more identical draws
+    Output:
+        tuple: Returns the draw record
+    """
+    x = random.randrange(SCREEN_SIZE[0] - 10)
+    y = random.randrange(SCREEN_SIZE[1] - 10)
+    return (
+        random.randrange(1, num_signatures + 1),
+        (
+            x,
+            y,
+            random.randrange(1, SCREEN_SIZE[0] - x),
+            random.randrange(1, SCREEN_SIZE[1] - y),
+        ),
+    )
+
+
+def change_records(records, num_signatures):
+    """
+    Description:
+        Returns a copy of the inputted draw records with random draws added, removed, replaced, and moved to other positions in the order
+    Input:
+        tuple list records: Draw records to change
+        int num_signatures: Number of possible signatures of added draws
+    Output:
+        tuple list: Returns the changed draw records
+    """
+    changed_records = list(records)
+    for _ in range(random.randrange(4)):
+        change_type = random.randrange(4)
+        if change_type == 0 or len(changed_records) < 3:
+            changed_records.insert(
+                random.randrange(len(changed_records) + 1),
+                random_record(num_signatures),
+            )
+        elif change_type == 1:
+            changed_records.pop(random.randrange(len(changed_records)))
+        elif change_type == 2:
+            changed_records[random.randrange(len(changed_records))] = random_record(
+                num_signatures
+            )
+        else:
+            changed_records.insert(
+                random.randrange(len(changed_records)),
+                changed_records.pop(random.randrange(len(changed_records))),
+            )
+    return changed_records
+
+
+def main():
+    """
+    Description:
+        Checks known cases and random frames, printing each failure and exiting with an error code if any frame is presented incorrectly
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    constants.game_display = pygame.Surface(SCREEN_SIZE)
+
+    background = (1, (0, 0) + SCREEN_SIZE)
+    first_mob = (2, (10, 10, 50, 50))
+    second_mob = (3, (10, 10, 50, 50))
+    mouse = (4, (150, 100, 10, 10))
+    known_cases = {
+        "unchanged": (
+            [background, first_mob, second_mob, mouse],
+            [background, first_mob, second_mob, mouse],
+        ),
+        "reordered": (
+            [background, second_mob, first_mob, mouse],
+            [background, first_mob, second_mob, mouse],
+        ),
+        "reordered with a label change": (
+            [background, second_mob, first_mob, (6, (100, 20, 40, 10)), mouse],
+            [background, first_mob, second_mob, (5, (100, 20, 40, 10)), mouse],
+        ),
+    }
+    failures = 0
+    for case_name, (current_records, previous_records) in known_cases.items():
+        if not presents_correctly(current_records, previous_records):
+            print("Presented incorrectly: " + case_name)
+            failures += 1
+    if find_dirty_rects(*known_cases["unchanged"]):
+        print("Presented an unchanged frame")
+        failures += 1
+
+    for num_signatures in (3, 20):
+        previous_records = [background] + [
+            random_record(num_signatures) for _ in range(8)
+        ]
+        for frame_index in range(args.frames):
+            current_records = change_records(previous_records, num_signatures)
+            if not presents_correctly(current_records, previous_records):
+                print(
+                    "Presented incorrectly: frame "
+                    + str(frame_index)
+                    + " of random frames with "
+                    + str(num_signatures)
+                    + " signatures"
+                )
+                failures += 1
+            previous_records = current_records
+
+    pygame.quit()
+    print(
+        str(failures)
+        + " failures in "
+        + str(len(known_cases) + 2 * args.frames)
+        + " frames"
+    )
+    if failures > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
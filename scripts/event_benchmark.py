@@ -0,0 +1,203 @@
+# Times the event manager with thousands of pending events, printing the results as JSON that can be compared between versions
+# Run from the project folder with python scripts/event_benchmark.py [--events N] [--repeating N] [--frames K] [--cancel-fraction F] [--seed S] [--output FILE]
+#   Also checks that the events activate at the same times and in the same order as a manager that checks every event each frame, like the original
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modules.constants.constants as constants  # imported first to avoid a circular import with the managers it creates
+from modules.tools.data_managers.event_manager_template import event_manager_template
+from benchmark_utility import summarize, get_version
+
+FRAME_TIME = 1 / 60
+
+
+class linear_event_manager:
+    """
+    Event manager that subtracts the elapsed time from every pending event each update, like the original event manager - used to check the activation order
+        of the heap-based event manager
+    """
+
+    def __init__(self):
+        """
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        """
+        self.event_list = []
+        self.previous_time = 0.0
+
+    def add_event(self, function, inputs, activation_time, num_repeats=0):
+        """
+        Description:
+            Adds an event that calls the inputted function with inputs after the inputted time has elapsed, repeating the inputted number of times
+        Input:
+            function function: Function to call
+            list inputs: List of inputs the function will be called with, in order
+            double activation_time: Amount of time that will pass before the function is called
+            int num_repeats=0: Number of times to repeat the event, or -1 if it repeats infinitely
+        Output:
+            None
+        """
+        self.event_list.append(
+            [function, inputs, activation_time, activation_time, num_repeats]
+        )
+
+    def update(self, new_time):
+        """
+        Description:
+            Updates events with the current time, activating any that run out of time
+        Input:
+            double new_time: New time to update this object with
+        Output:
+            None
+        """
+        time_difference = new_time - self.previous_time
+        activated_events = []
+        for current_event in self.event_list:
+            current_event[2] -= time_difference
+            if current_event[2] <= 0:
+                activated_events.append(current_event)
+        for current_event in activated_events:
+            function, inputs, remaining_time, original_time, num_repeats = current_event
+            function(*inputs)
+            if num_repeats != 0:
+                if num_repeats != -1:
+                    num_repeats -= 1
+                if num_repeats > 0 or num_repeats == -1:
+                    self.add_event(function, inputs, original_time, num_repeats)
+            self.event_list.remove(current_event)
+        self.previous_time = new_time
+
+
+def run_frames(manager, num_frames):
+    """
+    Description:
+        Updates the inputted manager once per simulated frame, returning how long each update took
+    Input:
+        object manager: Event manager to update
+        int num_frames: Number of frames to simulate
+    Output:
+        float list: Returns the time in seconds taken by each update
+    """
+    update_times = []
+    for frame in range(1, num_frames + 1):
+        start_time = time.perf_counter()
+        manager.update(frame * FRAME_TIME)
+        update_times.append(time.perf_counter() - start_time)
+    return update_times
+
+
+def main():
+    """
+    Description:
+        Fills event managers with randomly timed events, printing or saving the time taken by each update and whether the heap-based manager activates events in
+            the same order as the linear manager
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--repeating", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--cancel-fraction", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    # Activation times are offset by half a frame so that no event is due exactly at the end of a frame, where rounding could differ between the managers
+    event_times = [
+        (random.randrange(args.frames * 2) + 0.5) * FRAME_TIME
+        for _ in range(args.events)
+    ]
+    repeating_times = [
+        (random.randrange(args.frames // 4) + 0.5) * FRAME_TIME
+        for _ in range(args.repeating)
+    ]
+    repeat_counts = [random.choice([-1, 2, 5]) for _ in range(args.repeating)]
+
+    heap_manager = event_manager_template()
+    heap_activations = []
+    start_time = time.perf_counter()
+    for index, activation_time in enumerate(event_times):
+        heap_manager.add_event(heap_activations.append, [index], activation_time)
+    for index, activation_time in enumerate(repeating_times):
+        heap_manager.add_repeating_event(
+            heap_activations.append,
+            [args.events + index],
+            activation_time,
+            num_repeats=repeat_counts[index],
+        )
+    add_time = time.perf_counter() - start_time
+    heap_update_times = run_frames(heap_manager, args.frames)
+
+    linear_manager = linear_event_manager()
+    linear_activations = []
+    for index, activation_time in enumerate(event_times):
+        linear_manager.add_event(linear_activations.append, [index], activation_time)
+    for index, activation_time in enumerate(repeating_times):
+        linear_manager.add_event(
+            linear_activations.append,
+            [args.events + index],
+            activation_time,
+            num_repeats=repeat_counts[index],
+        )
+    linear_update_times = run_frames(linear_manager, args.frames)
+
+    cancel_manager = event_manager_template()
+    for index, activation_time in enumerate(event_times):
+        cancel_manager.add_event(lambda: None, [], activation_time)
+    cancelled_events = random.sample(
+        sorted(cancel_manager.pending_events, key=lambda event: event.sequence_number),
+        int(args.events * args.cancel_fraction),
+    )
+    start_time = time.perf_counter()
+    for current_event in cancelled_events:
+        current_event.remove()
+    cancel_time = time.perf_counter() - start_time
+    cancel_update_times = run_frames(cancel_manager, args.frames)
+
+    results = {
+        "version": get_version(),
+        "seed": args.seed,
+        "events": args.events,
+        "repeating_events": args.repeating,
+        "frames": args.frames,
+        "add_ms": round(add_time * 1000, 4),
+        "cancel_ms": round(cancel_time * 1000, 4),
+        "cancelled_events": len(cancelled_events),
+        "activations": len(heap_activations),
+        "matches_linear_manager": heap_activations == linear_activations,
+        "update": summarize(heap_update_times),
+        "update_after_cancelling": summarize(cancel_update_times),
+        "linear_update": summarize(linear_update_times),
+        "mean_update_speedup": round(
+            statistics.mean(linear_update_times) / statistics.mean(heap_update_times),
+            2,
+        ),
+    }
+    encoded_results = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(encoded_results)
+    print(encoded_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Compares the speed and output of drawing_utility.replace_colors against the original per-pixel green screen replacement
+# Run from the project folder with python scripts/green_screen_benchmark.py [image folder] [maximum number of images]
+#   Exits with an error code if any image's output differs between the two versions
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+from modules.util import drawing_utility
+
+
+def legacy_replace_colors(image, color_replacements):
+    """
+    Description:
+        Original version of green screen replacement, checking and setting each pixel individually
+    Input:
+        pygame.Surface image: Image to modify
+        tuple list color_replacements: List of (original, replacement) tuples, with each original and replacement being an RGB color like (255, 0, 0)
+    Output:
+        None
+    """
+    width, height = image.get_size()
+    for current_green_screen_color, replace_with in color_replacements:
+        for x in range(width):
+            for y in range(height):
+                current_color = image.get_at((x, y))
+                if (
+                    current_color[0] == current_green_screen_color[0]
+                    and current_color[1] == current_green_screen_color[1]
+                    and current_color[2] == current_green_screen_color[2]
+                ):
+                    image.set_at(
+                        (x, y),
+                        (
+                            replace_with[0],
+                            replace_with[1],
+                            replace_with[2],
+                            current_color[3],
+                        ),
+                    )  # preserves alpha value
+
+
+def main():
+    """
+    Description:
+        Runs both versions of green screen replacement on each image in the inputted folder, printing the time taken by each and any images with differing output
+    Input:
+        None
+    Output:
+        int: Returns 0 if all outputs matched, otherwise 1
+    """
+    image_folder = "graphics/mobs"
+    max_images = 100
+    if len(sys.argv) > 1:
+        image_folder = sys.argv[1]
+    if len(sys.argv) > 2:
+        max_images = int(sys.argv[2])
+
+    color_replacements = list(
+        zip(
+            constants.green_screen_colors,
+            [(255, 0, 0), (0, 0, 255), (255, 255, 0)],
+        )
+    )
+    image_paths = []
+    for folder, subfolders, files in os.walk(image_folder):
+        for file in sorted(files):
+            if file.endswith(".png"):
+                image_paths.append(os.path.join(folder, file))
+    image_paths = image_paths[:max_images]
+
+    legacy_time = 0.0
+    vectorized_time = 0.0
+    mismatches = []
+    for image_path in image_paths:
+        legacy_image = pygame.image.load(image_path)
+        vectorized_image = legacy_image.copy()
+
+        start_time = time.perf_counter()
+        legacy_replace_colors(legacy_image, color_replacements)
+        legacy_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        drawing_utility.replace_colors(vectorized_image, color_replacements)
+        vectorized_time += time.perf_counter() - start_time
+
+        if pygame.image.tobytes(legacy_image, "RGBA") != pygame.image.tobytes(
+            vectorized_image, "RGBA"
+        ):
+            mismatches.append(image_path)
+
+    print("Images compared: " + str(len(image_paths)))
+    print("Per-pixel time: " + str(round(legacy_time, 3)) + " seconds")
+    print("replace_colors time: " + str(round(vectorized_time, 3)) + " seconds")
+    if vectorized_time > 0:
+        print("Speedup: " + str(round(legacy_time / vectorized_time, 1)) + "x")
+    for image_path in mismatches:
+        print("Output differs: " + image_path)
+    if mismatches:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
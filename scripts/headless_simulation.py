@@ -0,0 +1,133 @@
+# Runs the game without a display or user input, simulating a number of turns from a new game or save file
+# Run from the project folder with python scripts/headless_simulation.py [--turns N] [--seed S] [--save FILE] [--country NAME] [--memory]
+#   --save loads a file from the save_games folder instead of creating a new game, and --memory reports traced memory use after each turn
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from modules.setup import *
+import modules.constants.constants as constants
+from modules.util import simulation_utility
+
+
+def setup_headless():
+    """
+    Description:
+        Runs the same setup as a normal launch of the game, without starting the main loop. Achievements are disabled so that simulated games do not unlock the
+            player's achievements or write to the save_games folder
+    Input:
+        None
+    Output:
+        None
+    """
+    constants.effect_manager.set_effect("disable_achievements", True)
+    setup(
+        misc,
+        worker_types_config,
+        equipment_types_config,
+        terrain_feature_types_config,
+        terrains,
+        commodities,
+        def_ministers,
+        def_countries,
+        new_game_setup_screen,
+        info_displays,
+        transactions,
+        actions,
+        lore,
+        value_trackers,
+        buttons,
+        europe_screen,
+        ministers_screen,
+        trial_screen,
+        mob_interface,
+        tile_interface,
+        unit_organization_interface,
+        settlement_interface,
+        inventory_interface,
+        minister_interface,
+        country_interface,
+    )
+
+
+def main():
+    """
+    Description:
+        Simulates the requested number of turns, printing the time taken and game state after each turn
+    Input:
+        None
+    Output:
+        int: Returns 0 if all requested turns were simulated, otherwise 1
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--country", default="Britain")
+    parser.add_argument("--memory", action="store_true")
+    args = parser.parse_args()
+
+    if args.memory:
+        tracemalloc.start()
+    setup_headless()
+    start_time = time.perf_counter()
+    simulation_utility.start_simulation(args.seed, args.save, args.country)
+    print("Game started in " + str(round(time.perf_counter() - start_time, 3)) + "s")
+
+    turn_start_time = time.perf_counter()
+
+    def report_turn(turn_index):
+        nonlocal turn_start_time
+        current_time = time.perf_counter()
+        report = (
+            "Turn "
+            + str(constants.turn)
+            + ": "
+            + str(round(current_time - turn_start_time, 3))
+            + "s, "
+            + str(len(status.pmob_list))
+            + " pmobs, "
+            + str(len(status.npmob_list))
+            + " npmobs, "
+            + str(len(status.building_list))
+            + " buildings, money "
+            + str(constants.money)
+        )
+        if args.memory:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            report += (
+                ", memory "
+                + str(round(current_memory / 1048576, 1))
+                + " MB (peak "
+                + str(round(peak_memory / 1048576, 1))
+                + " MB)"
+            )
+        print(report)
+        turn_start_time = time.perf_counter()
+
+    num_turns = simulation_utility.simulate_turns(args.turns, report_turn)
+    print(
+        "Simulated "
+        + str(num_turns)
+        + " turns in "
+        + str(round(time.perf_counter() - start_time, 3))
+        + "s"
+    )
+    pygame.quit()
+    if num_turns < args.turns:
+        print("Game ended early")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# Times mobs' movement cost lookups on a synthetic colony, printing the results as JSON that can be compared between versions
+# Run from the project folder with python scripts/movement_cost_benchmark.py [--preset NAME] [--pmobs N] [--buildings N] [--villages N] [--npmobs N]
+#   [--map-width N] [--map-height N] [--turns N] [--lookups N] [--changes N] [--seed S] [--output FILE]
+#   Also checks that each lookup returns the same cost as finding it from the cells' terrain, visibility, and infrastructure each time, like the original, while
+#   simulating turns and randomly changing cells' terrain and visibility between rounds of lookups
+#   scripts/movement_cost_check.py checks the costs more thoroughly, with random movement profiles and infrastructure changes
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+import modules.constants.status as status
+from modules.util import simulation_utility
+from headless_simulation import setup_headless
+from benchmark_utility import PRESETS, summarize, get_version
+from movement_cost_check import (
+    DIRECTION_CHANGES,
+    find_movement_cost_directly,
+    change_random_cells,
+    get_lookup_mobs,
+)
+
+
+def main():
+    """
+    Description:
+        Creates a synthetic colony and, after each simulated turn, times movement cost lookups for random mobs and directions using the movement cost table and
+            finding the costs directly, printing or saving the times and number of differing results as JSON
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--preset", choices=PRESETS.keys(), default="large")
+    parser.add_argument("--pmobs", type=int)
+    parser.add_argument("--buildings", type=int)
+    parser.add_argument("--villages", type=int)
+    parser.add_argument("--npmobs", type=int)
+    parser.add_argument("--map-width", type=int)
+    parser.add_argument("--map-height", type=int)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--changes", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    scenario = dict(PRESETS[args.preset])
+    for key in scenario:
+        if getattr(args, key) != None:
+            scenario[key] = getattr(args, key)
+
+    constants.strategic_map_width = scenario["map_width"]
+    constants.strategic_map_height = scenario["map_height"]
+    setup_headless()
+    simulation_utility.start_simulation(seed=args.seed)
+    constants.money_tracker.set(
+        1000000
+    )  # prevents bankruptcy from upkeep of large colonies
+    simulation_utility.create_synthetic_colony(
+        scenario["pmobs"],
+        scenario["buildings"],
+        scenario["villages"],
+        scenario["npmobs"],
+    )
+
+    table_times = []
+    direct_times = []
+    num_lookups = 0
+    mismatches = 0
+    num_turns = 0
+    for round_index in range(args.turns + 1):
+        if round_index > 0:
+            num_turns += simulation_utility.simulate_turns(1)
+            change_random_cells(args.changes)
+        mob_list = get_lookup_mobs()
+        if not mob_list:
+            continue
+        lookups = [
+            (random.choice(mob_list), random.choice(DIRECTION_CHANGES))
+            for _ in range(args.lookups)
+        ]
+        start_time = time.perf_counter()
+        table_costs = [
+            current_mob.get_movement_cost(x_change, y_change)
+            for current_mob, (x_change, y_change) in lookups
+        ]
+        table_times.append(time.perf_counter() - start_time)
+        start_time = time.perf_counter()
+        direct_costs = [
+            find_movement_cost_directly(current_mob, x_change, y_change)
+            for current_mob, (x_change, y_change) in lookups
+        ]
+        direct_times.append(time.perf_counter() - start_time)
+        num_lookups += len(lookups)
+        for table_cost, direct_cost in zip(table_costs, direct_costs):
+            if table_cost != direct_cost or type(table_cost) != type(direct_cost):
+                mismatches += 1
+
+    results = {
+        "version": get_version(),
+        "preset": args.preset,
+        "scenario": scenario,
+        "seed": args.seed,
+        "turns_requested": args.turns,
+        "turns_simulated": num_turns,
+        "lookups": num_lookups,
+        "mismatches": mismatches,
+        "table": str(status.movement_cost_table),
+        "table_round": summarize(table_times),
+        "direct_round": summarize(direct_times),
+        "mean_round_speedup": (
+            round(statistics.mean(direct_times) / statistics.mean(table_times), 2)
+            if table_times
+            else None
+        ),
+    }
+    pygame.quit()
+    encoded_results = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(encoded_results)
+    print(encoded_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+# Checks that mob.get_movement_cost, which uses costs recorded by cells, returns the same costs as finding them from the cells' terrain, visibility, and
+#   infrastructure each time, like the original
+# Run from the project folder with python scripts/movement_cost_check.py [--maps N] [--rounds N] [--steps N] [--lookups N] [--changes N] [--seed S]
+#   Each map is a new game with a random size, and each round simulates a turn and then repeatedly makes random changes to cells' terrain, visibility, and
+#   infrastructure before checking lookups of random mobs, directions, and movement profiles. Exits with an error code if any cost differs in value or type
+
+import os
+import sys
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+import modules.constants.status as status
+from modules.actor_types.mobs import mob
+from modules.util import simulation_utility, game_transitions
+from headless_simulation import setup_headless
+
+DIRECTION_CHANGES = [(0, 0), (-1, 0), (1, 0), (0, 1), (0, -1)]
+PROFILE_VALUES = {
+    "can_swim_river": [False, True],
+    "can_walk": [False, True],
+    "can_explore": [False, True],
+    "can_swim_ocean": [False, True],
+    "movement_cost": [1, 2],
+    "max_movement_points": [1, 4, 6, 10, 16],
+}
+
+
+def find_movement_cost_directly(current_mob, x_change, y_change):
+    """
+    Description:
+        Returns the cost in movement points for the inputted mob to move by the inputted amounts, found from the cells' terrain, visibility, and infrastructure like
+            the original get_movement_cost
+    Input:
+        mob current_mob: Mob that would move
+        int x_change: How many cells would be moved to the right in the hypothetical movement
+        int y_change: How many cells would be moved upward in the hypothetical movement
+    Output:
+        double: How many movement points would be spent by moving by the inputted amount
+    """
+    cost = current_mob.movement_cost
+    if not (current_mob.is_npmob and not current_mob.visible()):
+        local_cell = current_mob.images[0].current_cell
+    else:
+        local_cell = current_mob.grids[0].find_cell(current_mob.x, current_mob.y)
+
+    direction = "none"
+    if x_change < 0:
+        direction = "left"
+    elif x_change > 0:
+        direction = "right"
+    elif y_change > 0:
+        direction = "up"
+    elif y_change < 0:
+        direction = "down"
+
+    if direction == "none":
+        adjacent_cell = local_cell
+    else:
+        adjacent_cell = local_cell.adjacent_cells[direction]
+
+    if adjacent_cell:
+        cost = cost * constants.terrain_movement_cost_dict[adjacent_cell.terrain]
+        if current_mob.is_pmob:
+            local_infrastructure = local_cell.get_intact_building("infrastructure")
+            adjacent_infrastructure = adjacent_cell.get_intact_building(
+                "infrastructure"
+            )
+            if local_cell.has_walking_connection(adjacent_cell):
+                if not (
+                    local_infrastructure == "none" or adjacent_infrastructure == "none"
+                ):
+                    if not (
+                        adjacent_infrastructure != "none"
+                        and adjacent_infrastructure.infrastructure_type == "ferry"
+                    ):
+                        cost = cost / 2
+                if (
+                    adjacent_infrastructure != "none"
+                    and adjacent_infrastructure.infrastructure_type == "ferry"
+                    and not current_mob.can_swim_river
+                ):
+                    cost = 2
+            elif (
+                adjacent_cell.terrain == "water"
+                and adjacent_cell.y > 0
+                and (current_mob.can_walk and not current_mob.can_swim_river)
+                or adjacent_cell.terrain_features.get("cataract", False)
+            ):
+                cost = current_mob.max_movement_points
+            if (not adjacent_cell.visible) and current_mob.can_explore:
+                cost = current_mob.movement_cost
+        if local_cell.y == 0 and not current_mob.can_swim_ocean:
+            cost = current_mob.max_movement_points
+    return cost
+
+
+def change_infrastructure(current_cell):
+    """
+    Description:
+        Removes the inputted cell's infrastructure, or builds a road or railroad on land or a bridge or ferry on a river if it has none - infrastructure can not be
+            damaged
+    Input:
+        cell current_cell: Cell to change
+    Output:
+        None
+    """
+    infrastructure = current_cell.get_building("infrastructure")
+    if infrastructure != "none":
+        infrastructure.remove_complete()
+        return
+    if current_cell.terrain == "water":
+        infrastructure_type = random.choice(["road_bridge", "railroad_bridge", "ferry"])
+    else:
+        infrastructure_type = random.choice(["road", "railroad"])
+    constants.actor_creation_manager.create(
+        False,
+        {
+            "coordinates": (current_cell.x, current_cell.y),
+            "grids": [status.strategic_map_grid, status.strategic_map_grid.mini_grid],
+            "name": infrastructure_type.replace("_", " "),
+            "modes": status.strategic_map_grid.modes,
+            "init_type": "infrastructure",
+            "image": "buildings/infrastructure/road.png",
+            "infrastructure_type": infrastructure_type,
+        },
+    )
+
+
+def change_random_cells(num_changes, change_buildings=False):
+    """
+    Description:
+        Makes the inputted number of random changes to strategic map cells, each changing the visibility of cells, the terrain of land cells to another land
+            terrain, or the cells' infrastructure, avoiding units being left on terrain they can not enter. Half of the changes are made to a mob's cell and an
+            adjacent cell together, as only the costs of moving near mobs are recorded and roads only change costs when both cells have them
+    Input:
+        int num_changes: Number of changes to make
+        boolean change_buildings=False: Whether to also change cells' infrastructure
+    Output:
+        None
+    """
+    cell_list = [
+        current_cell
+        for current_cell in status.strategic_map_grid.get_flat_cell_list()
+        if current_cell.y > 0
+    ]
+    mob_cell_list = [
+        status.strategic_map_grid.find_cell(current_mob.x, current_mob.y)
+        for current_mob in get_lookup_mobs()
+        if current_mob.y > 0
+    ]
+    land_terrains = [
+        terrain
+        for terrain in constants.terrain_movement_cost_dict
+        if terrain != "water"
+    ]
+    for _ in range(num_changes):
+        if mob_cell_list and random.randrange(2) == 0:
+            local_cell = random.choice(mob_cell_list)
+            changed_cells = [local_cell] + [
+                random.choice(
+                    [
+                        adjacent_cell
+                        for adjacent_cell in local_cell.adjacent_cells.values()
+                        if adjacent_cell and adjacent_cell.y > 0
+                    ]
+                    or [local_cell]
+                )
+            ]
+        else:
+            changed_cells = [random.choice(cell_list)]
+        change_type = random.randrange(3 if change_buildings else 2)
+        for current_cell in changed_cells:
+            if change_type == 0 and current_cell.terrain in land_terrains:
+                current_cell.set_terrain(
+                    random.choice(land_terrains), terrain_variant=0
+                )
+            elif change_type == 2:
+                change_infrastructure(current_cell)
+            else:
+                current_cell.set_visibility(not current_cell.visible)
+
+
+def get_lookup_mobs():
+    """
+    Description:
+        Returns the mobs on the strategic map whose movement costs are found by mob.get_movement_cost, rather than being constant
+    Input:
+        None
+    Output:
+        mob list: Returns the mobs to check
+    """
+    return [
+        current_mob
+        for current_mob in status.mob_list
+        if type(current_mob).get_movement_cost == mob.get_movement_cost
+        and current_mob.grids[0] == status.strategic_map_grid
+        and not (current_mob.is_pmob and current_mob.images[0].current_cell == "none")
+    ]
+
+
+def check_lookup(current_mob, x_change, y_change, random_profile):
+    """
+    Description:
+        Returns whether the inputted mob's movement cost for the inputted movement matches the cost found directly, optionally giving the mob a random movement
+            profile during the check
+    Input:
+        mob current_mob: Mob to check
+        int x_change: How many cells would be moved to the right
+        int y_change: How many cells would be moved upward
+        boolean random_profile: Whether to give the mob random movement abilities and values during the check
+    Output:
+        boolean: Returns whether the costs match in value and type
+    """
+    original_values = {}
+    if random_profile:
+        for attribute, values in PROFILE_VALUES.items():
+            original_values[attribute] = getattr(current_mob, attribute)
+            setattr(current_mob, attribute, random.choice(values))
+    cost = current_mob.get_movement_cost(x_change, y_change)
+    expected_cost = find_movement_cost_directly(current_mob, x_change, y_change)
+    for attribute, value in original_values.items():
+        setattr(current_mob, attribute, value)
+    return cost == expected_cost and type(cost) == type(expected_cost)
+
+
+def main():
+    """
+    Description:
+        Checks random movement cost lookups on random maps, printing the number of lookups and mismatches and exiting with an error code if any mismatch
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--maps", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--changes", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    num_lookups = 0
+    mismatches = 0
+    for map_index in range(args.maps):
+        random.seed(args.seed + map_index)
+        constants.strategic_map_width = random.randrange(10, 31)
+        constants.strategic_map_height = random.randrange(10, 33)
+        if map_index == 0:
+            setup_headless()
+        else:
+            game_transitions.to_main_menu(override=True)
+        simulation_utility.start_simulation(seed=args.seed + map_index)
+        constants.money_tracker.set(1000000)
+        simulation_utility.create_synthetic_colony(20, 10, 10, 10)
+        for round_index in range(args.rounds):
+            if round_index > 0:
+                simulation_utility.simulate_turns(1)
+            for _ in range(args.steps):
+                change_random_cells(args.changes, change_buildings=True)
+                simulation_utility.dismiss_notifications()
+                mob_list = get_lookup_mobs()
+                for _ in range(args.lookups):
+                    x_change, y_change = random.choice(DIRECTION_CHANGES)
+                    if not check_lookup(
+                        random.choice(mob_list),
+                        x_change,
+                        y_change,
+                        random.randrange(2) == 0,
+                    ):
+                        mismatches += 1
+                    num_lookups += 1
+        print(
+            "Map "
+            + str(map_index)
+            + " ("
+            + str(constants.strategic_map_width)
+            + "x"
+            + str(constants.strategic_map_height)
+            + "): "
+            + str(status.movement_cost_table)
+        )
+
+    pygame.quit()
+    print(str(mismatches) + " mismatches in " + str(num_lookups) + " lookups")
+    if mismatches > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# Renders frames of each game mode and several minimap positions through main_loop_utility.update_display without a visible display, printing frame time
+#   distributions as JSON that can be compared between versions
+# Run from the project folder with python scripts/render_benchmark.py [--frames K] [--save FILE] [--pmobs N] [--npmobs N] [--notifications N] [--reveal]
+#   [--full-redraw] [--seed S] [--output FILE]
+#   --reveal makes every cell of the strategic map visible, and --full-redraw presents the entire screen each frame rather than only changed areas
+
+import os
+import sys
+import json
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+import modules.constants.status as status
+import modules.constants.flags as flags
+from modules.util import (
+    simulation_utility,
+    main_loop_utility,
+    drawing_utility,
+    game_transitions,
+    minister_utility,
+)
+from headless_simulation import setup_headless
+from benchmark_utility import summarize, get_version
+
+WARMUP_FRAMES = 5
+
+
+def render_frames(num_frames, full_redraw):
+    """
+    Description:
+        Renders the inputted number of frames of the current game mode, after a few unmeasured frames to fill caches, and returns how long each took
+    Input:
+        int num_frames: Number of frames to measure
+        boolean full_redraw: Whether to present the entire screen each frame rather than only changed areas
+    Output:
+        float list: Returns the time in seconds taken by each measured frame
+    """
+    flags.loading = False  # skips the loading screen shown after some mode changes
+    frame_times = []
+    for frame_index in range(WARMUP_FRAMES + num_frames):
+        if full_redraw:
+            drawing_utility.request_full_display_update()
+        start_time = time.perf_counter()
+        main_loop_utility.update_display()
+        if frame_index >= WARMUP_FRAMES:
+            frame_times.append(time.perf_counter() - start_time)
+    return frame_times
+
+
+def enter_trial():
+    """
+    Description:
+        Starts a trial of an appointed minister other than the prosecutor, allowing the trial screen to be rendered
+    Input:
+        None
+    Output:
+        boolean: Returns True if a trial was started, otherwise False
+    """
+    prosecution = status.current_ministers.get("Prosecutor", None)
+    if not prosecution:
+        return False
+    for current_minister in status.minister_list:
+        if current_minister.current_position not in ["none", "Prosecutor"]:
+            game_transitions.set_game_mode("trial")
+            minister_utility.trial_setup(current_minister, prosecution)
+            return True
+    return False
+
+
+def main():
+    """
+    Description:
+        Renders frames of each game mode and several minimap positions, printing or saving the frame time distribution of each as JSON
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--pmobs", type=int, default=0)
+    parser.add_argument("--npmobs", type=int, default=0)
+    parser.add_argument("--notifications", type=int, default=0)
+    parser.add_argument("--reveal", action="store_true")
+    parser.add_argument("--full-redraw", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    setup_headless()
+    simulation_utility.start_simulation(seed=args.seed, save_file=args.save)
+    simulation_utility.create_synthetic_colony(
+        num_pmobs=args.pmobs, num_npmobs=args.npmobs
+    )
+    if args.reveal:
+        for current_cell in status.strategic_map_grid.get_flat_cell_list():
+            current_cell.set_visibility(True)
+    for notification_index in range(args.notifications):
+        constants.notification_manager.display_notification(
+            {
+                "message": "Benchmark notification "
+                + str(notification_index + 1)
+                + " /n /nThis notification is shown while frames are rendered."
+            }
+        )
+
+    map_width = status.strategic_map_grid.coordinate_width
+    map_height = status.strategic_map_grid.coordinate_height
+    minimap_centers = [
+        (map_width // 2, map_height // 2),
+        (0, 1),
+        (map_width - 1, map_height - 1),
+        (map_width // 4, (map_height * 3) // 4),
+    ]
+    results = {
+        "version": get_version(),
+        "save": args.save,
+        "seed": args.seed,
+        "pmobs": len(status.pmob_list),
+        "npmobs": len(status.npmob_list),
+        "notifications": args.notifications,
+        "reveal": args.reveal,
+        "full_redraw": args.full_redraw,
+        "scenarios": {},
+    }
+
+    game_transitions.set_game_mode("strategic")
+    for center_x, center_y in minimap_centers:
+        status.minimap_grid.calibrate(center_x, center_y)
+        results["scenarios"][
+            "strategic minimap (" + str(center_x) + ", " + str(center_y) + ")"
+        ] = summarize(render_frames(args.frames, args.full_redraw))
+    for game_mode in ["europe", "ministers"]:
+        game_transitions.set_game_mode(game_mode)
+        results["scenarios"][game_mode] = summarize(
+            render_frames(args.frames, args.full_redraw)
+        )
+    if enter_trial():
+        results["scenarios"]["trial"] = summarize(
+            render_frames(args.frames, args.full_redraw)
+        )
+
+    pygame.quit()
+    encoded_results = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(encoded_results)
+    print(encoded_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Reports the size of the scaled image disk cache for each display resolution, or clears it so that it is rebuilt as images are used
+# Run from the project folder with python scripts/scaled_image_cache.py [--clear]
+
+import os
+import sys
+import shutil
+
+CACHE_FOLDER = "cache/scaled_images"
+
+
+def main():
+    """
+    Description:
+        Prints the number and total size of scaled images saved for each display resolution, deleting them if --clear was given
+    Input:
+        None
+    Output:
+        None
+    """
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if not os.path.exists(CACHE_FOLDER):
+        print("No scaled images saved")
+        return
+    clear = "--clear" in sys.argv
+    total_files = 0
+    total_bytes = 0
+    for resolution in sorted(os.listdir(CACHE_FOLDER)):
+        resolution_folder = os.path.join(CACHE_FOLDER, resolution)
+        num_files = 0
+        num_bytes = 0
+        for file in os.listdir(resolution_folder):
+            num_files += 1
+            num_bytes += os.path.getsize(os.path.join(resolution_folder, file))
+        print(
+            resolution
+            + ": "
+            + str(num_files)
+            + " images, "
+            + str(round(num_bytes / 1048576, 2))
+            + " MB"
+        )
+        total_files += num_files
+        total_bytes += num_bytes
+        if clear:
+            shutil.rmtree(resolution_folder)
+    print(
+        "Total: "
+        + str(total_files)
+        + " images, "
+        + str(round(total_bytes / 1048576, 2))
+        + " MB"
+    )
+    if clear:
+        print("Cleared - scaled images will be saved again as they are used")
+
+
+if __name__ == "__main__":
+    main()
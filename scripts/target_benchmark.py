@@ -0,0 +1,155 @@
+# Times npmobs' closest target searches during simulated enemy turns on a synthetic colony, printing the results as JSON that can be compared between versions
+# Run from the project folder with python scripts/target_benchmark.py [--preset NAME] [--pmobs N] [--buildings N] [--villages N] [--npmobs N] [--map-width N]
+#   [--map-height N] [--turns N] [--seed S] [--output FILE]
+#   Also checks that each search finds the same closest targets, in the same order, as measuring the distance to every pmob and building, like the original
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+import modules.constants.status as status
+from modules.util import simulation_utility, utility
+from modules.tools.data_managers.target_distance_field_template import (
+    target_distance_field_template,
+)
+from headless_simulation import setup_headless
+from benchmark_utility import PRESETS, summarize, get_version
+
+
+def find_closest_targets_linearly(npmob):
+    """
+    Description:
+        Returns each target as close as possible to the inputted npmob by measuring the distance to every pmob and building, like the original find_closest_target
+    Input:
+        npmob npmob: Npmob to find the closest targets of
+    Output:
+        pmob/building list: Returns the closest targets, with buildings before pmobs and each in the order of its list, or an empty list if none are in range
+    """
+    target_list = []
+    for current_building in status.building_list:
+        if current_building.can_damage() and not current_building.damaged:
+            target_list.append(current_building)
+    target_list += status.pmob_list
+    min_distance = -1
+    closest_targets = []
+    for possible_target in target_list:
+        if possible_target.y == 0:
+            continue
+        if possible_target.actor_type != "building" and (
+            possible_target.in_vehicle
+            or possible_target.in_group
+            or possible_target.in_building
+        ):
+            continue
+        distance = utility.find_grid_distance(npmob, possible_target)
+        if distance == -1 or distance > npmob.aggro_distance:
+            continue
+        if min_distance == -1 or distance < min_distance:
+            min_distance = distance
+            closest_targets = [possible_target]
+        elif distance == min_distance:
+            closest_targets.append(possible_target)
+    return closest_targets
+
+
+def main():
+    """
+    Description:
+        Creates a synthetic colony and simulates the requested number of turns, timing each closest target search made by the target distance field and the same
+            search made by measuring the distance to every target, and prints or saves the times and number of differing results as JSON
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--preset", choices=PRESETS.keys(), default="large")
+    parser.add_argument("--pmobs", type=int)
+    parser.add_argument("--buildings", type=int)
+    parser.add_argument("--villages", type=int)
+    parser.add_argument("--npmobs", type=int)
+    parser.add_argument("--map-width", type=int)
+    parser.add_argument("--map-height", type=int)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    scenario = dict(PRESETS[args.preset])
+    for key in scenario:
+        if getattr(args, key) != None:
+            scenario[key] = getattr(args, key)
+
+    constants.strategic_map_width = scenario["map_width"]
+    constants.strategic_map_height = scenario["map_height"]
+    setup_headless()
+    simulation_utility.start_simulation(seed=args.seed)
+    constants.money_tracker.set(
+        1000000
+    )  # prevents bankruptcy from upkeep of large colonies
+    simulation_utility.create_synthetic_colony(
+        scenario["pmobs"],
+        scenario["buildings"],
+        scenario["villages"],
+        scenario["npmobs"],
+    )
+
+    field_times = []
+    linear_times = []
+    mismatches = 0
+    original_get_closest_targets = target_distance_field_template.get_closest_targets
+
+    def checked_get_closest_targets(self, npmob):
+        nonlocal mismatches
+        start_time = time.perf_counter()
+        closest_targets = original_get_closest_targets(self, npmob)
+        field_times.append(time.perf_counter() - start_time)
+        start_time = time.perf_counter()
+        expected_targets = find_closest_targets_linearly(npmob)
+        linear_times.append(time.perf_counter() - start_time)
+        if closest_targets != expected_targets:
+            mismatches += 1
+        return closest_targets
+
+    target_distance_field_template.get_closest_targets = checked_get_closest_targets
+    num_turns = simulation_utility.simulate_turns(args.turns)
+
+    results = {
+        "version": get_version(),
+        "preset": args.preset,
+        "scenario": scenario,
+        "seed": args.seed,
+        "turns_requested": args.turns,
+        "turns_simulated": num_turns,
+        "searches": len(field_times),
+        "mismatches": mismatches,
+        "rebuilds": status.target_distance_field.rebuilds,
+        "updates": status.target_distance_field.updates,
+        "search": summarize(field_times),
+        "linear_search": summarize(linear_times),
+        "mean_search_speedup": (
+            round(statistics.mean(linear_times) / statistics.mean(field_times), 2)
+            if field_times
+            else None
+        ),
+    }
+    pygame.quit()
+    encoded_results = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(encoded_results)
+    print(encoded_results)
+
+
+if __name__ == "__main__":
+    main()
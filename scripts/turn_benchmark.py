@@ -0,0 +1,138 @@
+# Times each step of start_player_turn on synthetic colonies of configurable size, printing the results as JSON that can be compared between versions
+# Run from the project folder with python scripts/turn_benchmark.py [--preset NAME] [--pmobs N] [--buildings N] [--villages N] [--npmobs N] [--map-width N]
+#   [--map-height N] [--turns N] [--seed S] [--output FILE]
+#   Counts given after --preset override the preset's counts
+
+import os
+import sys
+import json
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import modules.constants.constants as constants
+import modules.constants.status as status
+from modules.util import simulation_utility, turn_management_utility
+from headless_simulation import setup_headless
+from benchmark_utility import PRESETS, summarize, get_version
+
+TIMED_STEPS = [
+    "manage_attrition",
+    "manage_production",
+    "manage_villages",
+    "manage_worker_migration",
+    "manage_commodity_sales",
+    "manage_ministers",
+    "start_player_turn",
+]
+
+
+def time_step(step_name, step_times):
+    """
+    Description:
+        Replaces the inputted function of turn_management_utility with a version that records how long each call takes. start_player_turn calls these functions
+            through the module, so it will call the timed versions
+    Input:
+        string step_name: Name of the turn_management_utility function to time, like 'manage_production'
+        dictionary step_times: Dictionary of step name keys and lists of times in seconds, which each call's time is added to
+    Output:
+        None
+    """
+    original_function = getattr(turn_management_utility, step_name)
+
+    def timed_function(*args, **kwargs):
+        start_time = time.perf_counter()
+        return_value = original_function(*args, **kwargs)
+        step_times[step_name].append(time.perf_counter() - start_time)
+        return return_value
+
+    setattr(turn_management_utility, step_name, timed_function)
+
+
+def main():
+    """
+    Description:
+        Creates a synthetic colony, simulates the requested number of turns, and prints or saves the time taken by each timed step and each whole turn as JSON
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--preset", choices=PRESETS.keys(), default="large")
+    parser.add_argument("--pmobs", type=int)
+    parser.add_argument("--buildings", type=int)
+    parser.add_argument("--villages", type=int)
+    parser.add_argument("--npmobs", type=int)
+    parser.add_argument("--map-width", type=int)
+    parser.add_argument("--map-height", type=int)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    scenario = dict(PRESETS[args.preset])
+    for key in scenario:
+        if getattr(args, key) != None:
+            scenario[key] = getattr(args, key)
+
+    constants.strategic_map_width = scenario["map_width"]
+    constants.strategic_map_height = scenario["map_height"]
+    setup_headless()
+    simulation_utility.start_simulation(seed=args.seed)
+    constants.money_tracker.set(
+        1000000
+    )  # prevents bankruptcy from upkeep of large colonies
+    simulation_utility.create_synthetic_colony(
+        scenario["pmobs"],
+        scenario["buildings"],
+        scenario["villages"],
+        scenario["npmobs"],
+    )
+
+    step_times = {step_name: [] for step_name in TIMED_STEPS}
+    for step_name in TIMED_STEPS:
+        time_step(step_name, step_times)
+    turn_times = []
+
+    def record_turn_time(turn_index):
+        nonlocal turn_start_time
+        turn_times.append(time.perf_counter() - turn_start_time)
+        turn_start_time = time.perf_counter()
+
+    turn_start_time = time.perf_counter()
+    num_turns = simulation_utility.simulate_turns(args.turns, record_turn_time)
+
+    results = {
+        "version": get_version(),
+        "preset": args.preset,
+        "scenario": scenario,
+        "seed": args.seed,
+        "turns_requested": args.turns,
+        "turns_simulated": num_turns,
+        "final_counts": {
+            "pmobs": len(status.pmob_list),
+            "npmobs": len(status.npmob_list),
+            "buildings": len(status.building_list),
+            "villages": len(status.village_list),
+        },
+        "steps": {
+            step_name: summarize(step_times[step_name]) for step_name in TIMED_STEPS
+        },
+        "whole_turn": summarize(turn_times),
+    }
+    pygame.quit()
+    encoded_results = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(encoded_results)
+    print(encoded_results)
+
+
+if __name__ == "__main__":
+    main()